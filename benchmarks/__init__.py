@@ -0,0 +1 @@
+"""Reproducible performance measurements for library hot paths."""
@@ -0,0 +1,64 @@
+"""Measure the per-update cost of building bars for several resolutions at once."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from ig_trading_lib.bars import BarAggregator  # noqa: E402
+from ig_trading_lib.streaming import StreamSubscription, _TickLayout  # noqa: E402
+
+UPDATES = 200_000
+FIELDS = ("BID", "OFR", "UTM")
+SUBSCRIPTION = StreamSubscription(
+    key="chart", mode="MERGE", items=("CHART:CS.D.EURUSD.CFD.IP:TICK",), fields=FIELDS
+)
+RESOLUTIONS = (("MINUTE",), ("SECOND", "MINUTE", "MINUTE_5", "HOUR", "DAY"))
+
+
+class Update:
+    """A chart tick four per second apart, so a share of the updates close a bar."""
+
+    def __init__(self, index: int) -> None:
+        bid = 1.08 + (index % 97) * 1e-5
+        self.values = {
+            1: f"{bid:.5f}",
+            2: f"{bid + 1.2e-4:.5f}",
+            3: str(1_785_000_000_000 + index * 250),
+        }
+
+    def getItemName(self) -> str:
+        return SUBSCRIPTION.items[0]
+
+    def getItemPos(self) -> int:
+        return 1
+
+    def isSnapshot(self) -> bool:
+        return False
+
+    def getFieldsByPosition(self) -> dict[int, str]:
+        return self.values
+
+    def getChangedFieldsByPosition(self) -> dict[int, str]:
+        return self.values
+
+
+def main() -> int:
+    layout = _TickLayout(FIELDS, "float")
+    ticks = [layout.decode(Update(index), SUBSCRIPTION.key) for index in range(UPDATES)]
+    print(f"{'resolutions':<12}{'per update':>14}{'bars':>10}")
+    for resolutions in RESOLUTIONS:
+        aggregator = BarAggregator(resolutions)
+        started = time.perf_counter()
+        closed = sum(1 for _ in aggregator.bars(ticks))
+        elapsed = (time.perf_counter() - started) / UPDATES
+        print(f"{len(resolutions):<12}{elapsed * 1e6:>12.2f}us{closed:>10,}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
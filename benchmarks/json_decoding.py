@@ -0,0 +1,43 @@
+"""Compare response decoders on a multi-megabyte price-history body."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from benchmarks.wire_normalisation import prices_payload  # noqa: E402
+from ig_trading_lib._protocol.decoding import ResponseDecoder  # noqa: E402
+from ig_trading_lib.core import JsonDecoder  # noqa: E402
+from ig_trading_lib.operations.markets import PricesResponse  # noqa: E402
+
+REPEATS = 3
+BACKENDS: tuple[JsonDecoder, ...] = ("stdlib", "pydantic", "orjson", "msgspec")
+
+
+def main() -> int:
+    content = json.dumps(prices_payload()).encode()
+    print(f"prices.list body: {len(content) / 1_000_000:.1f} MB")
+    print(f"{'decoder':<12}{'best':>10}")
+    for backend in BACKENDS:
+        if backend in {"orjson", "msgspec"} and importlib.util.find_spec(backend) is None:
+            print(f"{backend:<12}{'not installed':>16}")
+            continue
+        decoder = ResponseDecoder(backend)
+        timings = []
+        for _ in range(REPEATS):
+            started = time.perf_counter()
+            decoder.validate(PricesResponse, content)
+            timings.append(time.perf_counter() - started)
+        print(f"{backend:<12}{min(timings) * 1000:>8.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
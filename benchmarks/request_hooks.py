@@ -0,0 +1,139 @@
+"""Measure the per-call cost of request lifecycle hooks and metrics on the library hot path.
+
+The baseline row runs the same operation through an executor that only sends, decodes and
+validates, as it did before hooks existed, so the "no hooks" overhead is what the
+observation, cache and coalescing branches add to an unobserved call. The transport rows
+compare an unobserved transport request with an observed one.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import httpx  # noqa: E402
+
+from ig_trading_lib import (  # noqa: E402
+    IG,
+    Environment,
+    IGConfig,
+    MetricsRegistry,
+    RequestEvent,
+    SessionCredentials,
+)
+from ig_trading_lib._protocol.decoding import ResponseDecoder  # noqa: E402
+from ig_trading_lib._protocol.executor import _path  # noqa: E402
+from ig_trading_lib._protocol.manifest import OPERATION_MANIFEST  # noqa: E402
+from ig_trading_lib.metrics import RequestObservation  # noqa: E402
+from ig_trading_lib.operations.markets import MarketGetResponse, MarketOperations  # noqa: E402
+
+CALLS = 2_000
+REPEATS = 15
+EPIC = "CS.D.EURUSD.CFD.IP"
+PATH = f"/markets/{EPIC}"
+BODY = b'{"instrument": {"epic": "CS.D.EURUSD.CFD.IP", "name": "EUR/USD"}, "snapshot": {}}'
+RESPONSE = httpx.Response(
+    200, content=BODY, request=httpx.Request("GET", "https://demo-api.ig.com/gateway/deal")
+)
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+
+
+def client(config: IGConfig, **options: Any) -> IG:
+    ig = IG(config, http_client=httpx.Client(transport=httpx.MockTransport(handler)), **options)
+    ig.operations.session.get()
+    # Answer from memory so the timings isolate the library from httpx request building.
+    ig._transport._send = lambda *_, **__: RESPONSE  # type: ignore[method-assign]
+    return ig
+
+
+def time_calls(ig: IG) -> float:
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        ig.operations.markets.get(EPIC)
+    return (time.perf_counter() - started) / CALLS
+
+
+class BaselineExecutor:
+    """The executor as it was before hooks: send, decode and validate, nothing observed."""
+
+    def __init__(self, ig: IG) -> None:
+        self._transport = ig._transport
+        self._decoder = ResponseDecoder()
+
+    def execute(
+        self,
+        operation_id: str,
+        response_type: type[MarketGetResponse],
+        *,
+        path: dict[str, str] | None = None,
+    ) -> MarketGetResponse:
+        spec = OPERATION_MANIFEST[operation_id]
+        response = self._transport.request(
+            spec.method, _path(operation_id, path or {}), version=spec.version
+        )
+        return self._decoder.validate(response_type, response.content)
+
+
+def time_baseline(markets: MarketOperations) -> float:
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        markets.get(EPIC)
+    return (time.perf_counter() - started) / CALLS
+
+
+def time_transport(ig: IG, observed: bool) -> float:
+    transport = ig._transport
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        observation = RequestObservation("markets.get") if observed else None
+        transport.request("GET", PATH, version=4, observation=observation)
+    return (time.perf_counter() - started) / CALLS
+
+
+def ignore(event: RequestEvent) -> None:
+    pass
+
+
+def main() -> int:
+    config = IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("api-key", "identifier", "password"),
+    )
+    cases = (
+        ("no hooks", {}),
+        ("one no-op hook", {"hooks": (ignore,)}),
+        ("metrics + hook", {"hooks": (ignore,), "metrics": MetricsRegistry()}),
+    )
+    clients = [client(config, **options) for _, options in cases]
+    # Interleave the cases so machine noise affects each of them alike; keep the best round.
+    bare_markets = MarketOperations(BaselineExecutor(clients[0]))  # type: ignore[arg-type]
+    baseline = float("inf")
+    best = [float("inf")] * len(cases)
+    for _ in range(REPEATS):
+        baseline = min(baseline, time_baseline(bare_markets))
+        for index, ig in enumerate(clients):
+            best[index] = min(best[index], time_calls(ig))
+    print(f"{'markets.get':<18}{'per call':>12}{'overhead':>12}")
+    print(f"{'baseline':<18}{baseline * 1e6:>10.1f}us{0:>10.2f}us")
+    for (name, _), elapsed in zip(cases, best, strict=True):
+        print(f"{name:<18}{elapsed * 1e6:>10.1f}us{(elapsed - baseline) * 1e6:>10.2f}us")
+    bare = [float("inf")] * 2
+    for _ in range(REPEATS):
+        for index in range(2):
+            bare[index] = min(bare[index], time_transport(clients[0], observed=bool(index)))
+    print(f"{'transport':<18}{'per call':>12}{'overhead':>12}")
+    for name, elapsed in zip(("unobserved", "observed"), bare, strict=True):
+        print(f"{name:<18}{elapsed * 1e6:>10.1f}us{(elapsed - bare[0]) * 1e6:>10.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+"""Compare per-update and batched stream delivery at a high tick rate."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from ig_trading_lib.core import StreamingSession  # noqa: E402
+from ig_trading_lib.streaming import StreamingClient, StreamSubscription  # noqa: E402
+
+TICKS = 200_000
+SUBSCRIPTION = StreamSubscription(
+    key="prices", mode="MERGE", items=("MARKET:CS.D.EURUSD.CFD.IP",), fields=("BID", "OFFER")
+)
+
+
+class Tick:
+    fields = {"BID": "1.0800", "OFFER": "1.0802"}
+
+    def getItemName(self) -> str:
+        return "MARKET:CS.D.EURUSD.CFD.IP"
+
+    def getItemPos(self) -> int:
+        return 1
+
+    def isSnapshot(self) -> bool:
+        return False
+
+    def getFields(self) -> dict[str, str]:
+        return self.fields
+
+    def getChangedFields(self) -> dict[str, str]:
+        return self.fields
+
+
+class Details:
+    def setUser(self, value: str) -> None:
+        pass
+
+    def setPassword(self, value: str) -> None:
+        pass
+
+
+class Subscription:
+    def __init__(self, mode: str, items: list[str], fields: list[str]) -> None:
+        self.listener: Any = None
+
+    def addListener(self, listener: Any) -> None:
+        self.listener = listener
+
+    def setRequestedSnapshot(self, value: bool) -> None:
+        pass
+
+
+class Lightstreamer:
+    """Emit ticks from a separate thread, as the SDK does."""
+
+    def __init__(self) -> None:
+        self.connectionDetails = Details()
+
+    def connect(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+    def subscribe(self, subscription: Subscription) -> None:
+        tick = Tick()
+
+        def emit() -> None:
+            for _ in range(TICKS):
+                subscription.listener.onItemUpdate(tick)
+
+        threading.Thread(target=emit, daemon=True).start()
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        pass
+
+
+def client() -> StreamingClient:
+    return StreamingClient(
+        session_provider=lambda: StreamingSession("https://stream.test", "ABC123", "c", "x"),
+        client_factory=lambda _, __: Lightstreamer(),
+        subscription_factory=Subscription,
+        queue_size=TICKS,
+    )
+
+
+def sync_updates() -> int:
+    updates = client().iter_updates(SUBSCRIPTION)
+    for _ in range(TICKS):
+        next(updates)
+    updates.close()
+    return TICKS
+
+
+def sync_batches() -> int:
+    batches = client().iter_update_batches(SUBSCRIPTION)
+    received = wakeups = 0
+    while received < TICKS:
+        received += len(next(batches))
+        wakeups += 1
+    batches.close()
+    return wakeups
+
+
+async def async_updates() -> int:
+    updates = client().aiter_updates(SUBSCRIPTION)
+    for _ in range(TICKS):
+        await anext(updates)
+    await updates.aclose()
+    return TICKS
+
+
+async def async_batches() -> int:
+    batches = client().aiter_update_batches(SUBSCRIPTION)
+    received = wakeups = 0
+    while received < TICKS:
+        received += len(await anext(batches))
+        wakeups += 1
+    await batches.aclose()
+    return wakeups
+
+
+def main() -> int:
+    cases = (
+        ("iter_updates", sync_updates),
+        ("iter_update_batches", sync_batches),
+        ("aiter_updates", lambda: asyncio.run(async_updates())),
+        ("aiter_update_batches", lambda: asyncio.run(async_batches())),
+    )
+    print(f"{f'{TICKS:,} ticks':<22}{'ticks/s':>12}{'reads':>10}")
+    for name, run in cases:
+        started = time.perf_counter()
+        reads = run()
+        elapsed = time.perf_counter() - started
+        print(f"{name:<22}{TICKS / elapsed:>12,.0f}{reads:>10,}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
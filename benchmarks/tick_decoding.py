@@ -0,0 +1,109 @@
+"""Compare the per-update cost of dictionary updates and typed price ticks."""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from ig_trading_lib.streaming import (  # noqa: E402
+    StreamSubscription,
+    _Sink,
+    _SubscriptionListener,
+    _TickLayout,
+)
+
+UPDATES = 200_000
+FIELDS = ("BID", "OFFER", "HIGH", "LOW", "CHANGE", "MARKET_STATE", "UPDATE_TIME")
+SUBSCRIPTION = StreamSubscription(
+    key="prices", mode="MERGE", items=("MARKET:CS.D.EURUSD.CFD.IP",), fields=FIELDS
+)
+
+
+class Update:
+    """An SDK update in which BID and UPDATE_TIME changed, as on most price ticks."""
+
+    values = ("1.08001", "1.08012", "1.08500", "1.07900", "0.0012", "TRADEABLE", "10:00:01")
+    fields = dict(zip(FIELDS, values, strict=True))
+    changed = {"BID": values[0], "UPDATE_TIME": values[6]}
+    by_position = dict(enumerate(values, 1))
+    changed_by_position = {1: values[0], 7: values[6]}
+
+    def getItemName(self) -> str:
+        return "MARKET:CS.D.EURUSD.CFD.IP"
+
+    def getItemPos(self) -> int:
+        return 1
+
+    def isSnapshot(self) -> bool:
+        return False
+
+    def getFields(self) -> dict[str, str]:
+        return self.fields
+
+    def getChangedFields(self) -> dict[str, str]:
+        return self.changed
+
+    def getFieldsByPosition(self) -> dict[int, str]:
+        return self.by_position
+
+    def getChangedFieldsByPosition(self) -> dict[int, str]:
+        return self.changed_by_position
+
+
+class Consumer(_Sink):
+    """Read the spread, parsing the dictionary values as a consumer of StreamUpdate must."""
+
+    def __init__(self) -> None:
+        self.kept: list[Any] = []
+        self.keep = False
+
+    def deliver(self, event: Any) -> None:
+        if hasattr(event, "changed_mask"):
+            _ = event.values[1] - event.values[0]
+        else:
+            _ = float(event.fields["OFFER"]) - float(event.fields["BID"])
+        if self.keep:
+            self.kept.append(event)
+
+
+def measure(layout: _TickLayout | None) -> tuple[float, float]:
+    consumer = Consumer()
+    listener = _SubscriptionListener(SUBSCRIPTION, consumer, layout)
+    update = Update()
+    listener.onItemUpdate(update)
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(UPDATES):
+            listener.onItemUpdate(update)
+        best = min(best, (time.perf_counter() - started) / UPDATES)
+    # Keep the delivered events to see how much memory each one holds.
+    consumer.keep = True
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(1_000):
+        listener.onItemUpdate(update)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return best, held / 1_000
+
+
+def main() -> int:
+    print(f"{'per update':<16}{'decode + read':>16}{'held':>12}")
+    for name, layout in (
+        ("StreamUpdate", None),
+        ("PriceTick", _TickLayout(FIELDS, "float")),
+    ):
+        elapsed, held = measure(layout)
+        print(f"{name:<16}{elapsed * 1e6:>14.2f}us{held:>10.0f} B")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
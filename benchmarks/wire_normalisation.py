@@ -0,0 +1,138 @@
+"""Compare per-model and single-pass wire-key normalisation on large provider payloads."""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from ig_trading_lib.models import (  # noqa: E402
+    NORMALIZED_WIRE_CONTEXT,
+    IGModel,
+    normalize_wire_value,
+)
+from ig_trading_lib.operations.dealing import PositionsResponse  # noqa: E402
+from ig_trading_lib.operations.markets import PricesResponse  # noqa: E402
+
+REPEATS = 5
+
+
+def positions_payload(count: int = 500) -> dict[str, Any]:
+    return {
+        "positions": [
+            {
+                "position": {
+                    "contractSize": 1.0,
+                    "createdDate": "2026/08/08 12:34:56:000",
+                    "createdDateUTC": "2026-08-08T11:34:56",
+                    "currency": "GBP",
+                    "dealId": f"DIAAAAB{index:05d}",
+                    "dealReference": f"REF{index:05d}",
+                    "direction": "BUY" if index % 2 else "SELL",
+                    "size": 1.5,
+                    "level": 1.0812,
+                    "limitLevel": 1.0912,
+                    "stopLevel": 1.0712,
+                    "controlledRisk": False,
+                },
+                "market": {
+                    "epic": "CS.D.EURUSD.CFD.IP",
+                    "instrumentName": "EUR/USD",
+                    "instrumentType": "CURRENCIES",
+                    "expiry": "-",
+                    "bid": 1.0811,
+                    "offer": 1.0813,
+                    "high": 1.09,
+                    "low": 1.07,
+                    "lotSize": 1.0,
+                    "marketStatus": "TRADEABLE",
+                    "netChange": 0.001,
+                    "percentageChange": 0.1,
+                    "scalingFactor": 10000,
+                    "streamingPricesAvailable": True,
+                    "updateTime": "12:34:56",
+                    "updateTimeUTC": "11:34:56",
+                },
+            }
+            for index in range(count)
+        ]
+    }
+
+
+def prices_payload(count: int = 10_000) -> dict[str, Any]:
+    def value(level: float) -> dict[str, Any]:
+        return {"bid": level, "ask": level + 0.0002, "lastTraded": None}
+
+    return {
+        "prices": [
+            {
+                "snapshotTime": "2026/08/08 12:34:00",
+                "snapshotTimeUTC": "2026-08-08T11:34:00",
+                "openPrice": value(1.0810),
+                "closePrice": value(1.0812),
+                "highPrice": value(1.0815),
+                "lowPrice": value(1.0808),
+                "lastTradedVolume": 120,
+            }
+            for _ in range(count)
+        ],
+        "instrumentType": "CURRENCIES",
+        "metadata": {
+            "allowance": {
+                "allowanceExpiry": 530000,
+                "remainingAllowance": 9000,
+                "totalAllowance": 10000,
+            },
+            "size": count,
+            "pageData": {"pageNumber": 1, "pageSize": 0, "totalPages": 1},
+        },
+    }
+
+
+def per_model(response_type: type[IGModel], payload: dict[str, Any]) -> IGModel:
+    return response_type.model_validate(payload)
+
+
+def single_pass(response_type: type[IGModel], payload: dict[str, Any]) -> IGModel:
+    return response_type.model_validate(
+        normalize_wire_value(payload), context=NORMALIZED_WIRE_CONTEXT
+    )
+
+
+def best_of(
+    validate: Callable[[type[IGModel], dict[str, Any]], IGModel],
+    response_type: type[IGModel],
+    payload: dict[str, Any],
+) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        validate(response_type, payload)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> int:
+    cases = (
+        ("positions.list x500", PositionsResponse, positions_payload()),
+        ("prices.list x10000", PricesResponse, prices_payload()),
+    )
+    print(f"{'payload':<22}{'per-model':>12}{'single-pass':>14}{'speed-up':>10}")
+    for name, response_type, payload in cases:
+        assert per_model(response_type, payload) == single_pass(response_type, payload)
+        baseline = best_of(per_model, response_type, payload)
+        optimised = best_of(single_pass, response_type, payload)
+        print(
+            f"{name:<22}{baseline * 1000:>10.1f}ms{optimised * 1000:>12.1f}ms"
+            f"{baseline / optimised:>9.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
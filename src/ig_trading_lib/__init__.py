@@ -1,7 +1,10 @@
 """Typed IG operations and safe trading workflows."""
 
 from ig_trading_lib.api import IG, AsyncIG
+from ig_trading_lib.bars import BarAggregator
+from ig_trading_lib.cache import ResponseCache
 from ig_trading_lib.core import (
+    ConnectionPoolConfig,
     Environment,
     IGConfig,
     LiveTradingPermissionError,
@@ -22,6 +25,8 @@ from ig_trading_lib.errors import (
     StreamingSubscriptionError,
     TransportError,
 )
+from ig_trading_lib.hooks import RequestEvent
+from ig_trading_lib.metrics import MetricsRegistry
 from ig_trading_lib.operations.dealing import (
     AmendPositionRequest,
     AmendWorkingOrderRequest,
@@ -31,7 +36,8 @@ from ig_trading_lib.operations.dealing import (
     DealConfirmationResponse,
 )
 from ig_trading_lib.operations.markets import MarketGetResponse, MarketSearchResponse
-from ig_trading_lib.streaming import StreamSubscription, StreamUpdate
+from ig_trading_lib.ratelimit import RateLimiter
+from ig_trading_lib.streaming import PriceTick, StreamSubscription, StreamUpdate
 
 __all__ = [
     "AmbiguousExecutionError",
@@ -40,7 +46,9 @@ __all__ = [
     "AsyncIG",
     "AuthenticationError",
     "AuthorizationError",
+    "BarAggregator",
     "ClosePositionRequest",
+    "ConnectionPoolConfig",
     "CreatePositionRequest",
     "CreateWorkingOrderRequest",
     "DealConfirmationError",
@@ -52,10 +60,15 @@ __all__ = [
     "LiveTradingPermissionError",
     "MarketGetResponse",
     "MarketSearchResponse",
+    "MetricsRegistry",
     "OAuthCredentials",
+    "PriceTick",
     "ProviderRejectionError",
     "RateLimitError",
+    "RateLimiter",
+    "RequestEvent",
     "ResourceNotFoundError",
+    "ResponseCache",
     "SessionCredentials",
     "StreamSubscription",
     "StreamUpdate",
@@ -0,0 +1,75 @@
+"""Single-flight sharing of identical in-flight safe reads."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, TypeVar
+
+Result = TypeVar("Result")
+
+
+def flight_key(
+    operation_id: str,
+    response_type: type,
+    path: Mapping[str, str] | None,
+    query: Mapping[str, Any] | None,
+) -> Hashable:
+    """Identify a read by everything that shapes its wire request and validated result."""
+    return (
+        operation_id,
+        response_type,
+        tuple(sorted((path or {}).items())),
+        json.dumps(query, sort_keys=True, default=str) if query else None,
+    )
+
+
+class SingleFlight:
+    """Let concurrent threads asking for the same key share one call."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: dict[Hashable, Future[Any]] = {}
+
+    def run(self, key: Hashable, call: Callable[[], Result]) -> Result:
+        with self._lock:
+            shared = self._calls.get(key)
+            if shared is None:
+                leader: Future[Result] = Future()
+                self._calls[key] = leader
+        if shared is not None:
+            return shared.result()
+        try:
+            result = call()
+        except BaseException as error:
+            leader.set_exception(error)
+            raise
+        else:
+            leader.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Let concurrent tasks asking for the same key await one call."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Result]]) -> Result:
+        shared = self._calls.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(call())
+            self._calls[key] = shared
+            shared.add_done_callback(lambda done: self._forget(key, done))
+        # A cancelled waiter must not cancel the call other waiters share.
+        return await asyncio.shield(shared)
+
+    def _forget(self, key: Hashable, done: asyncio.Future[Any]) -> None:
+        if self._calls.get(key) is done:
+            del self._calls[key]
@@ -0,0 +1,93 @@
+"""Pluggable JSON decoding for provider response bodies."""
+
+from __future__ import annotations
+
+import importlib
+import json
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from types import ModuleType
+from typing import Any, Literal, TypeVar
+
+import pydantic_core
+
+from ig_trading_lib.core import JsonDecoder
+from ig_trading_lib.metrics import RequestObservation
+from ig_trading_lib.models import (
+    NORMALIZED_WIRE_CONTEXT,
+    IGModel,
+    normalize_wire_value,
+    wire_validation_context,
+)
+
+Response = TypeVar("Response", bound=IGModel)
+Loads = Callable[[bytes], Any]
+
+
+class ResponseDecoder:
+    """Decode and validate JSON bodies with the backend selected by ``IGConfig``."""
+
+    def __init__(self, backend: JsonDecoder = "stdlib") -> None:
+        self._loads, self._errors = _loader(backend)
+
+    def payload(self, content: bytes) -> object:
+        """Return the key-normalised payload, or an empty mapping for a non-JSON body."""
+        return normalize_wire_value(self._decode(content))
+
+    def validate(
+        self,
+        response_type: type[Response],
+        content: bytes,
+        observation: RequestObservation | None = None,
+    ) -> Response:
+        """Parse a body with the configured backend, then normalise its keys and validate."""
+        with phase(observation, "decode"):
+            payload = self._decode(content)
+        with phase(observation, "validate"):
+            return response_type.model_validate(payload, context=wire_validation_context())
+
+    @staticmethod
+    def validate_payload(response_type: type[Response], payload: object) -> Response:
+        """Validate a payload that :meth:`payload` has already normalised."""
+        return response_type.model_validate(payload, context=NORMALIZED_WIRE_CONTEXT)
+
+    def _decode(self, content: bytes) -> object:
+        if not content:
+            return {}
+        try:
+            return self._loads(content)
+        except self._errors:
+            return {}
+
+
+_UNOBSERVED = nullcontext()
+
+
+def phase(
+    observation: RequestObservation | None, name: Literal["decode", "validate"]
+) -> AbstractContextManager[None]:
+    """Time a step when the call is observed, and cost next to nothing when it is not."""
+    return _UNOBSERVED if observation is None else observation.phase(name)
+
+
+def _loader(backend: JsonDecoder) -> tuple[Loads, tuple[type[Exception], ...]]:
+    if backend == "stdlib":
+        return json.loads, (ValueError,)
+    if backend == "pydantic":
+        return pydantic_core.from_json, (ValueError,)
+    if backend == "orjson":
+        orjson = _optional_module("orjson", backend)
+        return orjson.loads, (orjson.JSONDecodeError,)
+    if backend == "msgspec":
+        msgspec = _optional_module("msgspec", backend)
+        return msgspec.json.decode, (msgspec.DecodeError, ValueError)
+    raise ValueError(f"Unsupported JSON decoder {backend!r}.")
+
+
+def _optional_module(name: str, backend: JsonDecoder) -> ModuleType:
+    try:
+        return importlib.import_module(name)
+    except ImportError as error:
+        raise ImportError(
+            f"IGConfig(json_decoder={backend!r}) requires the optional {name!r} package."
+        ) from error
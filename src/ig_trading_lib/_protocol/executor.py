@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import time
+from collections.abc import Hashable, Mapping, Sequence
 from typing import Any, TypeVar
 from urllib.parse import quote
 
 import httpx
 
+from ig_trading_lib._protocol.coalescing import AsyncSingleFlight, SingleFlight, flight_key
+from ig_trading_lib._protocol.decoding import ResponseDecoder, phase
 from ig_trading_lib._protocol.manifest import OPERATION_MANIFEST, OperationSpec
+from ig_trading_lib.cache import ResponseCache
 from ig_trading_lib.core import TradingGuard
+from ig_trading_lib.hooks import RequestHook
+from ig_trading_lib.metrics import MetricsRegistry, RequestObservation
 from ig_trading_lib.models import IGModel
 from ig_trading_lib.transport import AsyncTransport, SyncTransport
 
@@ -24,9 +30,26 @@ def _path(operation_id: str, values: Mapping[str, str]) -> str:
 class SyncExecutor:
     """Execute a manifest-bound operation synchronously."""
 
-    def __init__(self, transport: SyncTransport, guard: TradingGuard) -> None:
+    def __init__(
+        self,
+        transport: SyncTransport,
+        guard: TradingGuard,
+        decoder: ResponseDecoder | None = None,
+        *,
+        coalesce_reads: bool = False,
+        cache: ResponseCache | None = None,
+        cache_scope: Hashable = None,
+        metrics: MetricsRegistry | None = None,
+        hooks: Sequence[RequestHook] = (),
+    ) -> None:
         self._transport = transport
         self._guard = guard
+        self._decoder = decoder or ResponseDecoder()
+        self._flights = SingleFlight() if coalesce_reads else None
+        self._cache = cache
+        self._cache_scope = cache_scope
+        self._metrics = metrics
+        self._hooks = tuple(hooks)
 
     def execute(
         self,
@@ -36,18 +59,66 @@ class SyncExecutor:
         path: Mapping[str, str] | None = None,
         query: Mapping[str, Any] | None = None,
         body: Mapping[str, Any] | None = None,
+        data_points: int = 0,
     ) -> Response:
         spec = OPERATION_MANIFEST[operation_id]
+        if spec.mutation:
+            try:
+                return self._execute(spec, response_type, path, query, body, data_points)
+            finally:
+                if self._cache is not None:
+                    self._cache.invalidate(operation_id)
+        cache = self._cache if spec.cache is not None else None
+        if cache is None and self._flights is None:
+            return self._execute(spec, response_type, path, query, body, data_points)
+        key = flight_key(operation_id, response_type, path, query)
+        generation = 0
+        if cache is not None:
+            cached, generation = cache.get(operation_id, (self._cache_scope, key))
+            if cached is not None:
+                return cached
+        if self._flights is None:
+            result = self._execute(spec, response_type, path, query, body, data_points)
+        else:
+            result = self._flights.run(
+                key, lambda: self._execute(spec, response_type, path, query, body, data_points)
+            )
+        if cache is not None:
+            cache.put(operation_id, (self._cache_scope, key), result, generation)
+        return result
+
+    def _execute(
+        self,
+        spec: OperationSpec,
+        response_type: type[Response],
+        path: Mapping[str, str] | None,
+        query: Mapping[str, Any] | None,
+        body: Mapping[str, Any] | None,
+        data_points: int,
+    ) -> Response:
         if spec.mutation:
             self._guard.require_mutation_permission()
-        response = self._transport.request(
-            spec.method,
-            _path(operation_id, path or {}),
-            version=spec.version,
-            params=query,
-            json=body,
+        started = time.perf_counter() if self._metrics is not None else 0.0
+        observation = (
+            RequestObservation(spec.operation_id, hooks=self._hooks)
+            if self._metrics is not None or self._hooks
+            else None
         )
-        result = response_type.model_validate(_response_payload(spec, response))
+        try:
+            response = self._transport.request(
+                spec.method,
+                _path(spec.operation_id, path or {}),
+                version=spec.version,
+                params=query,
+                json=body,
+                mutation=spec.mutation,
+                data_points=data_points,
+                observation=observation,
+            )
+            result = _validate_response(self._decoder, spec, response, response_type, observation)
+        finally:
+            if self._metrics is not None and observation is not None:
+                self._metrics.record(observation, time.perf_counter() - started)
         if spec.invalidates_session:
             self._transport.invalidate_session()
         return result
@@ -56,9 +127,26 @@ class SyncExecutor:
 class AsyncExecutor:
     """Execute the same manifest-bound operation asynchronously."""
 
-    def __init__(self, transport: AsyncTransport, guard: TradingGuard) -> None:
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        guard: TradingGuard,
+        decoder: ResponseDecoder | None = None,
+        *,
+        coalesce_reads: bool = False,
+        cache: ResponseCache | None = None,
+        cache_scope: Hashable = None,
+        metrics: MetricsRegistry | None = None,
+        hooks: Sequence[RequestHook] = (),
+    ) -> None:
         self._transport = transport
         self._guard = guard
+        self._decoder = decoder or ResponseDecoder()
+        self._flights = AsyncSingleFlight() if coalesce_reads else None
+        self._cache = cache
+        self._cache_scope = cache_scope
+        self._metrics = metrics
+        self._hooks = tuple(hooks)
 
     async def execute(
         self,
@@ -68,41 +156,91 @@ class AsyncExecutor:
         path: Mapping[str, str] | None = None,
         query: Mapping[str, Any] | None = None,
         body: Mapping[str, Any] | None = None,
+        data_points: int = 0,
     ) -> Response:
         spec = OPERATION_MANIFEST[operation_id]
+        if spec.mutation:
+            try:
+                return await self._execute(spec, response_type, path, query, body, data_points)
+            finally:
+                if self._cache is not None:
+                    self._cache.invalidate(operation_id)
+        cache = self._cache if spec.cache is not None else None
+        if cache is None and self._flights is None:
+            return await self._execute(spec, response_type, path, query, body, data_points)
+        key = flight_key(operation_id, response_type, path, query)
+        generation = 0
+        if cache is not None:
+            cached, generation = cache.get(operation_id, (self._cache_scope, key))
+            if cached is not None:
+                return cached
+        if self._flights is None:
+            result = await self._execute(spec, response_type, path, query, body, data_points)
+        else:
+            result = await self._flights.run(
+                key, lambda: self._execute(spec, response_type, path, query, body, data_points)
+            )
+        if cache is not None:
+            cache.put(operation_id, (self._cache_scope, key), result, generation)
+        return result
+
+    async def _execute(
+        self,
+        spec: OperationSpec,
+        response_type: type[Response],
+        path: Mapping[str, str] | None,
+        query: Mapping[str, Any] | None,
+        body: Mapping[str, Any] | None,
+        data_points: int,
+    ) -> Response:
         if spec.mutation:
             self._guard.require_mutation_permission()
-        response = await self._transport.request(
-            spec.method,
-            _path(operation_id, path or {}),
-            version=spec.version,
-            params=query,
-            json=body,
+        started = time.perf_counter() if self._metrics is not None else 0.0
+        observation = (
+            RequestObservation(spec.operation_id, hooks=self._hooks)
+            if self._metrics is not None or self._hooks
+            else None
         )
-        result = response_type.model_validate(_response_payload(spec, response))
+        try:
+            response = await self._transport.request(
+                spec.method,
+                _path(spec.operation_id, path or {}),
+                version=spec.version,
+                params=query,
+                json=body,
+                mutation=spec.mutation,
+                data_points=data_points,
+                observation=observation,
+            )
+            result = _validate_response(self._decoder, spec, response, response_type, observation)
+        finally:
+            if self._metrics is not None and observation is not None:
+                self._metrics.record(observation, time.perf_counter() - started)
         if spec.invalidates_session:
             self._transport.invalidate_session()
         return result
 
 
-def _payload(response: httpx.Response) -> object:
-    try:
-        return response.json()
-    except ValueError:
-        return {}
-
-
-def _response_payload(spec: OperationSpec, response: httpx.Response) -> object:
+def _validate_response(
+    decoder: ResponseDecoder,
+    spec: OperationSpec,
+    response: httpx.Response,
+    response_type: type[Response],
+    observation: RequestObservation | None,
+) -> Response:
     if spec.response_format == "binary":
-        return {
+        payload: object = {
             "content": response.content,
             "content_type": response.headers.get("content-type"),
         }
-    payload = _payload(response)
-    if not spec.response_headers or not isinstance(payload, Mapping):
-        return payload
-    enriched = dict(payload)
-    for field_name, header_name in spec.response_headers:
-        if value := response.headers.get(header_name):
-            enriched[field_name] = value
-    return enriched
+    elif not spec.response_headers:
+        return decoder.validate(response_type, response.content, observation)
+    else:
+        with phase(observation, "decode"):
+            payload = decoder.payload(response.content)
+        if isinstance(payload, dict):
+            for field_name, header_name in spec.response_headers:
+                if value := response.headers.get(header_name):
+                    payload[field_name] = value
+    with phase(observation, "validate"):
+        return decoder.validate_payload(response_type, payload)
@@ -23,6 +23,15 @@ class SourceEvidence:
     sha256: str
 
 
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """How long a safe read may be served from memory and what makes it stale."""
+
+    ttl_seconds: float
+    max_entries: int
+    invalidated_by: tuple[str, ...] = ()
+
+
 @dataclass(frozen=True, slots=True)
 class OperationSpec:
     """Private wire contract for one IG operation."""
@@ -38,6 +47,7 @@ class OperationSpec:
     evidence: SourceEvidence
     response_format: ResponseFormat
     response_headers: tuple[ResponseHeader, ...]
+    cache: CachePolicy | None
 
 
 OFFICIAL_REST_EVIDENCE = SourceEvidence(
@@ -67,6 +77,7 @@ def _spec(
     response_format: ResponseFormat = "json",
     response_headers: tuple[ResponseHeader, ...] = (),
     schema: str = "IG REST reference response schema with provider extras preserved",
+    cache: CachePolicy | None = None,
 ) -> OperationSpec:
     return OperationSpec(
         operation_id=operation_id,
@@ -80,12 +91,23 @@ def _spec(
         evidence=OFFICIAL_REST_EVIDENCE,
         response_format=response_format,
         response_headers=response_headers,
+        cache=cache,
     )
 
 
+_ACCOUNT_SWITCH = ("session.switch_account",)
+
 _SPECS = (
     _spec("accounts.list", "GET", "/accounts", 1),
-    _spec("accounts.get_preferences", "GET", "/accounts/preferences", 1),
+    _spec(
+        "accounts.get_preferences",
+        "GET",
+        "/accounts/preferences",
+        1,
+        cache=CachePolicy(
+            3_600, 1, invalidated_by=("accounts.update_preferences", *_ACCOUNT_SWITCH)
+        ),
+    ),
     _spec("accounts.update_preferences", "PUT", "/accounts/preferences", 1, mutation=True),
     _spec("activity.list", "GET", "/history/activity", 3),
     _spec("activity.list_by_date_range", "GET", "/history/activity/{from_date}/{to_date}", 1),
@@ -120,11 +142,18 @@ _SPECS = (
         mutation=True,
     ),
     _spec("repeat_dealing_window.get", "GET", "/repeat-dealing-window", 1),
-    _spec("categories.list", "GET", "/categories", 1),
-    _spec("categories.list_instruments", "GET", "/categories/{category_id}/instruments", 1),
+    _spec("categories.list", "GET", "/categories", 1, cache=CachePolicy(3_600, 4)),
+    _spec(
+        "categories.list_instruments",
+        "GET",
+        "/categories/{category_id}/instruments",
+        1,
+        cache=CachePolicy(3_600, 256),
+    ),
     _spec("markets.list", "GET", "/markets", 2),
     _spec("markets.search", "GET", "/markets", 1),
-    _spec("markets.get", "GET", "/markets/{epic}", 4),
+    # The response carries the live snapshot (bid, offer, market status), so keep it briefly.
+    _spec("markets.get", "GET", "/markets/{epic}", 4, cache=CachePolicy(10, 512)),
     _spec("prices.list", "GET", "/prices/{epic}", 3),
     _spec("prices.list_points", "GET", "/prices/{epic}/{resolution}/{num_points}", 2),
     _spec(
@@ -135,7 +164,22 @@ _SPECS = (
     ),
     _spec("watchlists.list", "GET", "/watchlists", 1),
     _spec("watchlists.create", "POST", "/watchlists", 1, mutation=True),
-    _spec("watchlists.get", "GET", "/watchlists/{watchlist_id}", 1),
+    _spec(
+        "watchlists.get",
+        "GET",
+        "/watchlists/{watchlist_id}",
+        1,
+        cache=CachePolicy(
+            300,
+            64,
+            invalidated_by=(
+                "watchlists.add_market",
+                "watchlists.remove_market",
+                "watchlists.delete",
+                *_ACCOUNT_SWITCH,
+            ),
+        ),
+    ),
     _spec("watchlists.add_market", "PUT", "/watchlists/{watchlist_id}", 1, mutation=True),
     _spec("watchlists.delete", "DELETE", "/watchlists/{watchlist_id}", 1, mutation=True),
     _spec(
@@ -165,7 +209,13 @@ _SPECS = (
         mutation=True,
         invalidates_session=True,
     ),
-    _spec("session.get_encryption_key", "GET", "/session/encryptionKey", 1),
+    _spec(
+        "session.get_encryption_key",
+        "GET",
+        "/session/encryptionKey",
+        1,
+        cache=CachePolicy(300, 1),
+    ),
     _spec(
         "session.refresh_token",
         "POST",
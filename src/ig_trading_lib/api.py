@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 import httpx
 
+from ig_trading_lib._protocol.decoding import ResponseDecoder
 from ig_trading_lib._protocol.executor import AsyncExecutor, SyncExecutor
+from ig_trading_lib.cache import ResponseCache, account_scope
+from ig_trading_lib.candles import CandleStore
 from ig_trading_lib.core import IGConfig, TradingGuard, TradingPermit
+from ig_trading_lib.hooks import RequestHook
+from ig_trading_lib.metrics import MetricsRegistry
 from ig_trading_lib.operations.accounts import (
     AccountsOperations,
     ActivityOperations,
@@ -49,6 +55,7 @@ from ig_trading_lib.operations.sentiment import (
 from ig_trading_lib.operations.session import AsyncSessionOperations, SessionOperations
 from ig_trading_lib.operations.streaming import AsyncStreamingOperations, StreamingOperations
 from ig_trading_lib.operations.watchlists import AsyncWatchlistsOperations, WatchlistsOperations
+from ig_trading_lib.ratelimit import RateLimiter
 from ig_trading_lib.streaming import AsyncStreamingClient, StreamingClient
 from ig_trading_lib.transport import AsyncTransport, SyncTransport
 from ig_trading_lib.workflows.dealing import (
@@ -61,6 +68,11 @@ from ig_trading_lib.workflows.discovery import (
     AsyncMarketDiscoveryWorkflow,
     MarketDiscoveryWorkflow,
 )
+from ig_trading_lib.workflows.history import AsyncPriceHistoryWorkflow, PriceHistoryWorkflow
+from ig_trading_lib.workflows.instruments import (
+    AsyncInstrumentIndexWorkflow,
+    InstrumentIndexWorkflow,
+)
 from ig_trading_lib.workflows.portfolio import AsyncPortfolioWorkflow, PortfolioWorkflow
 
 
@@ -91,8 +103,10 @@ class Workflows:
     """Synchronous multi-operation journeys."""
 
     discovery: MarketDiscoveryWorkflow
+    instruments: InstrumentIndexWorkflow
     portfolio: PortfolioWorkflow
     positions: PositionWorkflow
+    prices: PriceHistoryWorkflow
     working_orders: WorkingOrderWorkflow
 
 
@@ -123,8 +137,10 @@ class AsyncWorkflows:
     """Asynchronous multi-operation journeys."""
 
     discovery: AsyncMarketDiscoveryWorkflow
+    instruments: AsyncInstrumentIndexWorkflow
     portfolio: AsyncPortfolioWorkflow
     positions: AsyncPositionWorkflow
+    prices: AsyncPriceHistoryWorkflow
     working_orders: AsyncWorkingOrderWorkflow
 
 
@@ -137,9 +153,22 @@ class IG:
         *,
         trading_permit: TradingPermit | None = None,
         http_client: httpx.Client | None = None,
+        rate_limiter: RateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        metrics: MetricsRegistry | None = None,
+        hooks: Sequence[RequestHook] = (),
     ) -> None:
-        transport = SyncTransport(config, http_client=http_client)
-        executor = SyncExecutor(transport, TradingGuard(config, trading_permit))
+        transport = SyncTransport(config, http_client=http_client, rate_limiter=rate_limiter)
+        executor = SyncExecutor(
+            transport,
+            TradingGuard(config, trading_permit),
+            ResponseDecoder(config.json_decoder),
+            coalesce_reads=config.coalesce_reads,
+            cache=response_cache,
+            cache_scope=account_scope(config),
+            metrics=metrics,
+            hooks=hooks,
+        )
         streaming = StreamingOperations(
             StreamingClient(
                 session_provider=transport.streaming_session,
@@ -147,14 +176,19 @@ class IG:
             )
         )
         self._transport = transport
+        self._candles = _candle_store(config)
         self.operations = _sync_operations(executor, streaming)
-        self.workflows = _sync_workflows(self.operations)
+        self.workflows = _sync_workflows(self.operations, self._candles)
 
     def close(self) -> None:
+        self.workflows.portfolio.close()
         self.operations.streaming.close()
         self._transport.close()
+        if self._candles is not None:
+            self._candles.close()
 
     def __enter__(self) -> IG:
+        self._transport.prewarm()
         return self
 
     def __exit__(self, *_: object) -> None:
@@ -170,9 +204,22 @@ class AsyncIG:
         *,
         trading_permit: TradingPermit | None = None,
         http_client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        metrics: MetricsRegistry | None = None,
+        hooks: Sequence[RequestHook] = (),
     ) -> None:
-        transport = AsyncTransport(config, http_client=http_client)
-        executor = AsyncExecutor(transport, TradingGuard(config, trading_permit))
+        transport = AsyncTransport(config, http_client=http_client, rate_limiter=rate_limiter)
+        executor = AsyncExecutor(
+            transport,
+            TradingGuard(config, trading_permit),
+            ResponseDecoder(config.json_decoder),
+            coalesce_reads=config.coalesce_reads,
+            cache=response_cache,
+            cache_scope=account_scope(config),
+            metrics=metrics,
+            hooks=hooks,
+        )
         streaming = AsyncStreamingOperations(
             AsyncStreamingClient(
                 session_provider=transport.streaming_session,
@@ -180,14 +227,18 @@ class AsyncIG:
             )
         )
         self._transport = transport
+        self._candles = _candle_store(config)
         self.operations = _async_operations(executor, streaming)
-        self.workflows = _async_workflows(self.operations)
+        self.workflows = _async_workflows(self.operations, self._candles)
 
     async def close(self) -> None:
         await self.operations.streaming.close()
         await self._transport.close()
+        if self._candles is not None:
+            self._candles.close()
 
     async def __aenter__(self) -> AsyncIG:
+        await self._transport.prewarm()
         return self
 
     async def __aexit__(self, *_: object) -> None:
@@ -238,25 +289,47 @@ def _async_operations(
     )
 
 
-def _sync_workflows(operations: Operations) -> Workflows:
+def _candle_store(config: IGConfig) -> CandleStore | None:
+    if config.candle_store_path is None:
+        return None
+    return CandleStore(config.candle_store_path)
+
+
+def _sync_workflows(operations: Operations, candles: CandleStore | None) -> Workflows:
     return Workflows(
         discovery=MarketDiscoveryWorkflow(operations.markets),
+        instruments=InstrumentIndexWorkflow(operations.markets),
         portfolio=PortfolioWorkflow(
-            operations.accounts, operations.positions, operations.working_orders
+            operations.accounts,
+            operations.positions,
+            operations.working_orders,
+            operations.streaming,
+        ),
+        positions=PositionWorkflow(
+            operations.positions, operations.confirmations, operations.streaming
+        ),
+        prices=PriceHistoryWorkflow(operations.prices, store=candles),
+        working_orders=WorkingOrderWorkflow(
+            operations.working_orders, operations.confirmations, operations.streaming
         ),
-        positions=PositionWorkflow(operations.positions, operations.confirmations),
-        working_orders=WorkingOrderWorkflow(operations.working_orders, operations.confirmations),
     )
 
 
-def _async_workflows(operations: AsyncOperations) -> AsyncWorkflows:
+def _async_workflows(operations: AsyncOperations, candles: CandleStore | None) -> AsyncWorkflows:
     return AsyncWorkflows(
         discovery=AsyncMarketDiscoveryWorkflow(operations.markets),
+        instruments=AsyncInstrumentIndexWorkflow(operations.markets),
         portfolio=AsyncPortfolioWorkflow(
-            operations.accounts, operations.positions, operations.working_orders
+            operations.accounts,
+            operations.positions,
+            operations.working_orders,
+            operations.streaming,
+        ),
+        positions=AsyncPositionWorkflow(
+            operations.positions, operations.confirmations, operations.streaming
         ),
-        positions=AsyncPositionWorkflow(operations.positions, operations.confirmations),
+        prices=AsyncPriceHistoryWorkflow(operations.prices, store=candles),
         working_orders=AsyncWorkingOrderWorkflow(
-            operations.working_orders, operations.confirmations
+            operations.working_orders, operations.confirmations, operations.streaming
         ),
     )
@@ -0,0 +1,329 @@
+"""Incremental OHLC bars built from streamed prices."""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, tzinfo
+from decimal import Decimal
+from functools import lru_cache
+from typing import Literal
+
+from ig_trading_lib.operations.markets import (
+    PRICE_RESOLUTION_STEPS,
+    PriceResolution,
+    PricesResponse,
+    PriceValue,
+    bar_epoch_seconds,
+)
+from ig_trading_lib.streaming import PriceTick, StreamUpdate
+
+BarPrice = Literal["mid", "bid", "offer"]
+BAR_COLUMNS = ("start", "open", "high", "low", "close", "volume")
+# 1970-01-05, the first Monday after the epoch, so weekly bars open on Mondays.
+_MONDAY = 4 * 86_400.0
+_SIDES = {"bid": ("bid",), "offer": ("ask",), "mid": ("bid", "ask")}
+
+
+@dataclass(frozen=True, slots=True)
+class Bar:
+    """One closed OHLC bar; ``start`` is the UTC time at which the bar opened."""
+
+    epic: str
+    resolution: PriceResolution
+    start: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class _Series:
+    """The open bar of one epic and resolution as scalars, and closed bars as columns."""
+
+    __slots__ = (
+        "epic",
+        "resolution",
+        "step",
+        "origin",
+        "limit",
+        "start",
+        "end",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "columns",
+    )
+
+    def __init__(self, epic: str, resolution: PriceResolution, limit: int) -> None:
+        self.epic = epic
+        self.resolution: PriceResolution = resolution
+        self.step = PRICE_RESOLUTION_STEPS[resolution].total_seconds()
+        self.origin = _MONDAY if resolution == "WEEK" else 0.0
+        self.limit = limit
+        self.start = self.end = -math.inf
+        self.open = self.high = self.low = self.close = self.volume = 0.0
+        self.columns = tuple(array("d") for _ in BAR_COLUMNS)
+
+    def add(self, at: float, price: float) -> Bar | None:
+        if at < self.end:
+            if at < self.start:
+                return None
+            if price > self.high:
+                self.high = price
+            elif price < self.low:
+                self.low = price
+            self.close = price
+            self.volume += 1.0
+            return None
+        closed = self._close()
+        self.start, self.end = self._bounds(at)
+        self.open = self.high = self.low = self.close = price
+        self.volume = 1.0
+        return closed
+
+    def seed(self, bars: list[tuple[float, float, float, float, float, float]]) -> None:
+        for column in self.columns:
+            del column[:]
+        *history, last = bars
+        for bar in history[-self.limit :]:
+            for column, value in zip(self.columns, bar, strict=True):
+                column.append(value)
+        start, self.open, self.high, self.low, self.close, _ = last
+        # Live volume counts updates, so the open bar counts only those still to come.
+        self.volume = 0.0
+        if self.resolution != "MONTH":
+            self.origin = start % self.step
+        self.start, self.end = start, self._bounds(start)[1]
+
+    def current(self) -> Bar | None:
+        if self.end == -math.inf:
+            return None
+        return Bar(
+            self.epic,
+            self.resolution,
+            datetime.fromtimestamp(self.start, UTC),
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.volume,
+        )
+
+    def _close(self) -> Bar | None:
+        bar = self.current()
+        if bar is None:
+            return None
+        values = (self.start, self.open, self.high, self.low, self.close, self.volume)
+        for column, value in zip(self.columns, values, strict=True):
+            column.append(value)
+        # Trim in bulk once the history doubles, so each close stays amortised O(1).
+        if len(self.columns[0]) >= 2 * self.limit:
+            for column in self.columns:
+                del column[: -self.limit]
+        return bar
+
+    def _bounds(self, at: float) -> tuple[float, float]:
+        if self.resolution == "MONTH":
+            moment = datetime.fromtimestamp(at, UTC)
+            start = datetime(moment.year, moment.month, 1, tzinfo=UTC)
+            end = datetime(moment.year + moment.month // 12, moment.month % 12 + 1, 1, tzinfo=UTC)
+            return start.timestamp(), end.timestamp()
+        start = at - (at - self.origin) % self.step
+        return start, start + self.step
+
+
+class BarAggregator:
+    """Build rolling OHLC bars for several resolutions from ``MERGE`` price updates.
+
+    Feed it the ``StreamUpdate`` or ``PriceTick`` values of a ``MARKET:`` or ``CHART:``
+    subscription that includes ``BID`` and ``OFFER`` (or ``OFR``). A bar closes when the
+    first update of a later period arrives, so quiet periods produce no bar. Updates are
+    timed by the ``UTM`` field when subscribed, otherwise by ``at`` or the arrival time.
+    Live bar volume counts price updates. Each epic and resolution keeps the open bar as
+    scalars and its last ``history`` closed bars in ``array('d')`` columns.
+
+    The aggregator is not thread-safe; feed it from the one consumer of the stream.
+    """
+
+    def __init__(
+        self,
+        resolutions: Iterable[PriceResolution],
+        *,
+        price: BarPrice = "mid",
+        history: int = 1_000,
+    ) -> None:
+        self.resolutions: tuple[PriceResolution, ...] = tuple(dict.fromkeys(resolutions))
+        if not self.resolutions:
+            raise ValueError("BarAggregator requires at least one resolution.")
+        if price not in _SIDES:
+            raise ValueError(f"Unsupported bar price {price!r}.")
+        if history < 1:
+            raise ValueError("history must be at least 1.")
+        self.price: BarPrice = price
+        self.history_size = history
+        self._epics: dict[str, tuple[_Series, ...]] = {}
+        self._items: dict[str, tuple[_Series, ...]] = {}
+
+    def add(self, update: StreamUpdate | PriceTick, *, at: datetime | None = None) -> list[Bar]:
+        """Apply one update and return the bars it closed, in resolution order."""
+        quote = _quote(update, self.price)
+        if quote is None:
+            return []
+        price, stamped = quote
+        if stamped is None:
+            stamped = time.time() if at is None else at.timestamp()
+        name = update.item_name or update.subscription_key
+        series = self._items.get(name)
+        if series is None:
+            series = self._items[name] = self._series(_epic(name))
+        closed = []
+        for one in series:
+            bar = one.add(stamped, price)
+            if bar is not None:
+                closed.append(bar)
+        return closed
+
+    def bars(self, updates: Iterable[StreamUpdate | PriceTick]) -> Iterator[Bar]:
+        """Consume a stream of updates and yield every bar as it closes."""
+        for update in updates:
+            yield from self.add(update)
+
+    async def abars(self, updates: AsyncIterable[StreamUpdate | PriceTick]) -> AsyncIterator[Bar]:
+        """Consume an async stream of updates and yield every bar as it closes."""
+        async for update in updates:
+            for bar in self.add(update):
+                yield bar
+
+    def seed(
+        self,
+        epic: str,
+        resolution: PriceResolution,
+        prices: PricesResponse,
+        *,
+        tz: tzinfo | None = None,
+    ) -> None:
+        """Load historical bars, such as a ``prices.list`` response, for one series.
+
+        Every point except the newest becomes closed history with IG's ``lastTradedVolume``.
+        The newest point becomes the open bar, which live updates then extend, and later bars
+        keep its alignment, so history and live bars join without a gap. Its volume restarts
+        at zero because live volume counts updates. Seeding replaces the series' bars.
+
+        v2 responses such as ``prices.list_points`` carry only ``snapshotTime`` in the
+        account's time zone; pass that zone as ``tz`` to seed from them. Raises ``ValueError``
+        when no point has both a UTC bar time and the configured prices.
+        """
+        if resolution not in self.resolutions:
+            raise ValueError(f"Resolution {resolution!r} is not aggregated.")
+        bars = []
+        for point in prices.prices:
+            start = bar_epoch_seconds(point, tz)
+            values = [
+                _side_price(side, self.price)
+                for side in (point.open_price, point.high_price, point.low_price, point.close_price)
+            ]
+            if not math.isnan(start) and None not in values:
+                volume = point.last_traded_volume or 0.0
+                bars.append((start, *values, volume))
+        if not bars:
+            raise ValueError(
+                f"No {resolution} price point for {epic!r} could seed its bars;"
+                " v2 responses need the account's time zone as tz."
+            )
+        bars.sort()
+        self._series(epic)[self.resolutions.index(resolution)].seed(bars)
+
+    def current(self, epic: str, resolution: PriceResolution) -> Bar | None:
+        """Return the still-open bar of one series, or ``None`` before its first update."""
+        series = self._epics.get(epic)
+        if series is None or resolution not in self.resolutions:
+            return None
+        return series[self.resolutions.index(resolution)].current()
+
+    def history(self, epic: str, resolution: PriceResolution) -> dict[str, array]:
+        """Return copies of the retained closed bars of one series as float64 columns.
+
+        Columns are keyed by ``BAR_COLUMNS``; ``start`` holds UTC epoch seconds.
+        """
+        series = self._epics.get(epic)
+        if series is None or resolution not in self.resolutions:
+            return {name: array("d") for name in BAR_COLUMNS}
+        columns = series[self.resolutions.index(resolution)].columns
+        limit = self.history_size
+        return {name: column[-limit:] for name, column in zip(BAR_COLUMNS, columns, strict=True)}
+
+    def _series(self, epic: str) -> tuple[_Series, ...]:
+        series = self._epics.get(epic)
+        if series is None:
+            series = self._epics[epic] = tuple(
+                _Series(epic, resolution, self.history_size) for resolution in self.resolutions
+            )
+        return series
+
+
+def _quote(update: StreamUpdate | PriceTick, price: BarPrice) -> tuple[float, float | None] | None:
+    if isinstance(update, PriceTick):
+        bid_at, offer_at, stamp_at, price_mask = _positions(update.fields)
+        if not update.changed_mask & price_mask:
+            return None
+        values = update.values
+        bid = None if bid_at is None else values[bid_at]
+        offer = None if offer_at is None else values[offer_at]
+        stamp = None if stamp_at is None else values[stamp_at]
+    else:
+        fields, changed = update.fields, update.changed_fields
+        offer_field = "OFFER" if "OFFER" in fields else "OFR"
+        if "BID" not in changed and offer_field not in changed:
+            return None
+        bid, offer, stamp = fields.get("BID"), fields.get(offer_field), fields.get("UTM")
+    if price == "bid":
+        quoted = _number(bid)
+    elif price == "offer":
+        quoted = _number(offer)
+    else:
+        bid_value, offer_value = _number(bid), _number(offer)
+        quoted = None if bid_value is None or offer_value is None else (bid_value + offer_value) / 2
+    if quoted is None:
+        return None
+    stamped = _number(stamp)
+    return quoted, None if stamped is None else stamped / 1_000
+
+
+@lru_cache(maxsize=256)
+def _positions(fields: tuple[str, ...]) -> tuple[int | None, int | None, int | None, int]:
+    """Locate the bid, offer and ``UTM`` values of a tick, and the bits of its price fields."""
+    index = {name: position for position, name in enumerate(fields)}
+    bid_at = index.get("BID")
+    offer_at = index.get("OFFER", index.get("OFR"))
+    price_mask = sum(1 << position for position in (bid_at, offer_at) if position is not None)
+    return bid_at, offer_at, index.get("UTM"), price_mask
+
+
+def _number(value: float | Decimal | str | None) -> float | None:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _side_price(value: PriceValue | None, price: BarPrice) -> float | None:
+    if value is None:
+        return None
+    sides = [getattr(value, side) for side in _SIDES[price]]
+    if None in sides:
+        return None
+    return float(sum(sides)) / len(sides)
+
+
+def _epic(name: str) -> str:
+    parts = name.split(":")
+    return parts[1] if len(parts) > 1 else name
@@ -0,0 +1,117 @@
+"""In-memory TTL and LRU cache for slow-changing reference reads."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from ig_trading_lib._protocol.manifest import OPERATION_MANIFEST, CachePolicy
+from ig_trading_lib.core import IGConfig
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Point-in-time counters for one cached operation."""
+
+    hits: int
+    misses: int
+    entries: int
+
+
+class _OperationCache:
+    def __init__(self, policy: CachePolicy) -> None:
+        self.policy = policy
+        self.entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+
+class ResponseCache:
+    """Serve repeat reads of the operations whose manifest entry declares a cache policy.
+
+    Every policy sets a time to live and a maximum entry count, evicting the least recently
+    used entry when full. A mutation named in a policy's ``invalidated_by`` drops that
+    operation's entries, and ending the session drops everything. Responses are immutable
+    models, so one cache is thread-safe and may be shared by sync and async clients. Clients
+    store entries under their :func:`account_scope`, so clients that log in as different
+    users or select different accounts never read each other's responses.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._operations = {
+            operation_id: _OperationCache(spec.cache)
+            for operation_id, spec in OPERATION_MANIFEST.items()
+            if spec.cache is not None
+        }
+        self._dependents: dict[str, list[_OperationCache]] = {}
+        for operation in self._operations.values():
+            for mutation_id in operation.policy.invalidated_by:
+                self._dependents.setdefault(mutation_id, []).append(operation)
+
+    def get(self, operation_id: str, key: Hashable) -> tuple[Any | None, int]:
+        """Return a fresh cached response, or ``None``, with the generation to store under."""
+        operation = self._operations[operation_id]
+        with self._lock:
+            entry = operation.entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                operation.entries.move_to_end(key)
+                operation.hits += 1
+                return entry[1], operation.generation
+            if entry is not None:
+                del operation.entries[key]
+            operation.misses += 1
+            return None, operation.generation
+
+    def put(self, operation_id: str, key: Hashable, value: Any, generation: int) -> None:
+        """Store a response unless the operation was invalidated while it was being fetched."""
+        operation = self._operations[operation_id]
+        with self._lock:
+            if generation != operation.generation:
+                return
+            operation.entries[key] = (time.monotonic() + operation.policy.ttl_seconds, value)
+            operation.entries.move_to_end(key)
+            while len(operation.entries) > operation.policy.max_entries:
+                operation.entries.popitem(last=False)
+
+    def invalidate(self, mutation_id: str) -> None:
+        """Drop the entries that ``mutation_id`` may have made stale."""
+        spec = OPERATION_MANIFEST[mutation_id]
+        with self._lock:
+            stale = (
+                self._operations.values()
+                if spec.invalidates_session
+                else self._dependents.get(mutation_id, ())
+            )
+            for operation in stale:
+                operation.entries.clear()
+                operation.generation += 1
+
+    def clear(self) -> None:
+        """Drop every cached response while keeping the counters."""
+        with self._lock:
+            for operation in self._operations.values():
+                operation.entries.clear()
+                operation.generation += 1
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Return hit, miss, and entry counts for every cacheable operation."""
+        with self._lock:
+            return {
+                operation_id: CacheStats(
+                    hits=operation.hits,
+                    misses=operation.misses,
+                    entries=len(operation.entries),
+                )
+                for operation_id, operation in self._operations.items()
+            }
+
+
+def account_scope(config: IGConfig) -> tuple[str, str, str | None]:
+    """Return the environment, login, and account whose responses a client may share."""
+    return (config.environment.value, config.credentials.identifier, config.account_id)
@@ -0,0 +1,162 @@
+"""SQLite-backed historical candle cache shared by price-history workflows."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from threading import Lock, local
+
+from ig_trading_lib.operations.markets import PRICE_RESOLUTION_STEPS, PricePoint
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    epic TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    bar_time TEXT NOT NULL,
+    point TEXT NOT NULL,
+    PRIMARY KEY (epic, resolution, bar_time)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    epic TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    PRIMARY KEY (epic, resolution, start_time)
+) WITHOUT ROWID;
+"""
+
+
+class CandleStore:
+    """Persist price bars per epic and resolution together with the ranges already fetched.
+
+    The database runs in WAL mode with one connection per thread, so readers never block
+    each other. Writes for the same epic are serialised in-process.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self._path = str(path)
+        self._local = local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = Lock()
+        self._epic_locks: dict[str, Lock] = {}
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = local()
+
+    def missing(
+        self, epic: str, resolution: str, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        """Return the sub-ranges of ``[start, end]`` not yet fetched from IG."""
+        start, end = _naive_utc(start), _naive_utc(end)
+        rows = self._connection().execute(
+            "SELECT start_time, end_time FROM coverage"
+            " WHERE epic = ? AND resolution = ? AND start_time <= ? AND end_time >= ?"
+            " ORDER BY start_time",
+            (epic, resolution, _time_key(end), _time_key(start)),
+        )
+        gaps = []
+        cursor = start
+        for covered_start, covered_end in rows:
+            covered_from = datetime.fromisoformat(covered_start)
+            if covered_from > cursor:
+                gaps.append((cursor, covered_from))
+            cursor = max(cursor, datetime.fromisoformat(covered_end))
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def read(
+        self, epic: str, resolution: str, start: datetime, end: datetime
+    ) -> tuple[PricePoint, ...]:
+        """Return stored bars inside ``[start, end]`` ordered by bar time."""
+        rows = self._connection().execute(
+            "SELECT point FROM candles"
+            " WHERE epic = ? AND resolution = ? AND bar_time BETWEEN ? AND ?"
+            " ORDER BY bar_time",
+            (epic, resolution, _time_key(start), _time_key(end)),
+        )
+        return tuple(PricePoint.model_validate_json(point) for (point,) in rows)
+
+    def write(
+        self,
+        epic: str,
+        resolution: str,
+        start: datetime,
+        end: datetime,
+        points: Iterable[PricePoint],
+    ) -> None:
+        """Store fetched bars and record ``[start, end]`` as covered.
+
+        A bar still forming at the time of the write is neither stored nor covered, so a
+        later ``missing()`` reports it again until it has closed.
+        """
+        step = PRICE_RESOLUTION_STEPS.get(resolution, timedelta(0))
+        closed_until = _naive_utc(datetime.now(UTC)) - step
+        latest = _time_key(closed_until)
+        rows = [
+            (epic, resolution, bar_time, json.dumps(point.model_dump(mode="json")))
+            for point in points
+            if (bar_time := bar_time_key(point)) is not None and bar_time <= latest
+        ]
+        start, end = _naive_utc(start), min(_naive_utc(end), closed_until)
+        with self._epic_lock(epic), self._connection() as connection:
+            connection.executemany("INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?)", rows)
+            if end <= start:
+                return
+            overlapping = connection.execute(
+                "SELECT start_time, end_time FROM coverage"
+                " WHERE epic = ? AND resolution = ? AND start_time <= ? AND end_time >= ?",
+                (epic, resolution, _time_key(end), _time_key(start)),
+            ).fetchall()
+            merged_start = min([_time_key(start), *(row[0] for row in overlapping)])
+            merged_end = max([_time_key(end), *(row[1] for row in overlapping)])
+            connection.executemany(
+                "DELETE FROM coverage WHERE epic = ? AND resolution = ? AND start_time = ?",
+                [(epic, resolution, row[0]) for row in overlapping],
+            )
+            connection.execute(
+                "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+                (epic, resolution, merged_start, merged_end),
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=30.0, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _epic_lock(self, epic: str) -> Lock:
+        with self._lock:
+            return self._epic_locks.setdefault(epic, Lock())
+
+
+def bar_time_key(point: PricePoint) -> str | None:
+    """Return a sortable ISO-8601 key for a bar, accepting the v2 and v3 timestamp shapes."""
+    value = point.snapshot_time_utc or point.snapshot_time
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("/", "-"))
+    return _time_key(value)
+
+
+def _time_key(value: datetime) -> str:
+    return _naive_utc(value).isoformat(timespec="seconds")
+
+
+def _naive_utc(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(tzinfo=None) if value.tzinfo else value
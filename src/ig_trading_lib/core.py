@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import StrEnum
+from pathlib import Path
+from typing import Literal
 
 
 class Environment(StrEnum):
@@ -32,6 +34,7 @@ class OAuthCredentials:
 
 
 Credentials = SessionCredentials | OAuthCredentials
+JsonDecoder = Literal["msgspec", "orjson", "pydantic", "stdlib"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -41,6 +44,23 @@ class TradingPermit:
     acknowledged: bool = True
 
 
+@dataclass(frozen=True, slots=True)
+class ConnectionPoolConfig:
+    """HTTP connection-pool, protocol, and timeout tuning for the owned HTTP client.
+
+    Timeouts left as ``None`` fall back to ``IGConfig.timeout_seconds``.
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry_seconds: float | None = 5.0
+    http2: bool = False
+    connect_timeout_seconds: float | None = None
+    read_timeout_seconds: float | None = None
+    pool_timeout_seconds: float | None = None
+    prewarm_connections: int = 0
+
+
 @dataclass(frozen=True, slots=True)
 class IGConfig:
     """Immutable configuration for one IG client instance."""
@@ -50,6 +70,10 @@ class IGConfig:
     timeout_seconds: float = 10.0
     max_retries: int = 2
     account_id: str | None = None
+    json_decoder: JsonDecoder = "stdlib"
+    candle_store_path: Path | str | None = None
+    connection_pool: ConnectionPoolConfig = ConnectionPoolConfig()
+    coalesce_reads: bool = False
 
     @property
     def base_url(self) -> str:
@@ -0,0 +1,42 @@
+"""Request lifecycle events for user-supplied profiling and tracing hooks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+RequestEventKind = Literal[
+    "before_send",
+    "after_receive",
+    "retry_scheduled",
+    "token_refresh",
+    "decode_start",
+    "decode_end",
+    "validate_start",
+    "validate_end",
+]
+
+
+# Not frozen: a frozen dataclass costs about twice as much to build on the request path.
+@dataclass(slots=True)
+class RequestEvent:
+    """One step of an operation call, passed to every hook registered on the client.
+
+    ``at`` is a ``time.perf_counter()`` reading taken when the step happened.
+    ``elapsed_seconds`` is the network time for ``after_receive``, the planned back-off for
+    ``retry_scheduled``, the refresh time for ``token_refresh``, and the phase duration for
+    ``decode_end`` and ``validate_end``. ``correlation_id`` is the ``X-CORRELATION-ID`` sent
+    to IG and is ``None`` only before the transport assigns it.
+    """
+
+    kind: RequestEventKind
+    operation_id: str
+    correlation_id: str | None
+    at: float
+    attempt: int = 0
+    elapsed_seconds: float | None = None
+    status_code: int | None = None
+
+
+RequestHook = Callable[[RequestEvent], None]
@@ -0,0 +1,353 @@
+"""In-process latency and throughput metrics for manifest operations."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import time
+from collections import Counter
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Literal
+
+from ig_trading_lib.hooks import RequestEvent, RequestEventKind, RequestHook
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("queue", "network", "decode", "validate", "total")
+_SUB_BUCKET_BITS = 3
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_MAX_EXPONENT = 36
+_QUANTILES = (0.5, 0.9, 0.99)
+_PHASE_EVENTS: dict[str, tuple[RequestEventKind, RequestEventKind]] = {
+    "decode": ("decode_start", "decode_end"),
+    "validate": ("validate_start", "validate_end"),
+}
+
+
+@dataclass(slots=True)
+class RequestObservation:
+    """Timings and outcome of one operation call, filled in by the transport and executor.
+
+    Queue time covers session authentication and rate-limiter waits. Network time covers
+    every attempt, including retried ones. Each step is also passed to ``hooks`` as a
+    :class:`~ig_trading_lib.hooks.RequestEvent`.
+    """
+
+    operation_id: str
+    queue_seconds: float = 0.0
+    network_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    validate_seconds: float = 0.0
+    retries: int = 0
+    status_code: int | None = None
+    correlation_id: str | None = None
+    hooks: tuple[RequestHook, ...] = ()
+    _mark: float = field(default_factory=time.perf_counter, repr=False)
+
+    def sending(self) -> None:
+        """Close a queue interval and open a network one."""
+        self._mark, started = time.perf_counter(), self._mark
+        self.queue_seconds += self._mark - started
+        if self.hooks:
+            self._emit("before_send", self._mark)
+
+    def answered(self, status_code: int | None) -> None:
+        """Close a network interval; anything until the next send counts as queue time."""
+        self._mark, started = time.perf_counter(), self._mark
+        self.network_seconds += self._mark - started
+        self.status_code = status_code
+        if self.hooks:
+            self._emit("after_receive", self._mark, self._mark - started)
+
+    def retrying(self, delay_seconds: float) -> None:
+        if self.hooks:
+            self._emit("retry_scheduled", time.perf_counter(), delay_seconds)
+
+    def refreshed(self, started: float) -> None:
+        if self.hooks:
+            now = time.perf_counter()
+            self._emit("token_refresh", now, now - started)
+
+    def phase(self, name: Literal["decode", "validate"]) -> _Phase:
+        """Time a decode or validate step, announcing its start and end to the hooks."""
+        return _Phase(self, name)
+
+    def _emit(self, kind: RequestEventKind, at: float, elapsed: float | None = None) -> None:
+        event = RequestEvent(
+            kind,
+            self.operation_id,
+            self.correlation_id,
+            at,
+            self.retries,
+            elapsed,
+            self.status_code,
+        )
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Request hook %r failed on %s.", hook, kind)
+
+
+class _Phase(AbstractContextManager[None]):
+    __slots__ = ("_observation", "_name", "_started")
+
+    def __init__(self, observation: RequestObservation, name: Literal["decode", "validate"]):
+        self._observation = observation
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+        if self._observation.hooks:
+            self._observation._emit(_PHASE_EVENTS[self._name][0], self._started)
+
+    def __exit__(self, *_: object) -> None:
+        ended = time.perf_counter()
+        elapsed = ended - self._started
+        observation = self._observation
+        if self._name == "decode":
+            observation.decode_seconds += elapsed
+        else:
+            observation.validate_seconds += elapsed
+        if observation.hooks:
+            observation._emit(_PHASE_EVENTS[self._name][1], ended, elapsed)
+
+
+class LatencyHistogram:
+    """Log-linear microsecond histogram with eight buckets per power of two, as in HDR.
+
+    Recorded values keep about 12.5% relative precision from one microsecond up to several
+    hours, in a fixed 280-bucket array.
+    """
+
+    __slots__ = ("counts", "count", "total_seconds", "max_seconds")
+
+    def __init__(self) -> None:
+        self.counts = [0] * ((_MAX_EXPONENT - _SUB_BUCKET_BITS + 2) * _SUB_BUCKETS)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[_bucket(max(0, int(seconds * 1_000_000)))] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding the ``q`` quantile, in seconds."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(q * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(_upper_micros(index) / 1_000_000, self.max_seconds)
+        return self.max_seconds
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseStats:
+    """Latency summary for one phase of one operation, in seconds."""
+
+    count: int
+    total: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+@dataclass(frozen=True, slots=True)
+class OperationMetrics:
+    """Point-in-time counters and latency summaries for one manifest operation."""
+
+    requests: int
+    retries: int
+    status_classes: dict[str, int]
+    phases: dict[str, PhaseStats]
+
+
+class _Operation:
+    __slots__ = ("requests", "retries", "status_classes", "histograms")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.status_classes: Counter[str] = Counter()
+        self.histograms = {phase: LatencyHistogram() for phase in PHASES}
+
+
+class MetricsRegistry:
+    """Collect request counts, status classes, retries and phase latencies per operation.
+
+    Pass one registry to ``IG`` or ``AsyncIG`` through ``metrics=``; it is thread-safe and
+    may be shared by several clients. Operations are keyed by manifest id, such as
+    ``markets.get``. Export with :meth:`prometheus_text` or :meth:`bind_opentelemetry`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._operations: dict[str, _Operation] = {}
+        self._instruments: dict[str, Any] | None = None
+
+    def record(self, observation: RequestObservation, total_seconds: float) -> None:
+        """Add one completed or failed operation call."""
+        status_class = _status_class(observation.status_code)
+        durations = {
+            "queue": observation.queue_seconds,
+            "network": observation.network_seconds,
+            "decode": observation.decode_seconds,
+            "validate": observation.validate_seconds,
+            "total": total_seconds,
+        }
+        with self._lock:
+            operation = self._operations.get(observation.operation_id)
+            if operation is None:
+                operation = self._operations[observation.operation_id] = _Operation()
+            operation.requests += 1
+            operation.retries += observation.retries
+            operation.status_classes[status_class] += 1
+            for phase, seconds in durations.items():
+                operation.histograms[phase].record(seconds)
+            instruments = self._instruments
+        if instruments is not None:
+            _export(instruments, observation, status_class, durations)
+
+    def snapshot(self) -> dict[str, OperationMetrics]:
+        """Return counters and p50, p90 and p99 latencies for every observed operation."""
+        with self._lock:
+            return {
+                operation_id: OperationMetrics(
+                    requests=operation.requests,
+                    retries=operation.retries,
+                    status_classes=dict(operation.status_classes),
+                    phases={
+                        phase: _phase_stats(histogram)
+                        for phase, histogram in operation.histograms.items()
+                    },
+                )
+                for operation_id, operation in sorted(self._operations.items())
+            }
+
+    def reset(self) -> None:
+        """Forget every observation."""
+        with self._lock:
+            self._operations.clear()
+
+    def prometheus_text(self, prefix: str = "ig") -> str:
+        """Render the registry in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_requests_total Operation calls by manifest id and status class.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        for operation_id, metrics in snapshot.items():
+            for status_class, count in sorted(metrics.status_classes.items()):
+                labels = f'operation="{operation_id}",status_class="{status_class}"'
+                lines.append(f"{prefix}_requests_total{{{labels}}} {count}")
+        lines += [
+            f"# HELP {prefix}_retries_total Retried attempts by manifest id.",
+            f"# TYPE {prefix}_retries_total counter",
+        ]
+        lines += [
+            f'{prefix}_retries_total{{operation="{operation_id}"}} {metrics.retries}'
+            for operation_id, metrics in snapshot.items()
+        ]
+        lines += [
+            f"# HELP {prefix}_latency_seconds Operation latency by manifest id and phase.",
+            f"# TYPE {prefix}_latency_seconds summary",
+        ]
+        for operation_id, metrics in snapshot.items():
+            for phase, stats in metrics.phases.items():
+                labels = f'operation="{operation_id}",phase="{phase}"'
+                for quantile, value in zip(
+                    _QUANTILES, (stats.p50, stats.p90, stats.p99), strict=True
+                ):
+                    lines.append(
+                        f'{prefix}_latency_seconds{{{labels},quantile="{quantile}"}} {value:.6f}'
+                    )
+                lines.append(f"{prefix}_latency_seconds_sum{{{labels}}} {stats.total:.6f}")
+                lines.append(f"{prefix}_latency_seconds_count{{{labels}}} {stats.count}")
+        return "\n".join(lines) + "\n"
+
+    def bind_opentelemetry(self, meter: Any = None) -> None:
+        """Also record every later observation into OpenTelemetry instruments.
+
+        Uses ``meter``, or the ``ig_trading_lib`` meter of the global provider, which needs
+        the optional ``opentelemetry-api`` package.
+        """
+        if meter is None:
+            meter = _opentelemetry_metrics().get_meter("ig_trading_lib")
+        instruments = {
+            "requests": meter.create_counter(
+                "ig.requests", unit="{request}", description="Operation calls."
+            ),
+            "retries": meter.create_counter(
+                "ig.retries", unit="{retry}", description="Retried attempts."
+            ),
+            "latency": meter.create_histogram(
+                "ig.latency", unit="s", description="Operation latency by phase."
+            ),
+        }
+        with self._lock:
+            self._instruments = instruments
+
+
+def _bucket(micros: int) -> int:
+    if micros < _SUB_BUCKETS:
+        return micros
+    exponent = min(micros.bit_length() - 1, _MAX_EXPONENT)
+    shift = exponent - _SUB_BUCKET_BITS
+    sub_bucket = (micros >> shift) & (_SUB_BUCKETS - 1) if exponent < _MAX_EXPONENT else 7
+    return (shift + 1) * _SUB_BUCKETS + sub_bucket
+
+
+def _upper_micros(index: int) -> int:
+    if index < _SUB_BUCKETS:
+        return index + 1
+    shift = index // _SUB_BUCKETS - 1
+    return (_SUB_BUCKETS + index % _SUB_BUCKETS + 1) << shift
+
+
+def _phase_stats(histogram: LatencyHistogram) -> PhaseStats:
+    return PhaseStats(
+        count=histogram.count,
+        total=histogram.total_seconds,
+        p50=histogram.quantile(0.5),
+        p90=histogram.quantile(0.9),
+        p99=histogram.quantile(0.99),
+        max=histogram.max_seconds,
+    )
+
+
+def _status_class(status_code: int | None) -> str:
+    return "error" if status_code is None else f"{status_code // 100}xx"
+
+
+def _export(
+    instruments: dict[str, Any],
+    observation: RequestObservation,
+    status_class: str,
+    durations: dict[str, float],
+) -> None:
+    operation = {"ig.operation": observation.operation_id}
+    instruments["requests"].add(1, {**operation, "ig.status_class": status_class})
+    if observation.retries:
+        instruments["retries"].add(observation.retries, operation)
+    for phase, seconds in durations.items():
+        instruments["latency"].record(seconds, {**operation, "ig.phase": phase})
+
+
+def _opentelemetry_metrics() -> Any:
+    try:
+        return importlib.import_module("opentelemetry.metrics")
+    except ImportError as error:
+        raise ImportError(
+            "MetricsRegistry.bind_opentelemetry() requires the optional 'opentelemetry-api' "
+            "package, or pass a meter explicitly."
+        ) from error
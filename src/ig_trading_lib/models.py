@@ -3,31 +3,88 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
+from threading import Lock
+from types import MappingProxyType
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, ConfigDict, ValidationInfo, model_validator
 
 _WORD_BOUNDARY = re.compile(r"(.)([A-Z][a-z]+)")
 _ACRONYM_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_NORMALIZED_WIRE_KEYS = "ig_normalized_wire_keys"
+NORMALIZED_WIRE_CONTEXT = MappingProxyType({_NORMALIZED_WIRE_KEYS: True})
+_KEY_TABLE_SIZE = 4_096
 Item = TypeVar("Item")
 
 
-def to_snake_case(value: str) -> str:
-    """Convert an IG camelCase key to the canonical public snake_case key."""
+class _KeyTable:
+    """Bounded, thread-safe memo of interned wire-key translations."""
+
+    __slots__ = ("_convert", "_lock", "_maxsize", "_values")
+
+    def __init__(self, convert: Callable[[str], str], maxsize: int) -> None:
+        self._convert = convert
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self._values: dict[str, str] = {}
+
+    def __call__(self, key: str) -> str:
+        value = self._values.get(key)
+        if value is not None:
+            return value
+        value = sys.intern(self._convert(key))
+        if len(self._values) >= self._maxsize:
+            return value
+        with self._lock:
+            if len(self._values) < self._maxsize:
+                value = self._values.setdefault(sys.intern(key), value)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+def _snake_case(value: str) -> str:
     words = _WORD_BOUNDARY.sub(r"\1_\2", value.replace("-", "_"))
     return _ACRONYM_BOUNDARY.sub(r"\1_\2", words).lower()
 
 
-def to_camel_case(value: str) -> str:
-    """Convert a public snake_case field to an IG camelCase wire key."""
+def _camel_case(value: str) -> str:
     first, *rest = value.split("_")
     return first + "".join(part.capitalize() for part in rest)
 
 
+_SNAKE_CASE_KEYS = _KeyTable(_snake_case, _KEY_TABLE_SIZE)
+_CAMEL_CASE_KEYS = _KeyTable(_camel_case, _KEY_TABLE_SIZE)
+
+
+def to_snake_case(value: str) -> str:
+    """Convert an IG camelCase key to the canonical public snake_case key."""
+    return _SNAKE_CASE_KEYS(value)
+
+
+def to_camel_case(value: str) -> str:
+    """Convert a public snake_case field to an IG camelCase wire key."""
+    return _CAMEL_CASE_KEYS(value)
+
+
+def _seed_wire_keys(field_names: Iterable[str]) -> None:
+    for name in field_names:
+        to_snake_case(name)
+        to_snake_case(to_camel_case(name))
+
+
+def wire_validation_context() -> dict[str, bool]:
+    """Return a one-call context that normalises keys only at the outermost model."""
+    return {_NORMALIZED_WIRE_KEYS: False}
+
+
 def normalize_wire_value(value: Any) -> Any:
     """Recursively normalise provider response keys without changing values."""
     if isinstance(value, dict):
@@ -42,9 +99,20 @@ class IGModel(BaseModel):
 
     model_config = ConfigDict(extra="allow", frozen=True)
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        if cls.__module__.startswith("ig_trading_lib."):
+            _seed_wire_keys(cls.model_fields)
+
     @model_validator(mode="before")
     @classmethod
-    def normalize_wire_keys(cls, value: Any) -> Any:
+    def normalize_wire_keys(cls, value: Any, info: ValidationInfo) -> Any:
+        context = info.context
+        if context is not None and _NORMALIZED_WIRE_KEYS in context:
+            if context[_NORMALIZED_WIRE_KEYS]:
+                return value
+            context[_NORMALIZED_WIRE_KEYS] = True
         return normalize_wire_value(value)
 
 
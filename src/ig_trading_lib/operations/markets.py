@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from array import array
+from datetime import UTC, datetime, timedelta, tzinfo
 from decimal import Decimal
 from typing import Literal
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from ig_trading_lib._protocol.executor import AsyncExecutor, SyncExecutor
 from ig_trading_lib.models import IGModel, IGRequest
@@ -263,6 +264,99 @@ class PricesResponse(IGModel):
     allowance: PriceAllowance | None = None
 
 
+_PRICE_SIDES = ("open", "high", "low", "close")
+
+
+class PriceColumnsResponse(IGModel):
+    """Historical prices as contiguous float64 columns instead of one model per bar.
+
+    Build one from a price response with :meth:`from_prices`. Every column is an
+    ``array('d')`` of equal length that supports the buffer protocol, so
+    ``memoryview(column)`` and ``numpy.frombuffer(column)`` share its memory. Absent
+    provider values are ``nan``; ``timestamp`` holds UTC epoch seconds.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    timestamp: array
+    open_bid: array
+    open_ask: array
+    high_bid: array
+    high_ask: array
+    low_bid: array
+    low_ask: array
+    close_bid: array
+    close_ask: array
+    last_traded_volume: array
+    instrument_type: str | None = None
+    metadata: PriceMetadata | None = None
+    allowance: PriceAllowance | None = None
+
+    @classmethod
+    def from_prices(
+        cls, response: PricesResponse, *, tz: tzinfo | None = None
+    ) -> PriceColumnsResponse:
+        """Pack the bars of a price response, timed as :func:`bar_epoch_seconds` reads them."""
+        columns = {
+            name: array("d")
+            for name, field in cls.model_fields.items()
+            if field.annotation is array
+        }
+        timestamps = columns["timestamp"].append
+        volumes = columns["last_traded_volume"].append
+        sides = tuple(
+            (f"{side}_price", columns[f"{side}_bid"].append, columns[f"{side}_ask"].append)
+            for side in _PRICE_SIDES
+        )
+        for point in response.prices:
+            timestamps(bar_epoch_seconds(point, tz))
+            volumes(_column_value(point.last_traded_volume))
+            for field, bids, asks in sides:
+                price = getattr(point, field)
+                bids(_column_value(None if price is None else price.bid))
+                asks(_column_value(None if price is None else price.ask))
+        return cls(
+            **columns,
+            instrument_type=response.instrument_type,
+            metadata=response.metadata,
+            allowance=response.allowance,
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def columns(self) -> dict[str, memoryview]:
+        """Return zero-copy views of every numeric column keyed by field name."""
+        return {
+            name: memoryview(value)
+            for name, value in self.__dict__.items()
+            if isinstance(value, array)
+        }
+
+
+def bar_epoch_seconds(point: PricePoint, tz: tzinfo | None = None) -> float:
+    """Return when a bar opened as UTC epoch seconds, or ``nan`` when that is unknown.
+
+    v3 points carry ``snapshotTimeUTC``. v2 points carry only ``snapshotTime``, which is in
+    the account's time zone, so it is read only when ``tz`` names that zone.
+    """
+    if point.snapshot_time_utc:
+        return _epoch_seconds(point.snapshot_time_utc, UTC)
+    if tz is None or not point.snapshot_time:
+        return float("nan")
+    return _epoch_seconds(point.snapshot_time, tz)
+
+
+def _epoch_seconds(value: datetime | str, tz: tzinfo) -> float:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("/", "-"))
+    return (value if value.tzinfo else value.replace(tzinfo=tz)).timestamp()
+
+
+def _column_value(value: Decimal | float | None) -> float:
+    return float("nan") if value is None else float(value)
+
+
 PriceResolution = Literal[
     "DAY",
     "HOUR",
@@ -280,6 +374,24 @@ PriceResolution = Literal[
     "SECOND",
     "WEEK",
 ]
+_DEFAULT_PRICE_POINTS = 10
+PRICE_RESOLUTION_STEPS: dict[str, timedelta] = {
+    "SECOND": timedelta(seconds=1),
+    "MINUTE": timedelta(minutes=1),
+    "MINUTE_2": timedelta(minutes=2),
+    "MINUTE_3": timedelta(minutes=3),
+    "MINUTE_5": timedelta(minutes=5),
+    "MINUTE_10": timedelta(minutes=10),
+    "MINUTE_15": timedelta(minutes=15),
+    "MINUTE_30": timedelta(minutes=30),
+    "HOUR": timedelta(hours=1),
+    "HOUR_2": timedelta(hours=2),
+    "HOUR_3": timedelta(hours=3),
+    "HOUR_4": timedelta(hours=4),
+    "DAY": timedelta(days=1),
+    "WEEK": timedelta(weeks=1),
+    "MONTH": timedelta(days=31),
+}
 
 
 class PricesQuery(IGRequest):
@@ -399,6 +511,7 @@ class PricesOperations:
             PricesResponse,
             path={"epic": epic},
             query=query.to_wire() if query else None,
+            data_points=_query_points(query),
         )
 
     def list_points(self, epic: str, resolution: str, num_points: int) -> PricesResponse:
@@ -406,6 +519,7 @@ class PricesOperations:
             "prices.list_points",
             PricesResponse,
             path={"epic": epic, "resolution": resolution, "num_points": str(num_points)},
+            data_points=num_points,
         )
 
     def list_date_range(
@@ -420,6 +534,7 @@ class PricesOperations:
                 "start_date": _date_time(start_date),
                 "end_date": _date_time(end_date),
             },
+            data_points=_range_points(resolution, start_date, end_date),
         )
 
 
@@ -433,6 +548,7 @@ class AsyncPricesOperations:
             PricesResponse,
             path={"epic": epic},
             query=query.to_wire() if query else None,
+            data_points=_query_points(query),
         )
 
     async def list_points(self, epic: str, resolution: str, num_points: int) -> PricesResponse:
@@ -440,6 +556,7 @@ class AsyncPricesOperations:
             "prices.list_points",
             PricesResponse,
             path={"epic": epic, "resolution": resolution, "num_points": str(num_points)},
+            data_points=num_points,
         )
 
     async def list_date_range(
@@ -454,6 +571,7 @@ class AsyncPricesOperations:
                 "start_date": _date_time(start_date),
                 "end_date": _date_time(end_date),
             },
+            data_points=_range_points(resolution, start_date, end_date),
         )
 
 
@@ -472,3 +590,29 @@ def _validate_epics(epics: tuple[str, ...]) -> None:
 
 def _date_time(value: datetime | str) -> str:
     return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _query_points(query: PricesQuery | None) -> int:
+    """Estimate the historical data points one v3 price page consumes."""
+    if query is None:
+        return _DEFAULT_PRICE_POINTS
+    points = query.max_points
+    if points is None and query.from_date is not None and query.to_date is not None:
+        points = _range_points(query.resolution, query.from_date, query.to_date)
+    points = points or _DEFAULT_PRICE_POINTS
+    return min(points, query.page_size) if query.page_size else points
+
+
+def _range_points(resolution: str, start: datetime | str, end: datetime | str) -> int:
+    step = PRICE_RESOLUTION_STEPS.get(resolution)
+    try:
+        span = _as_datetime(end) - _as_datetime(start)
+    except (TypeError, ValueError):
+        return 0
+    if step is None or span < timedelta(0):
+        return 0
+    return span // step + 1
+
+
+def _as_datetime(value: datetime | str) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
 
 from ig_trading_lib.streaming import (
     AsyncStreamingClient,
+    PriceTick,
     StreamingClient,
     StreamSubscription,
     StreamUpdate,
+    TickNumbers,
 )
 
 
@@ -19,6 +21,21 @@ class StreamingOperations:
     def subscribe(self, subscription: StreamSubscription) -> Iterator[StreamUpdate]:
         return self._client.iter_updates(subscription)
 
+    def subscribe_batches(self, subscription: StreamSubscription) -> Iterator[list[StreamUpdate]]:
+        return self._client.iter_update_batches(subscription)
+
+    def subscribe_ticks(
+        self, subscription: StreamSubscription, *, numbers: TickNumbers = "float"
+    ) -> Iterator[PriceTick]:
+        return self._client.iter_ticks(subscription, numbers=numbers)
+
+    def listen(
+        self,
+        subscription: StreamSubscription,
+        on_event: Callable[[StreamUpdate | Exception], None],
+    ) -> Callable[[], None]:
+        return self._client.listen(subscription, on_event)
+
     def close(self) -> None:
         self._client.close()
 
@@ -30,5 +47,22 @@ class AsyncStreamingOperations:
     def subscribe(self, subscription: StreamSubscription) -> AsyncIterator[StreamUpdate]:
         return self._client.aiter_updates(subscription)
 
+    def subscribe_batches(
+        self, subscription: StreamSubscription
+    ) -> AsyncIterator[list[StreamUpdate]]:
+        return self._client.aiter_update_batches(subscription)
+
+    def subscribe_ticks(
+        self, subscription: StreamSubscription, *, numbers: TickNumbers = "float"
+    ) -> AsyncIterator[PriceTick]:
+        return self._client.aiter_ticks(subscription, numbers=numbers)
+
+    async def listen(
+        self,
+        subscription: StreamSubscription,
+        on_event: Callable[[StreamUpdate | Exception], None],
+    ) -> Callable[[], None]:
+        return await self._client.listen(subscription, on_event)
+
     async def close(self) -> None:
         await self._client.close()
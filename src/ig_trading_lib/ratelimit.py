@@ -0,0 +1,194 @@
+"""Client-side token buckets that keep requests inside IG's published allowances."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Literal
+
+from ig_trading_lib.errors import RateLimitError
+
+RateLimitBucket = Literal["trading", "reads", "app_reads", "price_points"]
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitStats:
+    """Point-in-time counters for one bucket."""
+
+    queue_depth: int
+    acquired: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class _TokenBucket:
+    def __init__(self, capacity: float, period_seconds: float) -> None:
+        self._capacity = capacity
+        self._per_second = capacity / period_seconds
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = Lock()
+        self._queue_depth = 0
+        self._acquired = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def reserve(self, cost: float, max_wait: float | None) -> float | None:
+        """Take ``cost`` tokens now and return how long the caller must wait for them.
+
+        Returns ``None`` and takes nothing when the wait would exceed ``max_wait``.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._per_second)
+            self._updated = now
+            tokens = self._tokens - min(cost, self._capacity)
+            wait = max(0.0, -tokens / self._per_second)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens = tokens
+            self._acquired += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            if wait:
+                self._queue_depth += 1
+            return wait
+
+    def refund(self, cost: float) -> None:
+        """Return the tokens of a reservation whose request will never be sent."""
+        with self._lock:
+            self._tokens = min(self._capacity, self._tokens + min(cost, self._capacity))
+            self._acquired -= 1
+
+    def release_queue_slot(self) -> None:
+        with self._lock:
+            self._queue_depth -= 1
+
+    def stats(self) -> RateLimitStats:
+        with self._lock:
+            return RateLimitStats(
+                queue_depth=self._queue_depth,
+                acquired=self._acquired,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+            )
+
+
+class RateLimiter:
+    """Queue requests until IG's trading, read, and historical-price allowances permit them.
+
+    The defaults are IG's published quotas: per account, 100 trades and 30 reads a minute
+    and 10,000 price points a week, and per application 60 reads a minute. Every read takes
+    a token from both read buckets. A bucket set to ``None`` is not limited. A request that
+    would wait longer than ``max_wait_seconds`` raises ``RateLimitError`` without taking any
+    tokens, and a request cancelled while it waits gives its tokens back.
+
+    One limiter is thread-safe and may be shared by several clients that use the same
+    account, sync or async. Limiters for other accounts of the same application pass it as
+    ``app`` so that all of them draw on one application read bucket.
+    """
+
+    def __init__(
+        self,
+        *,
+        trading_per_minute: float | None = 100,
+        reads_per_minute: float | None = 30,
+        app_reads_per_minute: float | None = 60,
+        price_points_per_week: float | None = 10_000,
+        max_wait_seconds: float | None = 300.0,
+        app: RateLimiter | None = None,
+    ) -> None:
+        limits: dict[RateLimitBucket, tuple[float | None, float]] = {
+            "trading": (trading_per_minute, 60.0),
+            "reads": (reads_per_minute, 60.0),
+            "app_reads": (app_reads_per_minute, 60.0),
+            "price_points": (price_points_per_week, 7 * 24 * 3600.0),
+        }
+        self._buckets: dict[RateLimitBucket, _TokenBucket] = {
+            name: _TokenBucket(capacity, period)
+            for name, (capacity, period) in limits.items()
+            if capacity is not None
+        }
+        if app is not None:
+            self._buckets.pop("app_reads", None)
+            if (shared := app._buckets.get("app_reads")) is not None:
+                self._buckets["app_reads"] = shared
+        self._max_wait = max_wait_seconds
+
+    def acquire(self, bucket: RateLimitBucket, cost: float = 1) -> None:
+        """Block the calling thread until ``cost`` tokens are available."""
+        if not (reserved := self._reserve(bucket, cost)):
+            return
+        wait, buckets, queued = reserved
+        try:
+            time.sleep(wait)
+        except BaseException:
+            _refund(buckets, cost)
+            raise
+        finally:
+            _release(queued)
+
+    async def acquire_async(self, bucket: RateLimitBucket, cost: float = 1) -> None:
+        """Suspend the calling task until ``cost`` tokens are available."""
+        if not (reserved := self._reserve(bucket, cost)):
+            return
+        wait, buckets, queued = reserved
+        try:
+            await asyncio.sleep(wait)
+        except BaseException:
+            _refund(buckets, cost)
+            raise
+        finally:
+            _release(queued)
+
+    def stats(self) -> dict[RateLimitBucket, RateLimitStats]:
+        """Return queue depth and accumulated wait time for every limited bucket."""
+        return {name: bucket.stats() for name, bucket in self._buckets.items()}
+
+    def _reserve(
+        self, bucket: RateLimitBucket, cost: float
+    ) -> tuple[float, list[_TokenBucket], list[_TokenBucket]] | None:
+        """Reserve ``cost`` in every bucket the request draws on, or raise if one cannot.
+
+        Returns the wait with the buckets reserved and those the caller now queues in, or
+        ``None`` when the request may be sent at once.
+        """
+        if cost <= 0:
+            return None
+        names = _APP_BUCKETS.get(bucket, (bucket,))
+        reserved: list[tuple[_TokenBucket, float]] = []
+        for name in names:
+            if (limited := self._buckets.get(name)) is None:
+                continue
+            wait = limited.reserve(cost, self._max_wait)
+            if wait is None:
+                _refund([one for one, _ in reserved], cost)
+                _release([one for one, waited in reserved if waited])
+                raise RateLimitError(
+                    f"The {name} allowance cannot admit this request within"
+                    f" {self._max_wait:g} seconds.",
+                    details={"bucket": name, "cost": cost},
+                )
+            reserved.append((limited, wait))
+        wait = max((waited for _, waited in reserved), default=0.0)
+        if not wait:
+            return None
+        return wait, [one for one, _ in reserved], [one for one, waited in reserved if waited]
+
+
+_APP_BUCKETS: dict[RateLimitBucket, tuple[RateLimitBucket, ...]] = {
+    "reads": ("reads", "app_reads"),
+}
+
+
+def _refund(buckets: list[_TokenBucket], cost: float) -> None:
+    for bucket in buckets:
+        bucket.refund(cost)
+
+
+def _release(buckets: list[_TokenBucket]) -> None:
+    for bucket in buckets:
+        bucket.release_queue_slot()
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterator, Mapping
+from contextlib import aclosing
 from dataclasses import dataclass
+from decimal import Decimal
 from queue import Empty, Full, Queue
-from threading import Lock, Thread
-from typing import Any, Literal
+from threading import Condition, Event, Lock, Thread
+from typing import Any, Literal, TypeAlias
 
 from ig_trading_lib.core import StreamingSession
 from ig_trading_lib.errors import (
@@ -15,14 +20,23 @@ from ig_trading_lib.errors import (
     StreamingDataLossError,
     StreamingSubscriptionError,
 )
+from ig_trading_lib.models import normalize_wire_value
+
+logger = logging.getLogger(__name__)
 
 StreamMode = Literal["MERGE", "DISTINCT"]
+TickNumbers = Literal["float", "decimal"]
 _Event = "StreamUpdate | Exception"
 
 
 @dataclass(frozen=True, slots=True)
 class StreamSubscription:
-    """Declarative request for one IG Lightstreamer subscription."""
+    """Declarative request for one IG Lightstreamer subscription.
+
+    With ``conflate=True`` a ``MERGE`` iterator keeps only the newest state of each item
+    while the consumer is busy, so a slow consumer skips intermediate updates instead of
+    overflowing the local buffer.
+    """
 
     key: str
     mode: StreamMode
@@ -31,6 +45,7 @@ class StreamSubscription:
     data_adapter: str | None = None
     snapshot: bool = True
     max_frequency: str | float | None = None
+    conflate: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -45,26 +60,174 @@ class StreamUpdate:
     is_snapshot: bool
 
 
+def trade_payload(update: StreamUpdate, field: str) -> dict[str, Any] | None:
+    """Decode a JSON ``TRADE`` field such as ``OPU`` or ``CONFIRMS`` into snake_case keys.
+
+    Only a field this update changed is read, because the SDK repeats stale values in
+    ``fields``; ``None`` means it did not change. Invalid JSON raises ``ValueError``.
+    """
+    value = update.changed_fields.get(field)
+    if not value:
+        return None
+    return normalize_wire_value(json.loads(value))
+
+
+# IG price, chart and account fields whose values are numbers; every other field stays text.
+_NUMERIC_FIELDS = frozenset(
+    {
+        "BID", "OFFER", "OFR", "HIGH", "LOW", "MID_OPEN", "CHANGE", "CHANGE_PCT", "MARKET_DELAY",
+        "LTP", "LTV", "TTV", "UTM", "DAY_OPEN_MID", "DAY_NET_CHG_MID", "DAY_PERC_CHG_MID",
+        "DAY_HIGH", "DAY_LOW", "BID_OPEN", "BID_HIGH", "BID_LOW", "BID_CLOSE", "OFR_OPEN",
+        "OFR_HIGH", "OFR_LOW", "OFR_CLOSE", "LTP_OPEN", "LTP_HIGH", "LTP_LOW", "LTP_CLOSE",
+        "CONS_END", "CONS_TICK_COUNT", "PNL", "PNL_LR", "PNL_NLR", "DEPOSIT", "AVAILABLE_CASH",
+        "FUNDS", "MARGIN", "MARGIN_LR", "MARGIN_NLR", "AVAILABLE_TO_DEAL", "EQUITY",
+        "EQUITY_USED",
+    }
+)  # fmt: skip
+
+
+class PriceTick:
+    """A typed stream update whose values follow the order of ``StreamSubscription.fields``.
+
+    Numeric IG fields such as ``BID`` and ``OFFER`` are parsed once, on the SDK thread, into
+    ``float`` or ``Decimal``; text fields such as ``UPDATE_TIME`` stay strings and empty
+    values become ``None``. Only changed fields are parsed; the others are carried over from
+    the item's previous tick. Bit ``i`` of ``changed_mask`` is set when ``fields[i]``
+    changed. Read a value with ``tick["BID"]``.
+    """
+
+    __slots__ = (
+        "subscription_key",
+        "item_name",
+        "item_position",
+        "values",
+        "changed_mask",
+        "is_snapshot",
+        "_layout",
+    )
+
+    def __init__(
+        self,
+        subscription_key: str,
+        item_name: str | None,
+        item_position: int,
+        values: tuple[float | Decimal | str | None, ...],
+        changed_mask: int,
+        is_snapshot: bool,
+        layout: _TickLayout,
+    ) -> None:
+        self.subscription_key = subscription_key
+        self.item_name = item_name
+        self.item_position = item_position
+        self.values = values
+        self.changed_mask = changed_mask
+        self.is_snapshot = is_snapshot
+        self._layout = layout
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return self._layout.fields
+
+    @property
+    def changed_fields(self) -> tuple[str, ...]:
+        """Names of the fields whose bit is set in ``changed_mask``."""
+        fields = self._layout.fields
+        return tuple(fields[i] for i in range(len(fields)) if self.changed_mask >> i & 1)
+
+    def __getitem__(self, field: str) -> float | Decimal | str | None:
+        return self.values[self._layout.index[field]]
+
+    def is_changed(self, field: str) -> bool:
+        return bool(self.changed_mask >> self._layout.index[field] & 1)
+
+    def __repr__(self) -> str:
+        values = dict(zip(self._layout.fields, self.values, strict=True))
+        return (
+            f"PriceTick({self.subscription_key!r}, {self.item_name!r}, {values!r}, "
+            f"changed={self.changed_fields!r}, is_snapshot={self.is_snapshot!r})"
+        )
+
+    def _merged(self, previous: PriceTick) -> PriceTick:
+        return PriceTick(
+            self.subscription_key,
+            self.item_name,
+            self.item_position,
+            self.values,
+            previous.changed_mask | self.changed_mask,
+            previous.is_snapshot and self.is_snapshot,
+            self._layout,
+        )
+
+    def _relabel(self, key: str, *, is_snapshot: bool) -> PriceTick:
+        mask = self._layout.all_changed if is_snapshot else self.changed_mask
+        return PriceTick(
+            key, self.item_name, self.item_position, self.values, mask, is_snapshot, self._layout
+        )
+
+
+class _TickLayout:
+    """Field positions and parsers for one upstream subscription, resolved before any tick."""
+
+    __slots__ = ("fields", "index", "all_changed", "_parsers", "_previous")
+
+    def __init__(self, fields: tuple[str, ...], numbers: TickNumbers) -> None:
+        parse = float if numbers == "float" else Decimal
+        self.fields = fields
+        self.index = {name: position for position, name in enumerate(fields)}
+        self.all_changed = (1 << len(fields)) - 1
+        self._parsers = tuple(parse if name in _NUMERIC_FIELDS else None for name in fields)
+        self._previous: dict[int, tuple[float | Decimal | str | None, ...]] = {}
+
+    def decode(self, update: Any, key: str) -> PriceTick:
+        """Parse the changed fields from the SDK's positional map, without copying dicts."""
+        position = update.getItemPos()
+        previous = self._previous.get(position)
+        if previous is None:
+            raw = update.getFieldsByPosition()
+            mask = self.all_changed
+            values = [self._parse(index, raw.get(index + 1)) for index in range(len(self.fields))]
+        else:
+            mask = 0
+            values = list(previous)
+            for field_position, text in update.getChangedFieldsByPosition().items():
+                index = field_position - 1
+                mask |= 1 << index
+                values[index] = self._parse(index, text)
+        decoded = self._previous[position] = tuple(values)
+        return PriceTick(
+            key, update.getItemName(), position, decoded, mask, update.isSnapshot(), self
+        )
+
+    def _parse(self, index: int, text: str | None) -> float | Decimal | str | None:
+        if not text:
+            return None
+        parse = self._parsers[index]
+        return text if parse is None else parse(text)
+
+
+_Item: TypeAlias = "StreamUpdate | PriceTick"
+
+
 @dataclass(slots=True)
 class _ActiveSubscription:
-    subscription: Any
+    upstream: _FanOut
     sink: _Sink
 
 
 class _Sink:
-    def deliver(self, event: StreamUpdate | Exception) -> None:
+    def deliver(self, event: _Item | Exception) -> None:
         raise NotImplementedError
 
-    def get(self) -> StreamUpdate | Exception:
+    def get(self) -> _Item | Exception:
         raise NotImplementedError
 
 
 class _SyncSink(_Sink):
     def __init__(self, maxsize: int) -> None:
-        self._queue: Queue[StreamUpdate | Exception] = Queue(maxsize=maxsize)
+        self._queue: Queue[_Item | Exception] = Queue(maxsize=maxsize)
         self._failure: StreamingDataLossError | None = None
 
-    def deliver(self, event: StreamUpdate | Exception) -> None:
+    def deliver(self, event: _Item | Exception) -> None:
         try:
             self._queue.put_nowait(event)
         except Full:
@@ -72,7 +235,7 @@ class _SyncSink(_Sink):
                 "Streaming consumer fell behind the configured local buffer."
             )
 
-    def get(self) -> StreamUpdate | Exception:
+    def get(self) -> _Item | Exception:
         while True:
             if self._failure is not None:
                 raise self._failure
@@ -85,13 +248,13 @@ class _SyncSink(_Sink):
 class _AsyncSink(_Sink):
     def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
         self._loop = loop
-        self._queue: asyncio.Queue[StreamUpdate | Exception] = asyncio.Queue(maxsize=maxsize)
+        self._queue: asyncio.Queue[_Item | Exception] = asyncio.Queue(maxsize=maxsize)
         self._failure: StreamingDataLossError | None = None
 
-    def deliver(self, event: StreamUpdate | Exception) -> None:
+    def deliver(self, event: _Item | Exception) -> None:
         self._loop.call_soon_threadsafe(self._put, event)
 
-    def _put(self, event: StreamUpdate | Exception) -> None:
+    def _put(self, event: _Item | Exception) -> None:
         if self._queue.full():
             self._failure = StreamingDataLossError(
                 "Streaming consumer fell behind the configured local buffer."
@@ -99,10 +262,10 @@ class _AsyncSink(_Sink):
             return
         self._queue.put_nowait(event)
 
-    def get(self) -> StreamUpdate | Exception:
+    def get(self) -> _Item | Exception:
         raise RuntimeError("Async stream sinks must be awaited.")
 
-    async def get_async(self) -> StreamUpdate | Exception:
+    async def get_async(self) -> _Item | Exception:
         if self._failure is not None:
             raise self._failure
         event = await self._queue.get()
@@ -111,13 +274,304 @@ class _AsyncSink(_Sink):
         return event
 
 
+class _Conflation:
+    """Newest merged update per item position, in the order items first became pending."""
+
+    __slots__ = ("_pending", "_errors")
+
+    def __init__(self) -> None:
+        self._pending: OrderedDict[int, _Item] = OrderedDict()
+        self._errors: list[Exception] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._errors or self._pending)
+
+    def add(self, event: _Item | Exception) -> None:
+        if isinstance(event, Exception):
+            self._errors.append(event)
+            return
+        previous = self._pending.get(event.item_position)
+        if isinstance(event, PriceTick) and isinstance(previous, PriceTick):
+            event = event._merged(previous)
+        elif isinstance(event, StreamUpdate) and isinstance(previous, StreamUpdate):
+            event = StreamUpdate(
+                subscription_key=event.subscription_key,
+                item_name=event.item_name,
+                item_position=event.item_position,
+                fields=event.fields,
+                changed_fields={**previous.changed_fields, **event.changed_fields},
+                is_snapshot=previous.is_snapshot and event.is_snapshot,
+            )
+        self._pending[event.item_position] = event
+
+    def take(self) -> _Item | Exception:
+        """Return a stream error first, since it ends the iterator, then the oldest item."""
+        if self._errors:
+            return self._errors.pop(0)
+        return self._pending.popitem(last=False)[1]
+
+
+class _ConflatingSyncSink(_Sink):
+    def __init__(self) -> None:
+        self._conflation = _Conflation()
+        self._ready = Condition()
+
+    def deliver(self, event: _Item | Exception) -> None:
+        with self._ready:
+            self._conflation.add(event)
+            self._ready.notify()
+
+    def get(self) -> _Item | Exception:
+        with self._ready:
+            while not self._conflation:
+                self._ready.wait(timeout=0.1)
+            return self._conflation.take()
+
+
+class _ConflatingAsyncSink(_Sink):
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._conflation = _Conflation()
+        self._lock = Lock()
+        self._ready = asyncio.Event()
+        self._signalled = False
+
+    def deliver(self, event: _Item | Exception) -> None:
+        # Merge on the SDK thread and wake the loop once per batch, so a busy loop never
+        # accumulates one callback per update.
+        with self._lock:
+            self._conflation.add(event)
+            wake, self._signalled = not self._signalled, True
+        if wake:
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    def get(self) -> _Item | Exception:
+        raise RuntimeError("Async stream sinks must be awaited.")
+
+    async def get_async(self) -> _Item | Exception:
+        while True:
+            with self._lock:
+                if self._conflation:
+                    return self._conflation.take()
+                self._signalled = False
+                self._ready.clear()
+            await self._ready.wait()
+
+
+class _RingSink(_Sink):
+    """Single-producer ring buffer drained in batches.
+
+    The SDK callback thread only writes a slot and advances ``_written``; the consumer only
+    advances ``_read``. Each counter has a single writer, so the GIL is the only
+    synchronisation needed on the hot path. The consumer is woken at most once per batch:
+    the producer signals only after the consumer has announced, through ``_waiting``, that
+    it found the buffer empty.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._slots: list[Any] = [None] * capacity
+        self._capacity = capacity
+        self._written = 0
+        self._read = 0
+        self._failure: Exception | None = None
+        self._waiting = False
+
+    def deliver(self, event: _Item | Exception) -> None:
+        if isinstance(event, Exception):
+            self._fail(event)
+        elif self._written - self._read >= self._capacity:
+            self._fail(
+                StreamingDataLossError("Streaming consumer fell behind the configured ring buffer.")
+            )
+        else:
+            self._slots[self._written % self._capacity] = event
+            self._written += 1
+        if self._waiting:
+            self._waiting = False
+            self._wake()
+
+    def get(self) -> _Item | Exception:
+        raise RuntimeError("Ring stream sinks are drained in batches.")
+
+    def _fail(self, failure: Exception) -> None:
+        if self._failure is None:
+            self._failure = failure
+
+    def _wake(self) -> None:
+        raise NotImplementedError
+
+    def _drain(self) -> list[StreamUpdate] | None:
+        """Take every written update, or announce that the consumer is about to wait."""
+        written = self._written
+        count = written - self._read
+        if not count:
+            if self._failure is not None:
+                raise self._failure
+            self._waiting = True
+            # The producer may have written between the read above and the flag.
+            if self._written == written and self._failure is None:
+                return None
+            self._waiting = False
+            return self._drain()
+        start = self._read % self._capacity
+        end = start + count
+        if end <= self._capacity:
+            batch = self._slots[start:end]
+        else:
+            batch = self._slots[start:] + self._slots[: end - self._capacity]
+        self._read = written
+        return batch
+
+
+class _SyncRingSink(_RingSink):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._ready = Event()
+
+    def _wake(self) -> None:
+        self._ready.set()
+
+    def get_batch(self) -> list[StreamUpdate]:
+        while True:
+            self._ready.clear()
+            batch = self._drain()
+            if batch is not None:
+                return batch
+            self._ready.wait(timeout=0.1)
+
+
+class _AsyncRingSink(_RingSink):
+    def __init__(self, loop: asyncio.AbstractEventLoop, capacity: int) -> None:
+        super().__init__(capacity)
+        self._loop = loop
+        self._ready = asyncio.Event()
+
+    def _wake(self) -> None:
+        self._loop.call_soon_threadsafe(self._ready.set)
+
+    async def get_batch_async(self) -> list[StreamUpdate]:
+        while True:
+            self._ready.clear()
+            batch = self._drain()
+            if batch is not None:
+                return batch
+            await self._ready.wait()
+
+
+class _CallbackSink(_Sink):
+    def __init__(self, on_event: Callable[[Any], None]) -> None:
+        self._on_event = on_event
+
+    def deliver(self, event: _Item | Exception) -> None:
+        self._on_event(event)
+
+    def get(self) -> _Item | Exception:
+        raise RuntimeError("Callback stream sinks push events and cannot be read.")
+
+
+class _FanOut(_Sink):
+    """One SDK subscription shared by every local consumer with the same items and fields.
+
+    Each consumer keeps its own sink, and so its own backpressure policy. Members are held
+    in a tuple replaced on join and leave, so the SDK thread builds each update once and
+    never iterates a list that is being changed. ``MERGE`` fan-outs keep the newest update
+    of each item so that a consumer joining later can start from a snapshot.
+    """
+
+    def __init__(
+        self, specification: StreamSubscription, numbers: TickNumbers | None, subscription: Any
+    ) -> None:
+        self.specification = specification
+        self.numbers: TickNumbers | None = numbers
+        self.subscription = subscription
+        self.failed = False
+        self._lock = Lock()
+        self._members: tuple[tuple[str, _Sink], ...] = ()
+        self._latest: dict[int, _Item] = {}
+
+    def join(self, key: str, sink: _Sink, *, replay: bool) -> None:
+        with self._lock:
+            if replay:
+                for update in self._latest.values():
+                    sink.deliver(_relabel(update, key, is_snapshot=True))
+            self._members += ((key, sink),)
+
+    def leave(self, sink: _Sink) -> bool:
+        """Remove ``sink`` and return whether it was the last consumer."""
+        with self._lock:
+            self._members = tuple(member for member in self._members if member[1] is not sink)
+            return not self._members
+
+    def deliver(self, event: _Item | Exception) -> None:
+        with self._lock:
+            if isinstance(event, StreamingSubscriptionError):
+                self.failed = True
+            elif not isinstance(event, Exception) and self.specification.mode == "MERGE":
+                self._latest[event.item_position] = event
+            members = self._members
+        for key, sink in members:
+            if isinstance(event, Exception) or key == event.subscription_key:
+                item = event
+            else:
+                item = _relabel(event, key, is_snapshot=event.is_snapshot)
+            # One failing consumer, such as a raising listen() callback, must not starve the
+            # others of this update.
+            try:
+                sink.deliver(item)
+            except Exception:
+                logger.exception("Stream consumer %r failed to accept an event.", key)
+
+    def get(self) -> _Item | Exception:
+        raise RuntimeError("Fan-out sinks push events to their consumers and cannot be read.")
+
+
+def _relabel(update: _Item, key: str, *, is_snapshot: bool) -> _Item:
+    if isinstance(update, PriceTick):
+        return update._relabel(key, is_snapshot=is_snapshot)
+    return StreamUpdate(
+        subscription_key=key,
+        item_name=update.item_name,
+        item_position=update.item_position,
+        fields=update.fields,
+        changed_fields=update.fields if is_snapshot else update.changed_fields,
+        is_snapshot=is_snapshot,
+    )
+
+
+def _share_key(
+    specification: StreamSubscription, numbers: TickNumbers | None = None
+) -> tuple[Any, ...] | None:
+    """Return what identical upstream subscriptions have in common, or ``None``.
+
+    A ``DISTINCT`` snapshot cannot be replayed to a later consumer, so such subscriptions
+    are never shared.
+    """
+    if specification.mode == "DISTINCT" and specification.snapshot:
+        return None
+    return (
+        specification.mode,
+        specification.items,
+        specification.fields,
+        specification.data_adapter,
+        specification.snapshot,
+        specification.max_frequency,
+        numbers,
+    )
+
+
 class _SubscriptionListener:
-    def __init__(self, specification: StreamSubscription, sink: _Sink) -> None:
+    def __init__(
+        self, specification: StreamSubscription, sink: _Sink, layout: _TickLayout | None = None
+    ) -> None:
         self._specification = specification
         self._sink = sink
+        self._layout = layout
 
     def onItemUpdate(self, update: Any) -> None:
         """Copy the SDK callback payload before returning to its event thread."""
+        if self._layout is not None:
+            self._deliver_tick(update, self._layout)
+            return
         self._sink.deliver(
             StreamUpdate(
                 subscription_key=self._specification.key,
@@ -129,6 +583,18 @@ class _SubscriptionListener:
             )
         )
 
+    def _deliver_tick(self, update: Any, layout: _TickLayout) -> None:
+        try:
+            tick = layout.decode(update, self._specification.key)
+        except (ValueError, ArithmeticError) as error:
+            failure = StreamingDataLossError(
+                f"Could not decode an update for {update.getItemName()}: {error}"
+            )
+            failure.__cause__ = error
+            self._sink.deliver(failure)
+            return
+        self._sink.deliver(tick)
+
     def onSubscriptionError(self, code: int, message: str) -> None:
         self._sink.deliver(
             StreamingSubscriptionError(f"IG rejected stream subscription {code}: {message}")
@@ -156,7 +622,11 @@ class _ConnectionListener:
 
 
 class StreamingClient:
-    """Adapt Lightstreamer's callback API into synchronous and asynchronous iterators."""
+    """Adapt Lightstreamer's callback API into synchronous and asynchronous iterators.
+
+    Subscriptions with the same mode, items, fields, adapter, snapshot and frequency share
+    one upstream Lightstreamer subscription, which is removed when its last consumer stops.
+    """
 
     def __init__(
         self,
@@ -174,13 +644,65 @@ class StreamingClient:
         self._queue_size = queue_size
         self._client: Any | None = None
         self._active: list[_ActiveSubscription] = []
+        self._upstreams: dict[tuple[Any, ...], _FanOut] = {}
         self._lock = Lock()
         self._recovery_started = False
 
     def iter_updates(self, subscription: StreamSubscription) -> Iterator[StreamUpdate]:
         """Yield updates until the caller closes the iterator or a typed stream error occurs."""
-        sink = _SyncSink(self._queue_size)
+        return self._iterate(subscription, None)
+
+    def aiter_updates(self, subscription: StreamSubscription) -> AsyncGenerator[StreamUpdate, None]:
+        """Yield updates on the current event loop without blocking the SDK callback thread."""
+        return self._aiterate(subscription, None)
+
+    def iter_ticks(
+        self, subscription: StreamSubscription, *, numbers: TickNumbers = "float"
+    ) -> Iterator[PriceTick]:
+        """Yield :class:`PriceTick` records parsed once on the SDK thread.
+
+        Typed and untyped consumers of the same items do not share an upstream subscription.
+        """
+        return self._iterate(subscription, numbers)
+
+    def aiter_ticks(
+        self, subscription: StreamSubscription, *, numbers: TickNumbers = "float"
+    ) -> AsyncGenerator[PriceTick, None]:
+        """Yield :class:`PriceTick` records on the current event loop."""
+        return self._aiterate(subscription, numbers)
+
+    def iter_update_batches(self, subscription: StreamSubscription) -> Iterator[list[StreamUpdate]]:
+        """Yield every update received since the previous batch, oldest first.
+
+        Updates are written to a ring of ``queue_size`` slots; more than that many unread
+        updates raise :class:`StreamingDataLossError`.
+        """
+        sink = _SyncRingSink(_ring_capacity(subscription, self._queue_size))
+        active = self._start(subscription, sink)
+        try:
+            while True:
+                yield sink.get_batch()
+        finally:
+            self._stop(active)
+
+    async def aiter_update_batches(
+        self, subscription: StreamSubscription
+    ) -> AsyncGenerator[list[StreamUpdate], None]:
+        """Yield update batches on the current event loop, waking it at most once per batch."""
+        loop = asyncio.get_running_loop()
+        sink = _AsyncRingSink(loop, _ring_capacity(subscription, self._queue_size))
         active = self._start(subscription, sink)
+        try:
+            while True:
+                yield await sink.get_batch_async()
+        finally:
+            self._stop(active)
+
+    def _iterate(
+        self, subscription: StreamSubscription, numbers: TickNumbers | None
+    ) -> Iterator[Any]:
+        sink = _ConflatingSyncSink() if _conflated(subscription) else _SyncSink(self._queue_size)
+        active = self._start(subscription, sink, numbers)
         try:
             while True:
                 event = sink.get()
@@ -190,10 +712,16 @@ class StreamingClient:
         finally:
             self._stop(active)
 
-    async def aiter_updates(self, subscription: StreamSubscription) -> AsyncIterator[StreamUpdate]:
-        """Yield updates on the current event loop without blocking the SDK callback thread."""
-        sink = _AsyncSink(asyncio.get_running_loop(), self._queue_size)
-        active = self._start(subscription, sink)
+    async def _aiterate(
+        self, subscription: StreamSubscription, numbers: TickNumbers | None
+    ) -> AsyncGenerator[Any, None]:
+        loop = asyncio.get_running_loop()
+        sink = (
+            _ConflatingAsyncSink(loop)
+            if _conflated(subscription)
+            else _AsyncSink(loop, self._queue_size)
+        )
+        active = self._start(subscription, sink, numbers)
         try:
             while True:
                 event = await sink.get_async()
@@ -203,6 +731,25 @@ class StreamingClient:
         finally:
             self._stop(active)
 
+    def listen(
+        self,
+        subscription: StreamSubscription,
+        on_event: Callable[[StreamUpdate | Exception], None],
+    ) -> Callable[[], None]:
+        """Call ``on_event`` on the SDK thread for every update or stream error.
+
+        Nothing is queued, so ``on_event`` must return quickly. The returned function
+        unsubscribes.
+        """
+        active = self._start(subscription, _CallbackSink(on_event))
+        return lambda: self._stop(active)
+
+    @property
+    def connected(self) -> bool:
+        """Whether a Lightstreamer connection is open for the active subscriptions."""
+        with self._lock:
+            return self._client is not None
+
     def close(self) -> None:
         """Unsubscribe all active streams and close the Lightstreamer connection."""
         with self._lock:
@@ -215,23 +762,40 @@ class StreamingClient:
         if client is not None:
             client.disconnect()
 
-    def _start(self, specification: StreamSubscription, sink: _Sink) -> _ActiveSubscription:
+    def _start(
+        self, specification: StreamSubscription, sink: _Sink, numbers: TickNumbers | None = None
+    ) -> _ActiveSubscription:
         client = self._connect_if_needed()
-        sdk_subscription = self._subscription_factory(
-            specification.mode,
-            list(specification.items),
-            list(specification.fields),
-        )
-        listener = _SubscriptionListener(specification, sink)
-        sdk_subscription.addListener(listener)
+        share_key = _share_key(specification, numbers)
+        with self._lock:
+            upstream = self._upstreams.get(share_key) if share_key is not None else None
+            if upstream is not None and not upstream.failed:
+                upstream.join(specification.key, sink, replay=specification.snapshot)
+                active = _ActiveSubscription(upstream, sink)
+                self._active.append(active)
+                return active
+            upstream = _FanOut(
+                specification,
+                numbers,
+                self._subscription_factory(
+                    specification.mode,
+                    list(specification.items),
+                    list(specification.fields),
+                ),
+            )
+            upstream.join(specification.key, sink, replay=False)
+            if share_key is not None:
+                self._upstreams[share_key] = upstream
+            active = _ActiveSubscription(upstream, sink)
+            self._active.append(active)
+        sdk_subscription = upstream.subscription
+        layout = None if numbers is None else _TickLayout(specification.fields, numbers)
+        sdk_subscription.addListener(_SubscriptionListener(specification, upstream, layout))
         if specification.data_adapter is not None:
             sdk_subscription.setDataAdapter(specification.data_adapter)
         sdk_subscription.setRequestedSnapshot(specification.snapshot)
         if specification.max_frequency is not None:
             sdk_subscription.setRequestedMaxFrequency(str(specification.max_frequency))
-        active = _ActiveSubscription(sdk_subscription, sink)
-        with self._lock:
-            self._active.append(active)
         client.subscribe(sdk_subscription)
         return active
 
@@ -240,12 +804,22 @@ class StreamingClient:
             if active not in self._active:
                 return
             self._active.remove(active)
+            upstream = active.upstream
+            last_consumer = upstream.leave(active.sink)
+            share_key = _share_key(upstream.specification, upstream.numbers)
+            if (
+                last_consumer
+                and share_key is not None
+                and self._upstreams.get(share_key) is upstream
+            ):
+                del self._upstreams[share_key]
             client = self._client
             should_disconnect = disconnect_when_idle and not self._active
             if should_disconnect:
                 self._client = None
         if client is not None:
-            client.unsubscribe(active.subscription)
+            if last_consumer:
+                client.unsubscribe(upstream.subscription)
             if should_disconnect:
                 client.disconnect()
 
@@ -295,6 +869,18 @@ class StreamingClient:
             self._recovery_started = False
 
 
+def _conflated(subscription: StreamSubscription) -> bool:
+    if subscription.conflate and subscription.mode != "MERGE":
+        raise ValueError("conflate requires a MERGE subscription")
+    return subscription.conflate
+
+
+def _ring_capacity(subscription: StreamSubscription, queue_size: int) -> int:
+    if subscription.conflate:
+        raise ValueError("conflated subscriptions are read with iter_updates or aiter_updates")
+    return queue_size
+
+
 def _default_client_factory(endpoint: str, adapter_set: str | None) -> Any:
     from lightstreamer.client import LightstreamerClient
 
@@ -308,7 +894,12 @@ def _default_subscription_factory(mode: str, items: list[str], fields: list[str]
 
 
 class AsyncStreamingClient:
-    """Asynchronous streaming facade using the same callback bridge as the sync client."""
+    """Asynchronous streaming facade sharing one Lightstreamer connection across subscriptions.
+
+    Every subscription keeps its own sink, so one consumer's backpressure or subscription
+    error does not affect the others. The connection opens with the first subscription,
+    closes when the last one ends, and is reauthenticated once for all of them.
+    """
 
     def __init__(
         self,
@@ -322,32 +913,72 @@ class AsyncStreamingClient:
         self._refresh_session_provider = refresh_session_provider
         self._client_factory = client_factory
         self._subscription_factory = subscription_factory
-        self._delegates: list[StreamingClient] = []
+        self._delegate: StreamingClient | None = None
+        self._session: StreamingSession | None = None
+        self._connecting = asyncio.Lock()
 
     async def aiter_updates(self, subscription: StreamSubscription) -> AsyncIterator[StreamUpdate]:
         """Yield one subscription's updates without blocking the event loop."""
-        loop = asyncio.get_running_loop()
-        initial_session = await self._session_provider()
-        delegate = StreamingClient(
-            session_provider=lambda: initial_session,
-            refresh_session_provider=lambda: asyncio.run_coroutine_threadsafe(
-                self._get_refreshed_session(), loop
-            ).result(),
-            client_factory=self._client_factory,
-            subscription_factory=self._subscription_factory,
-        )
-        self._delegates.append(delegate)
-        try:
-            async for update in delegate.aiter_updates(subscription):
+        delegate = await self._connection()
+        async with aclosing(delegate.aiter_updates(subscription)) as updates:
+            async for update in updates:
                 yield update
-        finally:
-            delegate.close()
-            self._delegates.remove(delegate)
+
+    async def aiter_ticks(
+        self, subscription: StreamSubscription, *, numbers: TickNumbers = "float"
+    ) -> AsyncIterator[PriceTick]:
+        """Yield one subscription's :class:`PriceTick` records without blocking the event loop."""
+        delegate = await self._connection()
+        async with aclosing(delegate.aiter_ticks(subscription, numbers=numbers)) as ticks:
+            async for tick in ticks:
+                yield tick
+
+    async def aiter_update_batches(
+        self, subscription: StreamSubscription
+    ) -> AsyncIterator[list[StreamUpdate]]:
+        """Yield one subscription's updates in batches without blocking the event loop."""
+        delegate = await self._connection()
+        async with aclosing(delegate.aiter_update_batches(subscription)) as batches:
+            async for batch in batches:
+                yield batch
+
+    async def listen(
+        self,
+        subscription: StreamSubscription,
+        on_event: Callable[[StreamUpdate | Exception], None],
+    ) -> Callable[[], None]:
+        """Call ``on_event`` on the SDK thread, not the event loop, for every event."""
+        delegate = await self._connection()
+        return delegate.listen(subscription, on_event)
 
     async def close(self) -> None:
-        """Close all Lightstreamer delegates created by this async facade."""
-        for delegate in tuple(self._delegates):
-            delegate.close()
+        """Unsubscribe all active streams and close the shared Lightstreamer connection."""
+        if self._delegate is not None:
+            self._delegate.close()
+
+    async def _connection(self) -> StreamingClient:
+        """Return the shared delegate with a session ready for its next connect."""
+        async with self._connecting:
+            if self._delegate is None:
+                loop = asyncio.get_running_loop()
+                self._delegate = StreamingClient(
+                    session_provider=self._current_session,
+                    refresh_session_provider=lambda: asyncio.run_coroutine_threadsafe(
+                        self._get_refreshed_session(), loop
+                    ).result(),
+                    client_factory=self._client_factory,
+                    subscription_factory=self._subscription_factory,
+                )
+            if not self._delegate.connected:
+                # The delegate connects synchronously on this loop, so the session is
+                # fetched here rather than from inside its session provider.
+                self._session = await self._session_provider()
+            return self._delegate
+
+    def _current_session(self) -> StreamingSession:
+        if self._session is None:
+            raise AuthenticationError("IG streaming session was not prepared before connecting.")
+        return self._session
 
     async def _get_refreshed_session(self) -> StreamingSession:
         return await self._refresh_session_provider()
@@ -6,6 +6,8 @@ import asyncio
 import logging
 import time
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import dataclass, field
 from threading import RLock
 from typing import Any
@@ -29,6 +31,8 @@ from ig_trading_lib.errors import (
     ResourceNotFoundError,
     TransportError,
 )
+from ig_trading_lib.metrics import RequestObservation
+from ig_trading_lib.ratelimit import RateLimitBucket, RateLimiter
 
 logger = logging.getLogger(__name__)
 _SAFE_METHODS = frozenset({"GET", "HEAD"})
@@ -59,9 +63,16 @@ class SessionTokens:
 class SyncTransport:
     """Authenticated synchronous transport with conservative retry semantics."""
 
-    def __init__(self, config: IGConfig, *, http_client: httpx.Client | None = None) -> None:
+    def __init__(
+        self,
+        config: IGConfig,
+        *,
+        http_client: httpx.Client | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         self._config = config
-        self._http = http_client or httpx.Client(timeout=config.timeout_seconds)
+        self._http = http_client or httpx.Client(**_client_options(config))
+        self._rate_limiter = rate_limiter
         self._owns_http_client = http_client is None
         self._tokens: SessionTokens | None = None
         self._token_lock = RLock()
@@ -75,6 +86,15 @@ class SyncTransport:
         """Discard local authentication after a successful remote logout."""
         self._tokens = None
 
+    def prewarm(self) -> None:
+        """Open the configured number of pooled connections before the first request."""
+        connections = self._config.connection_pool.prewarm_connections
+        if connections <= 0:
+            return
+        with ThreadPoolExecutor(connections, thread_name_prefix="ig-prewarm") as pool:
+            for _ in range(connections):
+                pool.submit(self._open_connection)
+
     def request(
         self,
         method: str,
@@ -83,14 +103,32 @@ class SyncTransport:
         version: int,
         params: Mapping[str, Any] | None = None,
         json: Mapping[str, Any] | None = None,
+        mutation: bool | None = None,
+        data_points: int = 0,
+        observation: RequestObservation | None = None,
     ) -> httpx.Response:
         """Send an authenticated request without retrying a possible mutation."""
         normalized_method = method.upper()
         operation_id = str(uuid4())
+        bucket = _rate_limit_bucket(normalized_method, mutation)
+        tokens, started = self._tokens, 0.0
+        if observation is not None:
+            observation.correlation_id = operation_id
+            started = time.perf_counter()
         self._ensure_authenticated()
+        if observation is not None and self._tokens is not tokens:
+            observation.refreshed(started)
         attempts = 1 + self._config.max_retries if normalized_method in _SAFE_METHODS else 1
         refresh_attempted = False
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire("price_points", data_points)
         for attempt in range(attempts):
+            if observation is not None:
+                observation.retries = attempt
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(bucket)
+            if observation is not None:
+                observation.sending()
             try:
                 response = self._send(
                     normalized_method,
@@ -101,29 +139,39 @@ class SyncTransport:
                     operation_id=operation_id,
                 )
             except httpx.RequestError as error:
+                if observation is not None:
+                    observation.answered(None)
                 if normalized_method not in _SAFE_METHODS:
                     raise AmbiguousExecutionError(
                         "IG may have accepted the mutation before the network failure.",
                         operation_id=operation_id,
                     ) from error
                 if attempt + 1 < attempts:
+                    if observation is not None:
+                        observation.retrying(_retry_delay(None, attempt))
                     self._wait_for_retry(None, attempt)
                     continue
                 raise TransportError(
                     "A network failure prevented IG from answering the request.",
                     operation_id=operation_id,
                 ) from error
-
+            if observation is not None:
+                observation.answered(response.status_code)
             if response.status_code < 400:
                 self._log_response(response, normalized_method, path, attempt, operation_id)
                 return response
             if self._can_refresh_after_unauthorized(response, normalized_method, refresh_attempted):
+                started = time.perf_counter()
                 self._refresh_oauth_tokens(
                     expected_access_token=_access_token_from_headers(response.request.headers)
                 )
+                if observation is not None:
+                    observation.refreshed(started)
                 refresh_attempted = True
                 continue
             if self._should_retry(response, attempt, attempts):
+                if observation is not None:
+                    observation.retrying(_retry_delay(response, attempt))
                 self._wait_for_retry(response, attempt)
                 continue
             self._raise_for_response(response, operation_id=operation_id)
@@ -324,6 +372,10 @@ class SyncTransport:
     def _url(self, path: str) -> str:
         return f"{self._config.base_url}{path if path.startswith('/') else f'/{path}'}"
 
+    def _open_connection(self) -> None:
+        with suppress(httpx.HTTPError):
+            self._http.head(self._config.base_url)
+
     def _can_refresh_after_unauthorized(
         self, response: httpx.Response, method: str, refresh_attempted: bool
     ) -> bool:
@@ -362,9 +414,16 @@ class SyncTransport:
 class AsyncTransport:
     """Authenticated asynchronous transport matching :class:`SyncTransport`."""
 
-    def __init__(self, config: IGConfig, *, http_client: httpx.AsyncClient | None = None) -> None:
+    def __init__(
+        self,
+        config: IGConfig,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         self._config = config
-        self._http = http_client or httpx.AsyncClient(timeout=config.timeout_seconds)
+        self._http = http_client or httpx.AsyncClient(**_client_options(config))
+        self._rate_limiter = rate_limiter
         self._owns_http_client = http_client is None
         self._tokens: SessionTokens | None = None
         self._token_lock = asyncio.Lock()
@@ -378,6 +437,11 @@ class AsyncTransport:
         """Discard local authentication after a successful remote logout."""
         self._tokens = None
 
+    async def prewarm(self) -> None:
+        """Open the configured number of pooled connections before the first request."""
+        connections = self._config.connection_pool.prewarm_connections
+        await asyncio.gather(*(self._open_connection() for _ in range(connections)))
+
     async def request(
         self,
         method: str,
@@ -386,14 +450,32 @@ class AsyncTransport:
         version: int,
         params: Mapping[str, Any] | None = None,
         json: Mapping[str, Any] | None = None,
+        mutation: bool | None = None,
+        data_points: int = 0,
+        observation: RequestObservation | None = None,
     ) -> httpx.Response:
         """Send an authenticated request without retrying a possible mutation."""
         normalized_method = method.upper()
         operation_id = str(uuid4())
+        bucket = _rate_limit_bucket(normalized_method, mutation)
+        tokens, started = self._tokens, 0.0
+        if observation is not None:
+            observation.correlation_id = operation_id
+            started = time.perf_counter()
         await self._ensure_authenticated()
+        if observation is not None and self._tokens is not tokens:
+            observation.refreshed(started)
         attempts = 1 + self._config.max_retries if normalized_method in _SAFE_METHODS else 1
         refresh_attempted = False
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async("price_points", data_points)
         for attempt in range(attempts):
+            if observation is not None:
+                observation.retries = attempt
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async(bucket)
+            if observation is not None:
+                observation.sending()
             try:
                 headers = self._headers(version, operation_id)
                 response = await self._http.request(
@@ -404,29 +486,42 @@ class AsyncTransport:
                     headers=headers,
                 )
             except httpx.RequestError as error:
+                if observation is not None:
+                    observation.answered(None)
                 if normalized_method not in _SAFE_METHODS:
                     raise AmbiguousExecutionError(
                         "IG may have accepted the mutation before the network failure.",
                         operation_id=operation_id,
                     ) from error
                 if attempt + 1 < attempts:
-                    await asyncio.sleep(_retry_delay(None, attempt))
+                    delay = _retry_delay(None, attempt)
+                    if observation is not None:
+                        observation.retrying(delay)
+                    await asyncio.sleep(delay)
                     continue
                 raise TransportError(
                     "A network failure prevented IG from answering the request.",
                     operation_id=operation_id,
                 ) from error
+            if observation is not None:
+                observation.answered(response.status_code)
             if response.status_code < 400:
                 _log_response(response, normalized_method, path, attempt, operation_id)
                 return response
             if self._can_refresh_after_unauthorized(response, normalized_method, refresh_attempted):
+                started = time.perf_counter()
                 await self._refresh_oauth_tokens(
                     expected_access_token=_access_token_from_headers(headers)
                 )
+                if observation is not None:
+                    observation.refreshed(started)
                 refresh_attempted = True
                 continue
             if self._should_retry(response, attempt, attempts):
-                await asyncio.sleep(_retry_delay(response, attempt))
+                delay = _retry_delay(response, attempt)
+                if observation is not None:
+                    observation.retrying(delay)
+                await asyncio.sleep(delay)
                 continue
             _raise_for_response(response, operation_id=operation_id)
         raise AssertionError("Retry loop must return or raise.")
@@ -535,6 +630,10 @@ class AsyncTransport:
     def _url(self, path: str) -> str:
         return _url(self._config, path)
 
+    async def _open_connection(self) -> None:
+        with suppress(httpx.HTTPError):
+            await self._http.head(self._config.base_url)
+
     def _can_refresh_after_unauthorized(
         self, response: httpx.Response, method: str, refresh_attempted: bool
     ) -> bool:
@@ -644,6 +743,34 @@ def _authentication_version(credentials: SessionCredentials | OAuthCredentials)
     return 3 if isinstance(credentials, OAuthCredentials) else 2
 
 
+def _rate_limit_bucket(method: str, mutation: bool | None) -> RateLimitBucket:
+    if mutation is None:
+        mutation = method not in _SAFE_METHODS
+    return "trading" if mutation else "reads"
+
+
+def _client_options(config: IGConfig) -> dict[str, Any]:
+    pool = config.connection_pool
+    return {
+        "timeout": httpx.Timeout(
+            config.timeout_seconds,
+            connect=_timeout(pool.connect_timeout_seconds, config),
+            read=_timeout(pool.read_timeout_seconds, config),
+            pool=_timeout(pool.pool_timeout_seconds, config),
+        ),
+        "limits": httpx.Limits(
+            max_connections=pool.max_connections,
+            max_keepalive_connections=pool.max_keepalive_connections,
+            keepalive_expiry=pool.keepalive_expiry_seconds,
+        ),
+        "http2": pool.http2,
+    }
+
+
+def _timeout(value: float | None, config: IGConfig) -> float:
+    return config.timeout_seconds if value is None else value
+
+
 def _url(config: IGConfig, path: str) -> str:
     return f"{config.base_url}{path if path.startswith('/') else f'/{path}'}"
 
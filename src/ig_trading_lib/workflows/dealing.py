@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from threading import Condition
+from typing import Generic, TypeVar
 
 from ig_trading_lib.errors import DealConfirmationError, IGError
 from ig_trading_lib.operations.dealing import (
@@ -19,93 +26,423 @@ from ig_trading_lib.operations.dealing import (
     PositionsOperations,
     WorkingOrdersOperations,
 )
+from ig_trading_lib.operations.streaming import AsyncStreamingOperations, StreamingOperations
+from ig_trading_lib.streaming import StreamSubscription, StreamUpdate, trade_payload
+
+logger = logging.getLogger(__name__)
+
+_Waiter = asyncio.Future[DealConfirmationResponse | None]
+
+
+@dataclass(frozen=True, slots=True)
+class PositionAmendment:
+    """One position amendment in a batch."""
+
+    deal_id: str
+    request: AmendPositionRequest
+
+
+@dataclass(frozen=True, slots=True)
+class WorkingOrderAmendment:
+    """One working-order amendment in a batch."""
+
+    deal_id: str
+    request: AmendWorkingOrderRequest
+
+
+@dataclass(frozen=True, slots=True)
+class WorkingOrderCancellation:
+    """One working-order cancellation in a batch."""
+
+    deal_id: str
+
+
+PositionDeal = CreatePositionRequest | ClosePositionRequest | PositionAmendment
+WorkingOrderDeal = CreateWorkingOrderRequest | WorkingOrderAmendment | WorkingOrderCancellation
+Deal = TypeVar("Deal", PositionDeal, WorkingOrderDeal)
+
+
+@dataclass(frozen=True, slots=True)
+class DealOutcome(Generic[Deal]):
+    """The confirmation or the error for the batch entry at ``index``.
+
+    ``error`` is a ``DealConfirmationError`` when the mutation was accepted but not
+    confirmed, an ``AmbiguousExecutionError`` when it may or may not have reached IG, and
+    the provider's ``IGError`` when it was rejected. Any other exception a deal raises is
+    reported here too, so one failing deal never costs the batch its other outcomes.
+    """
+
+    index: int
+    deal: Deal
+    confirmation: DealConfirmationResponse | None = None
+    error: Exception | None = None
+
+
+class TradeConfirmations:
+    """Deal confirmations pushed on one account's TRADE stream, awaited by deal reference.
+
+    Open it before dealing: a confirmation that arrives ahead of the mutation response is
+    held until it is claimed, up to the ``retain`` most recent unclaimed ones. A workflow
+    waits ``timeout`` seconds for the stream and then falls back to the REST confirmation,
+    as it does at once after a stream error or ``close()``. A confirmation that cannot be
+    decoded is dropped, so its deal is confirmed over REST too.
+    """
+
+    def __init__(self, account_id: str, *, timeout: float = 2.0, retain: int = 256) -> None:
+        self.account_id = account_id
+        self.timeout = timeout
+        self._retain = retain
+        self._condition = Condition()
+        self._received: OrderedDict[str, DealConfirmationResponse] = OrderedDict()
+        self._waiters: dict[str, tuple[asyncio.AbstractEventLoop, _Waiter]] = {}
+        self._stopped = False
+        self._stop: Callable[[], None] | None = None
+
+    def close(self) -> None:
+        """Stop the TRADE subscription; pending and later waits fall back to REST."""
+        stop, self._stop = self._stop, None
+        if stop is not None:
+            stop()
+        self._halt()
+
+    def wait(self, deal_reference: str) -> DealConfirmationResponse | None:
+        """Block until the confirmation for ``deal_reference`` arrives, or return ``None``."""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._stopped or deal_reference in self._received, self.timeout
+            )
+            return self._received.pop(deal_reference, None)
+
+    async def wait_async(self, deal_reference: str) -> DealConfirmationResponse | None:
+        """Await the confirmation for ``deal_reference``, or return ``None`` on timeout."""
+        loop = asyncio.get_running_loop()
+        waiter: _Waiter = loop.create_future()
+        with self._condition:
+            if self._stopped or deal_reference in self._received:
+                return self._received.pop(deal_reference, None)
+            self._waiters[deal_reference] = (loop, waiter)
+        try:
+            return await asyncio.wait_for(waiter, self.timeout)
+        except TimeoutError:
+            return None
+        finally:
+            with self._condition:
+                self._waiters.pop(deal_reference, None)
+
+    def _subscription(self) -> StreamSubscription:
+        return StreamSubscription(
+            key=f"confirms-{self.account_id}",
+            mode="DISTINCT",
+            items=(f"TRADE:{self.account_id}",),
+            fields=("CONFIRMS",),
+            snapshot=False,
+        )
+
+    def _on_event(self, event: StreamUpdate | Exception) -> None:
+        if isinstance(event, Exception):
+            self._halt()
+            return
+        try:
+            payload = trade_payload(event, "CONFIRMS")
+            if not isinstance(payload, dict) or not payload.get("deal_reference"):
+                return
+            confirmation = DealConfirmationResponse.model_validate(payload)
+        except ValueError:
+            # The waiter times out and confirms this deal over REST instead.
+            logger.warning("Dropped an undecodable CONFIRMS update for %s.", self.account_id)
+            return
+        with self._condition:
+            waiter = self._waiters.pop(confirmation.deal_reference, None)
+            if waiter is not None:
+                waiter[0].call_soon_threadsafe(_settle, waiter[1], confirmation)
+                return
+            self._received[confirmation.deal_reference] = confirmation
+            while len(self._received) > self._retain:
+                self._received.popitem(last=False)
+            self._condition.notify_all()
+
+    def _halt(self) -> None:
+        with self._condition:
+            self._stopped = True
+            waiters, self._waiters = self._waiters, {}
+            self._condition.notify_all()
+        for loop, waiter in waiters.values():
+            loop.call_soon_threadsafe(_settle, waiter, None)
 
 
 @dataclass(frozen=True, slots=True)
 class PositionWorkflow:
     positions: PositionsOperations
     confirmations: ConfirmationsOperations
+    streaming: StreamingOperations
+    max_concurrency: int = 4
 
-    def open_and_confirm(self, request: CreatePositionRequest) -> DealConfirmationResponse:
+    def stream_confirmations(self, account_id: str) -> TradeConfirmations:
+        """Subscribe to the account's CONFIRMS for the ``stream`` argument of later calls."""
+        return _listen(self.streaming, account_id)
+
+    def open_and_confirm(
+        self, request: CreatePositionRequest, *, stream: TradeConfirmations | None = None
+    ) -> DealConfirmationResponse:
         result = self.positions.create(request)
-        return _confirm(self.confirmations, result.deal_reference)
+        return _confirm(self.confirmations, result.deal_reference, stream)
 
     def amend_and_confirm(
-        self, deal_id: str, request: AmendPositionRequest
+        self,
+        deal_id: str,
+        request: AmendPositionRequest,
+        *,
+        stream: TradeConfirmations | None = None,
     ) -> DealConfirmationResponse:
         result = self.positions.amend(deal_id, request)
-        return _confirm(self.confirmations, result.deal_reference)
+        return _confirm(self.confirmations, result.deal_reference, stream)
 
-    def close_and_confirm(self, request: ClosePositionRequest) -> DealConfirmationResponse:
+    def close_and_confirm(
+        self, request: ClosePositionRequest, *, stream: TradeConfirmations | None = None
+    ) -> DealConfirmationResponse:
         result = self.positions.close(request)
-        return _confirm(self.confirmations, result.deal_reference)
+        return _confirm(self.confirmations, result.deal_reference, stream)
+
+    def batch_and_confirm(
+        self, deals: Iterable[PositionDeal], *, stream: TradeConfirmations | None = None
+    ) -> Iterator[DealOutcome[PositionDeal]]:
+        """Submit every deal, ``max_concurrency`` at a time, yielding outcomes as they finish."""
+
+        def submit(deal: PositionDeal) -> DealConfirmationResponse:
+            if isinstance(deal, CreatePositionRequest):
+                return self.open_and_confirm(deal, stream=stream)
+            if isinstance(deal, ClosePositionRequest):
+                return self.close_and_confirm(deal, stream=stream)
+            return self.amend_and_confirm(deal.deal_id, deal.request, stream=stream)
+
+        return _batch(deals, submit, self.max_concurrency)
 
 
 @dataclass(frozen=True, slots=True)
 class AsyncPositionWorkflow:
     positions: AsyncPositionsOperations
     confirmations: AsyncConfirmationsOperations
+    streaming: AsyncStreamingOperations
+    max_concurrency: int = 4
+
+    async def stream_confirmations(self, account_id: str) -> TradeConfirmations:
+        """Subscribe to the account's CONFIRMS for the ``stream`` argument of later calls."""
+        return await _listen_async(self.streaming, account_id)
 
-    async def open_and_confirm(self, request: CreatePositionRequest) -> DealConfirmationResponse:
+    async def open_and_confirm(
+        self, request: CreatePositionRequest, *, stream: TradeConfirmations | None = None
+    ) -> DealConfirmationResponse:
         result = await self.positions.create(request)
-        return await _confirm_async(self.confirmations, result.deal_reference)
+        return await _confirm_async(self.confirmations, result.deal_reference, stream)
 
     async def amend_and_confirm(
-        self, deal_id: str, request: AmendPositionRequest
+        self,
+        deal_id: str,
+        request: AmendPositionRequest,
+        *,
+        stream: TradeConfirmations | None = None,
     ) -> DealConfirmationResponse:
         result = await self.positions.amend(deal_id, request)
-        return await _confirm_async(self.confirmations, result.deal_reference)
+        return await _confirm_async(self.confirmations, result.deal_reference, stream)
 
-    async def close_and_confirm(self, request: ClosePositionRequest) -> DealConfirmationResponse:
+    async def close_and_confirm(
+        self, request: ClosePositionRequest, *, stream: TradeConfirmations | None = None
+    ) -> DealConfirmationResponse:
         result = await self.positions.close(request)
-        return await _confirm_async(self.confirmations, result.deal_reference)
+        return await _confirm_async(self.confirmations, result.deal_reference, stream)
+
+    async def batch_and_confirm(
+        self, deals: Iterable[PositionDeal], *, stream: TradeConfirmations | None = None
+    ) -> AsyncIterator[DealOutcome[PositionDeal]]:
+        """Submit every deal, ``max_concurrency`` at a time, yielding outcomes as they finish."""
+
+        async def submit(deal: PositionDeal) -> DealConfirmationResponse:
+            if isinstance(deal, CreatePositionRequest):
+                return await self.open_and_confirm(deal, stream=stream)
+            if isinstance(deal, ClosePositionRequest):
+                return await self.close_and_confirm(deal, stream=stream)
+            return await self.amend_and_confirm(deal.deal_id, deal.request, stream=stream)
+
+        async for outcome in _batch_async(deals, submit, self.max_concurrency):
+            yield outcome
 
 
 @dataclass(frozen=True, slots=True)
 class WorkingOrderWorkflow:
     working_orders: WorkingOrdersOperations
     confirmations: ConfirmationsOperations
+    streaming: StreamingOperations
+    max_concurrency: int = 4
+
+    def stream_confirmations(self, account_id: str) -> TradeConfirmations:
+        """Subscribe to the account's CONFIRMS for the ``stream`` argument of later calls."""
+        return _listen(self.streaming, account_id)
 
-    def place_and_confirm(self, request: CreateWorkingOrderRequest) -> DealConfirmationResponse:
+    def place_and_confirm(
+        self, request: CreateWorkingOrderRequest, *, stream: TradeConfirmations | None = None
+    ) -> DealConfirmationResponse:
         result = self.working_orders.create(request)
-        return _confirm(self.confirmations, result.deal_reference)
+        return _confirm(self.confirmations, result.deal_reference, stream)
 
     def amend_and_confirm(
-        self, deal_id: str, request: AmendWorkingOrderRequest
+        self,
+        deal_id: str,
+        request: AmendWorkingOrderRequest,
+        *,
+        stream: TradeConfirmations | None = None,
     ) -> DealConfirmationResponse:
         result = self.working_orders.amend(deal_id, request)
-        return _confirm(self.confirmations, result.deal_reference)
+        return _confirm(self.confirmations, result.deal_reference, stream)
 
-    def cancel_and_confirm(self, deal_id: str) -> DealConfirmationResponse:
+    def cancel_and_confirm(
+        self, deal_id: str, *, stream: TradeConfirmations | None = None
+    ) -> DealConfirmationResponse:
         result = self.working_orders.delete(deal_id)
-        return _confirm(self.confirmations, result.deal_reference)
+        return _confirm(self.confirmations, result.deal_reference, stream)
+
+    def batch_and_confirm(
+        self, deals: Iterable[WorkingOrderDeal], *, stream: TradeConfirmations | None = None
+    ) -> Iterator[DealOutcome[WorkingOrderDeal]]:
+        """Submit every deal, ``max_concurrency`` at a time, yielding outcomes as they finish."""
+
+        def submit(deal: WorkingOrderDeal) -> DealConfirmationResponse:
+            if isinstance(deal, CreateWorkingOrderRequest):
+                return self.place_and_confirm(deal, stream=stream)
+            if isinstance(deal, WorkingOrderAmendment):
+                return self.amend_and_confirm(deal.deal_id, deal.request, stream=stream)
+            return self.cancel_and_confirm(deal.deal_id, stream=stream)
+
+        return _batch(deals, submit, self.max_concurrency)
 
 
 @dataclass(frozen=True, slots=True)
 class AsyncWorkingOrderWorkflow:
     working_orders: AsyncWorkingOrdersOperations
     confirmations: AsyncConfirmationsOperations
+    streaming: AsyncStreamingOperations
+    max_concurrency: int = 4
+
+    async def stream_confirmations(self, account_id: str) -> TradeConfirmations:
+        """Subscribe to the account's CONFIRMS for the ``stream`` argument of later calls."""
+        return await _listen_async(self.streaming, account_id)
 
     async def place_and_confirm(
-        self, request: CreateWorkingOrderRequest
+        self, request: CreateWorkingOrderRequest, *, stream: TradeConfirmations | None = None
     ) -> DealConfirmationResponse:
         result = await self.working_orders.create(request)
-        return await _confirm_async(self.confirmations, result.deal_reference)
+        return await _confirm_async(self.confirmations, result.deal_reference, stream)
 
     async def amend_and_confirm(
-        self, deal_id: str, request: AmendWorkingOrderRequest
+        self,
+        deal_id: str,
+        request: AmendWorkingOrderRequest,
+        *,
+        stream: TradeConfirmations | None = None,
     ) -> DealConfirmationResponse:
         result = await self.working_orders.amend(deal_id, request)
-        return await _confirm_async(self.confirmations, result.deal_reference)
+        return await _confirm_async(self.confirmations, result.deal_reference, stream)
 
-    async def cancel_and_confirm(self, deal_id: str) -> DealConfirmationResponse:
+    async def cancel_and_confirm(
+        self, deal_id: str, *, stream: TradeConfirmations | None = None
+    ) -> DealConfirmationResponse:
         result = await self.working_orders.delete(deal_id)
-        return await _confirm_async(self.confirmations, result.deal_reference)
+        return await _confirm_async(self.confirmations, result.deal_reference, stream)
+
+    async def batch_and_confirm(
+        self, deals: Iterable[WorkingOrderDeal], *, stream: TradeConfirmations | None = None
+    ) -> AsyncIterator[DealOutcome[WorkingOrderDeal]]:
+        """Submit every deal, ``max_concurrency`` at a time, yielding outcomes as they finish."""
+
+        async def submit(deal: WorkingOrderDeal) -> DealConfirmationResponse:
+            if isinstance(deal, CreateWorkingOrderRequest):
+                return await self.place_and_confirm(deal, stream=stream)
+            if isinstance(deal, WorkingOrderAmendment):
+                return await self.amend_and_confirm(deal.deal_id, deal.request, stream=stream)
+            return await self.cancel_and_confirm(deal.deal_id, stream=stream)
+
+        async for outcome in _batch_async(deals, submit, self.max_concurrency):
+            yield outcome
+
+
+def _batch(
+    deals: Iterable[Deal],
+    submit: Callable[[Deal], DealConfirmationResponse],
+    max_concurrency: int,
+) -> Iterator[DealOutcome[Deal]]:
+    def run(index: int, deal: Deal) -> DealOutcome[Deal]:
+        try:
+            return DealOutcome(index, deal, confirmation=submit(deal))
+        except Exception as error:
+            return DealOutcome(index, deal, error=error)
+
+    pool = ThreadPoolExecutor(max(1, max_concurrency), thread_name_prefix="ig-dealing")
+    try:
+        futures = [pool.submit(run, index, deal) for index, deal in enumerate(deals)]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # Deals not yet sent are dropped when the caller stops early; sent ones finish.
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def _batch_async(
+    deals: Iterable[Deal],
+    submit: Callable[[Deal], Awaitable[DealConfirmationResponse]],
+    max_concurrency: int,
+) -> AsyncIterator[DealOutcome[Deal]]:
+    limit = asyncio.Semaphore(max(1, max_concurrency))
+    sent: set[int] = set()
+
+    async def run(index: int, deal: Deal) -> DealOutcome[Deal]:
+        async with limit:
+            sent.add(index)
+            try:
+                return DealOutcome(index, deal, confirmation=await submit(deal))
+            except Exception as error:
+                return DealOutcome(index, deal, error=error)
+
+    tasks = [asyncio.ensure_future(run(index, deal)) for index, deal in enumerate(deals)]
+    try:
+        for outcome in asyncio.as_completed(tasks):
+            yield await outcome
+    finally:
+        # Cancelling a mutation mid-request would make its outcome ambiguous.
+        for index, task in enumerate(tasks):
+            if index not in sent:
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _listen(streaming: StreamingOperations, account_id: str) -> TradeConfirmations:
+    confirmations = TradeConfirmations(account_id)
+    confirmations._stop = streaming.listen(confirmations._subscription(), confirmations._on_event)
+    return confirmations
+
+
+async def _listen_async(streaming: AsyncStreamingOperations, account_id: str) -> TradeConfirmations:
+    confirmations = TradeConfirmations(account_id)
+    confirmations._stop = await streaming.listen(
+        confirmations._subscription(), confirmations._on_event
+    )
+    return confirmations
+
+
+def _settle(
+    waiter: _Waiter,
+    confirmation: DealConfirmationResponse | None,
+) -> None:
+    if not waiter.done():
+        waiter.set_result(confirmation)
 
 
 def _confirm(
-    confirmations: ConfirmationsOperations, deal_reference: str
+    confirmations: ConfirmationsOperations,
+    deal_reference: str,
+    stream: TradeConfirmations | None,
 ) -> DealConfirmationResponse:
+    confirmation = stream.wait(deal_reference) if stream is not None else None
+    if confirmation is not None:
+        return confirmation
     try:
         return confirmations.get(deal_reference)
     except IGError as error:
@@ -113,8 +450,13 @@ def _confirm(
 
 
 async def _confirm_async(
-    confirmations: AsyncConfirmationsOperations, deal_reference: str
+    confirmations: AsyncConfirmationsOperations,
+    deal_reference: str,
+    stream: TradeConfirmations | None,
 ) -> DealConfirmationResponse:
+    confirmation = await stream.wait_async(deal_reference) if stream is not None else None
+    if confirmation is not None:
+        return confirmation
     try:
         return await confirmations.get(deal_reference)
     except IGError as error:
@@ -2,19 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
+
 from ig_trading_lib.errors import ResourceNotFoundError
+from ig_trading_lib.models import IGModel
 from ig_trading_lib.operations.markets import (
     AsyncMarketOperations,
+    MarketDetails,
     MarketGetResponse,
     MarketOperations,
+    MarketsResponse,
 )
 
+_EPICS_PER_REQUEST = 50
+
+MarketsFilter = Literal["ALL", "SNAPSHOT_ONLY"]
+
+
+class MarketsBatchResponse(IGModel):
+    """Market details for any number of epics, in request order."""
+
+    market_details: tuple[MarketDetails, ...] = ()
+    missing_epics: tuple[str, ...] = ()
+
 
 class MarketDiscoveryWorkflow:
     """Synchronous search and exact-market selection."""
 
-    def __init__(self, markets: MarketOperations) -> None:
+    def __init__(self, markets: MarketOperations, max_concurrency: int = 4) -> None:
         self._markets = markets
+        self._max_concurrency = max(1, max_concurrency)
 
     def find_market(self, search_term: str, epic: str) -> MarketGetResponse:
         """Search, select an exact epic, and retrieve its details."""
@@ -24,12 +43,26 @@ class MarketDiscoveryWorkflow:
             raise _market_not_found(search_term, epic)
         return self._markets.get(selected.epic)
 
+    def list_many(
+        self, epics: tuple[str, ...], filter: MarketsFilter = "SNAPSHOT_ONLY"
+    ) -> MarketsBatchResponse:
+        """Read any number of epics in concurrent 50-epic requests and keep input order."""
+        chunks = _epic_chunks(epics)
+        with ThreadPoolExecutor(
+            min(self._max_concurrency, len(chunks)), thread_name_prefix="ig-markets"
+        ) as pool:
+            responses = list(
+                pool.map(lambda chunk: self._markets.list(chunk, filter=filter), chunks)
+            )
+        return _ordered(chunks, responses)
+
 
 class AsyncMarketDiscoveryWorkflow:
     """Asynchronous search and exact-market selection."""
 
-    def __init__(self, markets: AsyncMarketOperations) -> None:
+    def __init__(self, markets: AsyncMarketOperations, max_concurrency: int = 4) -> None:
         self._markets = markets
+        self._max_concurrency = max(1, max_concurrency)
 
     async def find_market(self, search_term: str, epic: str) -> MarketGetResponse:
         """Search, select an exact epic, and retrieve its details."""
@@ -39,9 +72,54 @@ class AsyncMarketDiscoveryWorkflow:
             raise _market_not_found(search_term, epic)
         return await self._markets.get(selected.epic)
 
+    async def list_many(
+        self, epics: tuple[str, ...], filter: MarketsFilter = "SNAPSHOT_ONLY"
+    ) -> MarketsBatchResponse:
+        """Read any number of epics in concurrent 50-epic requests and keep input order."""
+        chunks = _epic_chunks(epics)
+        limit = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch(chunk: tuple[str, ...]) -> MarketsResponse:
+            async with limit:
+                return await self._markets.list(chunk, filter=filter)
+
+        tasks = [asyncio.ensure_future(fetch(chunk)) for chunk in chunks]
+        try:
+            responses = list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+        return _ordered(chunks, responses)
+
 
 def _market_not_found(search_term: str, epic: str) -> ResourceNotFoundError:
     return ResourceNotFoundError(
         f"Market search did not return the exact epic {epic!r}.",
         details={"epic": epic, "search_term": search_term},
     )
+
+
+def _epic_chunks(epics: tuple[str, ...]) -> list[tuple[str, ...]]:
+    """Split unique epics, in first-seen order, into groups IG accepts in one request."""
+    unique = tuple(dict.fromkeys(epics))
+    if not unique:
+        raise ValueError("epics must contain at least one identifier")
+    return [
+        unique[start : start + _EPICS_PER_REQUEST]
+        for start in range(0, len(unique), _EPICS_PER_REQUEST)
+    ]
+
+
+def _ordered(
+    chunks: list[tuple[str, ...]], responses: list[MarketsResponse]
+) -> MarketsBatchResponse:
+    returned = {
+        market.instrument.epic: market
+        for response in responses
+        for market in response.market_details
+    }
+    requested = [epic for chunk in chunks for epic in chunk]
+    return MarketsBatchResponse(
+        market_details=tuple(returned[epic] for epic in requested if epic in returned),
+        missing_epics=tuple(epic for epic in requested if epic not in returned),
+    )
@@ -0,0 +1,236 @@
+"""Historical price workflows that page through the faithful price operations."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain
+
+from ig_trading_lib.candles import CandleStore, bar_time_key
+from ig_trading_lib.operations.markets import (
+    PRICE_RESOLUTION_STEPS,
+    AsyncPricesOperations,
+    PricePoint,
+    PriceResolution,
+    PricesOperations,
+    PricesQuery,
+    PricesResponse,
+)
+
+_SHARD_POINTS = 1_440
+
+
+@dataclass(frozen=True, slots=True)
+class PriceHistoryWorkflow:
+    """Synchronous price-history retrieval over a bounded thread pool."""
+
+    prices: PricesOperations
+    max_concurrency: int = 4
+    store: CandleStore | None = None
+
+    def iter_pages(self, epic: str, query: PricesQuery | None = None) -> Iterator[PricesResponse]:
+        """Yield every page in order, fetching later pages concurrently."""
+        query = query or PricesQuery()
+        page = self.prices.list(epic, query)
+        yield page
+        page_numbers = _remaining_page_numbers(page)
+        if not page_numbers:
+            return
+        window = _page_window(page, self.max_concurrency)
+        pending: deque[Future[PricesResponse]] = deque()
+        pool = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="ig-prices")
+        try:
+            for page_number in page_numbers:
+                while len(pending) >= window:
+                    page = pending.popleft().result()
+                    window = _page_window(page, self.max_concurrency)
+                    yield page
+                pending.append(pool.submit(self.prices.list, epic, _page_query(query, page_number)))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def fetch_all(self, epic: str, query: PricesQuery | None = None) -> PricesResponse:
+        """Fetch every page and merge the prices into one response."""
+        pages = list(self.iter_pages(epic, query))
+        return _merge_pages(pages, chain.from_iterable(page.prices for page in pages))
+
+    def fetch_date_range(
+        self,
+        epic: str,
+        resolution: PriceResolution,
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> PricesResponse:
+        """Split a date range into shards, fetch them concurrently, and merge the bars."""
+        start, end = _date_window(start_date, end_date)
+        store = self.store
+        gaps = [(start, end)] if store is None else store.missing(epic, resolution, start, end)
+        shards = [shard for gap in gaps for shard in _date_shards(resolution, *gap)]
+        pages = []
+        with ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="ig-prices") as pool:
+            fetched = pool.map(
+                lambda shard: self.prices.list_date_range(epic, resolution, *shard), shards
+            )
+            for shard, page in zip(shards, fetched, strict=True):
+                if store is not None:
+                    store.write(epic, resolution, *shard, page.prices)
+                pages.append(page)
+        if store is None:
+            return _merge_pages(pages, _unique_points(pages))
+        return _merge_pages(pages, store.read(epic, resolution, start, end))
+
+
+@dataclass(frozen=True, slots=True)
+class AsyncPriceHistoryWorkflow:
+    """Asynchronous price-history retrieval over a bounded set of tasks."""
+
+    prices: AsyncPricesOperations
+    max_concurrency: int = 4
+    store: CandleStore | None = None
+
+    async def iter_pages(
+        self, epic: str, query: PricesQuery | None = None
+    ) -> AsyncIterator[PricesResponse]:
+        """Yield every page in order, fetching later pages concurrently."""
+        query = query or PricesQuery()
+        page = await self.prices.list(epic, query)
+        yield page
+        window = _page_window(page, self.max_concurrency)
+        pending: deque[asyncio.Task[PricesResponse]] = deque()
+        try:
+            for page_number in _remaining_page_numbers(page):
+                while len(pending) >= window:
+                    page = await pending.popleft()
+                    window = _page_window(page, self.max_concurrency)
+                    yield page
+                pending.append(
+                    asyncio.ensure_future(self.prices.list(epic, _page_query(query, page_number)))
+                )
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch_all(self, epic: str, query: PricesQuery | None = None) -> PricesResponse:
+        """Fetch every page and merge the prices into one response."""
+        pages = [page async for page in self.iter_pages(epic, query)]
+        return _merge_pages(pages, chain.from_iterable(page.prices for page in pages))
+
+    async def fetch_date_range(
+        self,
+        epic: str,
+        resolution: PriceResolution,
+        start_date: datetime | str,
+        end_date: datetime | str,
+    ) -> PricesResponse:
+        """Split a date range into shards, fetch them concurrently, and merge the bars."""
+        start, end = _date_window(start_date, end_date)
+        store = self.store
+        gaps = (
+            [(start, end)]
+            if store is None
+            else await asyncio.to_thread(store.missing, epic, resolution, start, end)
+        )
+        limit = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def fetch(shard_start: datetime, shard_end: datetime) -> PricesResponse:
+            async with limit:
+                page = await self.prices.list_date_range(epic, resolution, shard_start, shard_end)
+            if store is not None:
+                await asyncio.to_thread(
+                    store.write, epic, resolution, shard_start, shard_end, page.prices
+                )
+            return page
+
+        tasks = [
+            asyncio.ensure_future(fetch(*shard))
+            for gap in gaps
+            for shard in _date_shards(resolution, *gap)
+        ]
+        try:
+            pages = list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+        if store is None:
+            return _merge_pages(pages, _unique_points(pages))
+        return _merge_pages(
+            pages, await asyncio.to_thread(store.read, epic, resolution, start, end)
+        )
+
+
+def _remaining_page_numbers(page: PricesResponse) -> range:
+    page_data = page.metadata.page_data if page.metadata else None
+    if page_data is None:
+        return range(0)
+    return range(page_data.page_number + 1, page_data.total_pages + 1)
+
+
+def _page_window(page: PricesResponse, limit: int) -> int:
+    """Bound in-flight pages so their points fit in the remaining allowance."""
+    metadata = page.metadata
+    allowance = page.allowance or (metadata.allowance if metadata else None)
+    if allowance is None:
+        return max(1, limit)
+    page_data = metadata.page_data if metadata else None
+    page_size = (page_data.page_size if page_data else 0) or len(page.prices) or 1
+    return max(1, min(limit, allowance.remaining_allowance // page_size))
+
+
+def _page_query(query: PricesQuery, page_number: int) -> PricesQuery:
+    return query.model_copy(update={"page_number": page_number})
+
+
+def _merge_pages(pages: list[PricesResponse], prices: Iterable[PricePoint]) -> PricesResponse:
+    if not pages:
+        return PricesResponse(prices=tuple(prices))
+    first, last = pages[0], pages[-1]
+    return PricesResponse(
+        prices=tuple(prices),
+        instrument_type=first.instrument_type,
+        metadata=last.metadata,
+        allowance=last.allowance,
+    )
+
+
+def _date_window(start_date: datetime | str, end_date: datetime | str) -> tuple[datetime, datetime]:
+    start, end = _parse_date(start_date), _parse_date(end_date)
+    if end < start:
+        raise ValueError("end_date must not be earlier than start_date.")
+    return start, end
+
+
+def _date_shards(
+    resolution: str, start: datetime, end: datetime
+) -> list[tuple[datetime, datetime]]:
+    """Cover ``[start, end]`` with consecutive windows of about 1,440 bars each."""
+    span = PRICE_RESOLUTION_STEPS[resolution] * _SHARD_POINTS
+    shards = []
+    while True:
+        shard_end = min(start + span, end)
+        shards.append((start, shard_end))
+        if shard_end == end:
+            return shards
+        start = shard_end
+
+
+def _parse_date(value: datetime | str) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def _unique_points(pages: list[PricesResponse]) -> Iterator[PricePoint]:
+    """Yield bars in shard order, skipping the copy shared by adjacent shard boundaries."""
+    seen: set[object] = set()
+    for page in pages:
+        for point in page.prices:
+            key = bar_time_key(point)
+            if key is None or key not in seen:
+                seen.add(key)
+                yield point
@@ -0,0 +1,165 @@
+"""Instrument dealing-rules index for pre-trade validation without per-order reads."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from pydantic import PrivateAttr
+
+from ig_trading_lib.models import IGModel
+from ig_trading_lib.operations.dealing import CreatePositionRequest, CreateWorkingOrderRequest
+from ig_trading_lib.operations.markets import (
+    AsyncMarketOperations,
+    MarketDetails,
+    MarketDistanceRule,
+    MarketOperations,
+)
+from ig_trading_lib.workflows.discovery import (
+    AsyncMarketDiscoveryWorkflow,
+    MarketDiscoveryWorkflow,
+)
+
+
+class InstrumentRules(IGModel):
+    """Dealing rules and instrument metadata that order validation needs for one epic."""
+
+    epic: str
+    lot_size: Decimal | None = None
+    min_deal_size: Decimal | None = None
+    min_stop_or_limit_distance: MarketDistanceRule | None = None
+    min_guaranteed_stop_distance: MarketDistanceRule | None = None
+    max_stop_or_limit_distance: MarketDistanceRule | None = None
+    reference_level: Decimal | None = None
+    scaling_factor: Decimal | None = None
+
+
+class InstrumentIndex(IGModel):
+    """Instrument rules keyed by epic, answering lookups and order checks locally.
+
+    The index is an immutable snapshot. Refresh it by loading ``index.epics`` again.
+    Percentage distance rules are converted to points using the request level, or the
+    mid price captured when the index was loaded.
+    """
+
+    instruments: tuple[InstrumentRules, ...] = ()
+    _by_epic: dict[str, InstrumentRules] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any, /) -> None:
+        self._by_epic = {rules.epic: rules for rules in self.instruments}
+
+    def __contains__(self, epic: object) -> bool:
+        return epic in self._by_epic
+
+    def __len__(self) -> int:
+        return len(self._by_epic)
+
+    @property
+    def epics(self) -> tuple[str, ...]:
+        return tuple(self._by_epic)
+
+    def rules(self, epic: str) -> InstrumentRules:
+        """Return the indexed rules for ``epic`` or raise ``KeyError``."""
+        try:
+            return self._by_epic[epic]
+        except KeyError:
+            raise KeyError(f"Epic {epic!r} is not in the instrument index.") from None
+
+    def min_deal_size(self, epic: str) -> Decimal | None:
+        return self.rules(epic).min_deal_size
+
+    def min_stop_distance(
+        self, epic: str, *, guaranteed: bool = False
+    ) -> MarketDistanceRule | None:
+        rules = self.rules(epic)
+        return (
+            rules.min_guaranteed_stop_distance if guaranteed else rules.min_stop_or_limit_distance
+        )
+
+    def lot_size(self, epic: str) -> Decimal | None:
+        return self.rules(epic).lot_size
+
+    def check_order(self, request: CreatePositionRequest | CreateWorkingOrderRequest) -> None:
+        """Raise ``ValueError`` naming every dealing rule the order would break."""
+        rules = self.rules(request.epic)
+        reference = request.level or rules.reference_level
+        violations = []
+        if rules.min_deal_size is not None and request.size < rules.min_deal_size:
+            violations.append(f"size {request.size} is below the minimum {rules.min_deal_size}")
+        min_stop = (
+            rules.min_guaranteed_stop_distance
+            if request.guaranteed_stop
+            else rules.min_stop_or_limit_distance
+        )
+        for name, distance, minimum in (
+            ("stop_distance", request.stop_distance, min_stop),
+            ("limit_distance", request.limit_distance, rules.min_stop_or_limit_distance),
+        ):
+            if distance is None:
+                continue
+            lowest = _points(minimum, reference, rules.scaling_factor)
+            highest = _points(rules.max_stop_or_limit_distance, reference, rules.scaling_factor)
+            if lowest is not None and distance < lowest:
+                violations.append(f"{name} {distance} is below the minimum {lowest}")
+            if highest is not None and distance > highest:
+                violations.append(f"{name} {distance} is above the maximum {highest}")
+        if violations:
+            raise ValueError(f"{request.epic}: " + "; ".join(violations) + ".")
+
+
+@dataclass(frozen=True, slots=True)
+class InstrumentIndexWorkflow:
+    """Synchronous instrument-index loading through bulk market reads."""
+
+    markets: MarketOperations
+
+    def load_index(self, epics: tuple[str, ...]) -> InstrumentIndex:
+        """Read dealing rules for every epic, 50 per concurrent request, into one index."""
+        batch = MarketDiscoveryWorkflow(self.markets).list_many(epics, filter="ALL")
+        return _index(batch.market_details)
+
+
+@dataclass(frozen=True, slots=True)
+class AsyncInstrumentIndexWorkflow:
+    """Asynchronous instrument-index loading through bulk market reads."""
+
+    markets: AsyncMarketOperations
+
+    async def load_index(self, epics: tuple[str, ...]) -> InstrumentIndex:
+        """Read dealing rules for every epic, 50 per concurrent request, into one index."""
+        batch = await AsyncMarketDiscoveryWorkflow(self.markets).list_many(epics, filter="ALL")
+        return _index(batch.market_details)
+
+
+def _index(markets: Iterable[MarketDetails]) -> InstrumentIndex:
+    return InstrumentIndex(instruments=tuple(_rules(market) for market in markets))
+
+
+def _rules(market: MarketDetails) -> InstrumentRules:
+    rules, snapshot = market.dealing_rules, market.snapshot
+    sides = [price for price in (snapshot.bid, snapshot.offer) if price is not None]
+    return InstrumentRules(
+        epic=market.instrument.epic,
+        lot_size=market.instrument.lot_size,
+        min_deal_size=rules.min_deal_size.value if rules.min_deal_size else None,
+        min_stop_or_limit_distance=rules.min_normal_stop_or_limit_distance,
+        min_guaranteed_stop_distance=rules.min_controlled_risk_stop_distance,
+        max_stop_or_limit_distance=rules.max_stop_or_limit_distance,
+        reference_level=sum(sides, Decimal(0)) / len(sides) if sides else None,
+        scaling_factor=snapshot.scaling_factor,
+    )
+
+
+def _points(
+    rule: MarketDistanceRule | None, level: Decimal | None, scaling_factor: Decimal | None
+) -> Decimal | None:
+    if rule is None or rule.unit == "POINTS":
+        return rule.value if rule else None
+    if level is None or scaling_factor is None:
+        return None
+    # IG defines scalingFactor as the multiplier from a price level to its pip value, so a
+    # distance in price (level * percent) becomes points, the unit of a stop or limit
+    # distance. FX quotes in price (1.0812, factor 10000); indices quote in points (factor 1).
+    return level * rule.value / 100 * scaling_factor
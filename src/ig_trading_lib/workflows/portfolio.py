@@ -1,11 +1,19 @@
-"""Portfolio snapshot workflows."""
+"""Portfolio snapshot and live portfolio workflows."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, TypeVar
 
+from ig_trading_lib.errors import StreamingDataLossError
 from ig_trading_lib.models import IGModel
 from ig_trading_lib.operations.accounts import (
+    AccountBalance,
     AccountsOperations,
     AccountsResponse,
     AsyncAccountsOperations,
@@ -13,11 +21,30 @@ from ig_trading_lib.operations.accounts import (
 from ig_trading_lib.operations.dealing import (
     AsyncPositionsOperations,
     AsyncWorkingOrdersOperations,
+    Position,
     PositionsOperations,
     PositionsResponse,
+    WorkingOrderData,
     WorkingOrdersOperations,
     WorkingOrdersResponse,
 )
+from ig_trading_lib.operations.streaming import AsyncStreamingOperations, StreamingOperations
+from ig_trading_lib.streaming import StreamSubscription, StreamUpdate, trade_payload
+
+Result = TypeVar("Result")
+
+
+_ACCOUNT_FIELDS = (
+    "PNL",
+    "DEPOSIT",
+    "AVAILABLE_CASH",
+    "FUNDS",
+    "MARGIN",
+    "EQUITY",
+    "AVAILABLE_TO_DEAL",
+)
+_BALANCE_FIELDS = {"PNL": "profit_loss", "FUNDS": "balance", "AVAILABLE_TO_DEAL": "available"}
+_WORKING_ORDER_FIELDS = {"size": "order_size", "level": "order_level"}
 
 
 class PortfolioSnapshot(IGModel):
@@ -26,29 +53,280 @@ class PortfolioSnapshot(IGModel):
     working_orders: WorkingOrdersResponse
 
 
+class LivePosition(Position):
+    epic: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioState:
+    """Immutable portfolio view; ``version`` increases with every applied stream change."""
+
+    version: int
+    positions: Mapping[str, LivePosition]
+    working_orders: Mapping[str, WorkingOrderData]
+    balance: AccountBalance | None
+
+
+class LivePortfolio:
+    """Positions, working orders, and balance kept current from IG's TRADE and ACCOUNT streams.
+
+    Stream callbacks replace the state copy-on-write, so ``state`` is a cheap immutable view
+    that any thread or task may hold. Updates that arrive before the seeding snapshot are
+    replayed on top of it. After a stream error, or an update that cannot be decoded, the
+    state can no longer be trusted and ``state`` raises that error; close the portfolio and
+    build a new one.
+    """
+
+    def __init__(self, account_id: str) -> None:
+        self.account_id = account_id
+        self._lock = Lock()
+        self._state: PortfolioState | None = None
+        self._pending: list[StreamUpdate] = []
+        self._failure: Exception | None = None
+        self._stops: list[Callable[[], None]] = []
+
+    @property
+    def state(self) -> PortfolioState:
+        if self._failure is not None:
+            raise self._failure
+        if self._state is None:
+            raise RuntimeError("The live portfolio has not been seeded yet.")
+        return self._state
+
+    @property
+    def version(self) -> int:
+        return self.state.version
+
+    def close(self) -> None:
+        """Stop both stream subscriptions; the last state stays readable."""
+        stops, self._stops = self._stops, []
+        for stop in stops:
+            stop()
+
+    def _subscriptions(self) -> tuple[StreamSubscription, StreamSubscription]:
+        return (
+            StreamSubscription(
+                key=f"portfolio-trade-{self.account_id}",
+                mode="DISTINCT",
+                items=(f"TRADE:{self.account_id}",),
+                fields=("CONFIRMS", "OPU", "WOU"),
+                snapshot=False,
+            ),
+            StreamSubscription(
+                key=f"portfolio-account-{self.account_id}",
+                mode="MERGE",
+                items=(f"ACCOUNT:{self.account_id}",),
+                fields=_ACCOUNT_FIELDS,
+            ),
+        )
+
+    def _watch(self, stop: Callable[[], None]) -> None:
+        self._stops.append(stop)
+
+    def _on_event(self, event: StreamUpdate | Exception) -> None:
+        with self._lock:
+            if isinstance(event, Exception):
+                self._failure = event
+            elif self._state is None:
+                self._pending.append(event)
+            else:
+                self._state = self._applied(self._state, event)
+
+    def _seed(self, snapshot: PortfolioSnapshot) -> None:
+        with self._lock:
+            state = _seeded(snapshot, self.account_id)
+            for update in self._pending:
+                state = self._applied(state, update)
+            self._pending.clear()
+            self._state = state
+
+    def _applied(self, state: PortfolioState, update: StreamUpdate) -> PortfolioState:
+        """Apply ``update``, or fail the portfolio when it cannot be decoded; call locked."""
+        try:
+            return _apply(state, update)
+        except Exception as error:
+            # Raising here would only reach the SDK thread while ``state`` silently drifts.
+            failure = StreamingDataLossError(
+                f"Could not apply a portfolio update for {update.item_name}: {error}"
+            )
+            failure.__cause__ = error
+            self._failure = failure
+            return state
+
+
+class _ReadPool:
+    """Three reader threads, started on first use and kept until ``close()``."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def submit(self, read: Callable[[], Result]) -> Future[Result]:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(3, thread_name_prefix="ig-portfolio")
+            return self._pool.submit(read)
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
 @dataclass(frozen=True, slots=True)
 class PortfolioWorkflow:
     accounts: AccountsOperations
     positions: PositionsOperations
     working_orders: WorkingOrdersOperations
+    streaming: StreamingOperations
+    _pool: _ReadPool = field(default_factory=_ReadPool, init=False, repr=False, compare=False)
 
     def snapshot(self) -> PortfolioSnapshot:
+        accounts = self._pool.submit(self.accounts.list)
+        positions = self._pool.submit(self.positions.list)
+        working_orders = self._pool.submit(self.working_orders.list)
+        for read in (accounts, positions, working_orders):
+            read.exception()
+        # Every read has finished, so the first result() to raise is the earliest failure.
         return PortfolioSnapshot(
-            accounts=self.accounts.list(),
-            positions=self.positions.list(),
-            working_orders=self.working_orders.list(),
+            accounts=accounts.result(),
+            positions=positions.result(),
+            working_orders=working_orders.result(),
         )
 
+    def close(self) -> None:
+        """Stop the reader threads that snapshots reuse; a later snapshot starts new ones."""
+        self._pool.close()
+
+    def live(self, account_id: str) -> LivePortfolio:
+        """Subscribe to TRADE and ACCOUNT updates, then seed the state from one snapshot."""
+        portfolio = LivePortfolio(account_id)
+        try:
+            for subscription in portfolio._subscriptions():
+                portfolio._watch(self.streaming.listen(subscription, portfolio._on_event))
+            portfolio._seed(self.snapshot())
+        except BaseException:
+            portfolio.close()
+            raise
+        return portfolio
+
 
 @dataclass(frozen=True, slots=True)
 class AsyncPortfolioWorkflow:
     accounts: AsyncAccountsOperations
     positions: AsyncPositionsOperations
     working_orders: AsyncWorkingOrdersOperations
+    streaming: AsyncStreamingOperations
 
     async def snapshot(self) -> PortfolioSnapshot:
+        accounts, positions, working_orders = await asyncio.gather(
+            self.accounts.list(),
+            self.positions.list(),
+            self.working_orders.list(),
+            return_exceptions=True,
+        )
         return PortfolioSnapshot(
-            accounts=await self.accounts.list(),
-            positions=await self.positions.list(),
-            working_orders=await self.working_orders.list(),
+            accounts=_result(accounts),
+            positions=_result(positions),
+            working_orders=_result(working_orders),
+        )
+
+    async def live(self, account_id: str) -> LivePortfolio:
+        """Subscribe to TRADE and ACCOUNT updates, then seed the state from one snapshot."""
+        portfolio = LivePortfolio(account_id)
+        try:
+            for subscription in portfolio._subscriptions():
+                portfolio._watch(await self.streaming.listen(subscription, portfolio._on_event))
+            portfolio._seed(await self.snapshot())
+        except BaseException:
+            portfolio.close()
+            raise
+        return portfolio
+
+    def close(self) -> None:
+        """Match ``PortfolioWorkflow.close()``; async snapshots hold no threads to stop."""
+
+
+def _result(outcome: Result | BaseException) -> Result:
+    """Raise a read's failure; keyword order makes the earliest failing read win."""
+    if isinstance(outcome, BaseException):
+        raise outcome
+    return outcome
+
+
+def _seeded(snapshot: PortfolioSnapshot, account_id: str) -> PortfolioState:
+    account = next(
+        (item for item in snapshot.accounts.accounts if item.account_id == account_id), None
+    )
+    return PortfolioState(
+        version=1,
+        positions=MappingProxyType(
+            {
+                summary.position.deal_id: LivePosition.model_validate(
+                    {**summary.position.model_dump(), "epic": summary.market.epic}
+                )
+                for summary in snapshot.positions.positions
+            }
+        ),
+        working_orders=MappingProxyType(
+            {
+                summary.working_order_data.deal_id: summary.working_order_data
+                for summary in snapshot.working_orders.working_orders
+            }
+        ),
+        balance=account.balance if account else None,
+    )
+
+
+def _apply(state: PortfolioState, update: StreamUpdate) -> PortfolioState:
+    item_name = update.item_name or ""
+    if item_name.startswith("ACCOUNT:"):
+        values = {
+            _BALANCE_FIELDS.get(name, name.lower()): value
+            for name, value in update.fields.items()
+            if value is not None
+        }
+        previous = state.balance.model_dump() if state.balance else {}
+        return PortfolioState(
+            version=state.version + 1,
+            positions=state.positions,
+            working_orders=state.working_orders,
+            balance=AccountBalance.model_validate({**previous, **values}),
         )
+    positions, working_orders = state.positions, state.working_orders
+    if opu := trade_payload(update, "OPU"):
+        positions = _upserted(positions, opu, LivePosition, {})
+    if wou := trade_payload(update, "WOU"):
+        working_orders = _upserted(working_orders, wou, WorkingOrderData, _WORKING_ORDER_FIELDS)
+    if positions is state.positions and working_orders is state.working_orders:
+        return state
+    return PortfolioState(
+        version=state.version + 1,
+        positions=positions,
+        working_orders=working_orders,
+        balance=state.balance,
+    )
+
+
+Entry = TypeVar("Entry", bound=IGModel)
+
+
+def _upserted(
+    entries: Mapping[str, Entry],
+    payload: dict[str, Any],
+    model: type[Entry],
+    renames: Mapping[str, str],
+) -> Mapping[str, Entry]:
+    deal_id = payload.get("deal_id")
+    if deal_id is None or payload.get("deal_status") == "REJECTED":
+        return entries
+    updated = dict(entries)
+    if payload.get("status") == "DELETED":
+        if updated.pop(deal_id, None) is None:
+            return entries
+    else:
+        previous = entries[deal_id].model_dump() if deal_id in entries else {}
+        changes = {renames.get(name, name): value for name, value in payload.items()}
+        updated[deal_id] = model.model_validate({**previous, **changes})
+    return MappingProxyType(updated)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from ig_trading_lib import (
+    IG,
+    CreatePositionRequest,
+    Environment,
+    IGConfig,
+    RateLimiter,
+    RateLimitError,
+    SessionCredentials,
+    ratelimit,
+)
+from ig_trading_lib.operations.markets import PricesQuery
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(
+        ratelimit, "time", SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep)
+    )
+    return clock
+
+
+def test_token_bucket_queues_callers_once_the_burst_is_spent(clock: _Clock) -> None:
+    limiter = RateLimiter(reads_per_minute=60, trading_per_minute=None)
+
+    for _ in range(60):
+        limiter.acquire("reads")
+    limiter.acquire("reads")
+    limiter.acquire("reads")
+    limiter.acquire("trading")
+
+    assert clock.sleeps == [1.0, 1.0]
+    stats = limiter.stats()
+    assert set(stats) == {"reads", "app_reads", "price_points"}
+    assert stats["reads"].acquired == 62
+    assert stats["reads"].queue_depth == 0
+    assert stats["reads"].total_wait_seconds == 2.0
+    assert stats["reads"].max_wait_seconds == 1.0
+
+
+def test_transport_charges_the_bucket_matching_each_operation(clock: _Clock) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        if request.method == "POST":
+            return httpx.Response(200, json={"dealReference": "reference"})
+        return httpx.Response(200, json={"prices": []})
+
+    limiter = RateLimiter(price_points_per_week=1_000)
+    config = IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("api-key", "identifier", "password"),
+    )
+    with IG(
+        config,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        rate_limiter=limiter,
+    ) as ig:
+        ig.operations.prices.list("CS.D.EURUSD.CFD.IP", PricesQuery(max_points=400))
+        ig.operations.prices.list_date_range(
+            "CS.D.EURUSD.CFD.IP", "HOUR", "2026-08-01T00:00:00", "2026-08-01T23:00:00"
+        )
+        ig.operations.positions.create(
+            CreatePositionRequest(
+                epic="CS.D.EURUSD.CFD.IP",
+                direction="BUY",
+                size=1,
+                order_type="MARKET",
+                currency_code="GBP",
+            )
+        )
+
+    stats = limiter.stats()
+    assert stats["reads"].acquired == 2
+    assert stats["trading"].acquired == 1
+    assert stats["price_points"].acquired == 2
+    assert clock.sleeps == []
+    with pytest.raises(RateLimitError, match="price_points allowance"):
+        limiter.acquire("price_points", 1_000)
+    assert clock.sleeps == []
+    assert limiter.stats()["price_points"].acquired == 2
+
+
+def test_an_unbounded_wait_sleeps_until_the_price_allowance_refills(clock: _Clock) -> None:
+    limiter = RateLimiter(price_points_per_week=1_000, max_wait_seconds=None)
+
+    limiter.acquire("price_points", 576)
+    limiter.acquire("price_points", 1_000)
+
+    assert clock.sleeps == [pytest.approx(576 * 604.8)]
+
+
+def test_reads_draw_on_the_application_bucket_shared_across_accounts(clock: _Clock) -> None:
+    first = RateLimiter(reads_per_minute=None, app_reads_per_minute=2)
+    second = RateLimiter(reads_per_minute=30, app=first)
+
+    first.acquire("reads")
+    second.acquire("reads")
+    second.acquire("reads")
+
+    assert clock.sleeps == [30.0]
+    assert set(first.stats()) == {"trading", "app_reads", "price_points"}
+    assert second.stats()["app_reads"] == first.stats()["app_reads"]
+    assert first.stats()["app_reads"].acquired == 3
+    assert second.stats()["reads"].acquired == 2
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_wait_gives_its_tokens_back(clock: _Clock) -> None:
+    limiter = RateLimiter(reads_per_minute=1)
+    await limiter.acquire_async("reads")
+    waiting = asyncio.create_task(limiter.acquire_async("reads"))
+    await asyncio.sleep(0)
+    assert limiter.stats()["reads"].queue_depth == 1
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    stats = limiter.stats()
+    assert (stats["reads"].queue_depth, stats["reads"].acquired) == (0, 1)
+    assert stats["app_reads"].acquired == 1
+    limiter.acquire("reads")
+    assert clock.sleeps == [60.0]
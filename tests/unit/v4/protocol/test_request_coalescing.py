@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from ig_trading_lib import IG, AsyncIG, Environment, IGConfig, SessionCredentials
+
+
+def _config() -> IGConfig:
+    return IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("api-key", "identifier", "password"),
+        coalesce_reads=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_async_reads_share_one_request() -> None:
+    paths: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        paths.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"positions": []})
+
+    async with AsyncIG(
+        _config(), http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ) as ig:
+        results = await asyncio.gather(*(ig.operations.positions.list() for _ in range(20)))
+        await ig.operations.positions.list()
+
+    assert paths == ["/gateway/deal/positions", "/gateway/deal/positions"]
+    assert all(result is results[0] for result in results)
+
+
+def test_concurrent_identical_sync_reads_share_one_request_but_keys_differ() -> None:
+    paths: list[str] = []
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        paths.append(request.url.path)
+        release.wait(1.0)
+        return httpx.Response(200, json={"instrument": {"epic": request.url.path[-4:]}})
+
+    with (
+        IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig,
+        ThreadPoolExecutor(8) as pool,
+    ):
+        futures = [pool.submit(ig.operations.markets.get, epic) for epic in ("AAAA", "BBBB") * 4]
+        threading.Timer(0.05, release.set).start()
+        results = [future.result() for future in futures]
+
+    assert sorted(paths) == ["/gateway/deal/markets/AAAA", "/gateway/deal/markets/BBBB"]
+    assert [result.instrument.epic for result in results] == ["AAAA", "BBBB"] * 4
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import logging
+
+import httpx
+import pytest
+
+from ig_trading_lib import IG, AsyncIG, Environment, IGConfig, RequestEvent, SessionCredentials
+
+
+def _config() -> IGConfig:
+    return IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("api-key", "identifier", "password"),
+    )
+
+
+def _retrying_handler():
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        calls.append(request.headers["X-CORRELATION-ID"])
+        if len(calls) == 1:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"instrument": {"epic": "AAAA"}})
+
+    return handler, calls
+
+
+_RETRIED_CALL = [
+    "token_refresh",
+    "before_send",
+    "after_receive",
+    "retry_scheduled",
+    "before_send",
+    "after_receive",
+    "decode_start",
+    "decode_end",
+    "validate_start",
+    "validate_end",
+]
+
+
+def test_hooks_see_every_step_of_a_retried_call_under_one_correlation_id() -> None:
+    events: list[RequestEvent] = []
+    handler, sent = _retrying_handler()
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with IG(_config(), http_client=client, hooks=(events.append,)) as ig:
+        ig.operations.markets.get("AAAA")
+
+    assert [event.kind for event in events] == _RETRIED_CALL
+    assert {event.operation_id for event in events} == {"markets.get"}
+    assert {event.correlation_id for event in events} == {sent[0]} == set(sent)
+    assert [event.status_code for event in events if event.kind == "after_receive"] == [503, 200]
+    assert [event.attempt for event in events if event.kind == "before_send"] == [0, 1]
+    assert [event.at for event in events] == sorted(event.at for event in events)
+    timed = {"token_refresh", "after_receive", "retry_scheduled", "decode_end", "validate_end"}
+    assert all((event.elapsed_seconds is not None) == (event.kind in timed) for event in events)
+
+
+def test_a_failing_hook_is_logged_and_does_not_disturb_the_call(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    seen: list[str] = []
+
+    def broken(event: RequestEvent) -> None:
+        raise RuntimeError("boom")
+
+    handler, _ = _retrying_handler()
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with (
+        caplog.at_level(logging.ERROR, logger="ig_trading_lib.metrics"),
+        IG(
+            _config(), http_client=client, hooks=(broken, lambda event: seen.append(event.kind))
+        ) as ig,
+    ):
+        market = ig.operations.markets.get("AAAA")
+
+    assert market.instrument.epic == "AAAA"
+    assert seen == _RETRIED_CALL
+    assert len(caplog.records) == len(_RETRIED_CALL)
+
+
+@pytest.mark.asyncio
+async def test_async_client_emits_the_same_events() -> None:
+    events: list[RequestEvent] = []
+    handler, _ = _retrying_handler()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async with AsyncIG(_config(), http_client=client, hooks=(events.append,)) as ig:
+        await ig.operations.markets.get("AAAA")
+
+    assert [event.kind for event in events] == _RETRIED_CALL
+    assert events[0].elapsed_seconds is not None
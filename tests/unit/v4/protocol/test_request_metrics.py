@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+
+from ig_trading_lib import (
+    IG,
+    AsyncIG,
+    Environment,
+    IGConfig,
+    MetricsRegistry,
+    ResourceNotFoundError,
+    SessionCredentials,
+)
+from ig_trading_lib.metrics import LatencyHistogram, RequestObservation
+
+
+def _config() -> IGConfig:
+    return IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("api-key", "identifier", "password"),
+    )
+
+
+def _handler(attempts: list[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        attempts.append(request.url.path)
+        if request.url.path.endswith("/MISSING"):
+            return httpx.Response(404, json={"errorCode": "error.market.not-found"})
+        if attempts.count(request.url.path) == 1:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"instrument": {"epic": "AAAA"}})
+
+    return handler
+
+
+def test_operations_record_status_classes_retries_and_phase_latencies() -> None:
+    metrics = MetricsRegistry()
+    client = httpx.Client(transport=httpx.MockTransport(_handler([])))
+
+    with IG(_config(), http_client=client, metrics=metrics) as ig:
+        ig.operations.markets.get("AAAA")
+        with pytest.raises(ResourceNotFoundError):
+            ig.operations.markets.get("MISSING")
+
+    markets = metrics.snapshot()["markets.get"]
+    assert (markets.requests, markets.retries) == (2, 1)
+    assert markets.status_classes == {"2xx": 1, "4xx": 1}
+    assert {phase: stats.count for phase, stats in markets.phases.items()} == dict.fromkeys(
+        ("queue", "network", "decode", "validate", "total"), 2
+    )
+    assert markets.phases["total"].max >= markets.phases["network"].max > 0
+
+    text = metrics.prometheus_text()
+    assert 'ig_requests_total{operation="markets.get",status_class="4xx"} 1' in text
+    assert 'ig_retries_total{operation="markets.get"} 1' in text
+    assert 'ig_latency_seconds_count{operation="markets.get",phase="network"} 2' in text
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_async_operations_feed_a_bound_opentelemetry_meter() -> None:
+    recorded: list[tuple[str, float, dict[str, Any]]] = []
+
+    class Instrument:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def add(self, value: float, attributes: dict[str, Any]) -> None:
+            recorded.append((self.name, value, attributes))
+
+        record = add
+
+    class Meter:
+        def create_counter(self, name: str, **_: str) -> Instrument:
+            return Instrument(name)
+
+        create_histogram = create_counter
+
+    metrics = MetricsRegistry()
+    metrics.bind_opentelemetry(Meter())
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler([])))
+
+    async with AsyncIG(_config(), http_client=client, metrics=metrics) as ig:
+        await ig.operations.markets.get("AAAA")
+
+    names = [name for name, _, _ in recorded]
+    assert names.count("ig.latency") == 5
+    assert ("ig.retries", 1, {"ig.operation": "markets.get"}) in recorded
+    assert ("ig.requests", 1, {"ig.operation": "markets.get", "ig.status_class": "2xx"}) in (
+        recorded
+    )
+
+
+def test_histogram_quantiles_stay_within_a_bucket_of_the_recorded_values() -> None:
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(0.001)
+    for _ in range(10):
+        histogram.record(0.1)
+    histogram.record(90_000.0)
+
+    assert 0.001 <= histogram.quantile(0.5) <= 0.001 * 1.125
+    assert 0.1 <= histogram.quantile(0.95) <= 0.1 * 1.125
+    assert histogram.quantile(1.0) == 90_000.0
+    assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+def test_unreachable_provider_is_an_error_class_and_otel_needs_its_optional_package() -> None:
+    metrics = MetricsRegistry()
+    metrics.record(RequestObservation("session.get"), 0.5)
+
+    assert metrics.snapshot()["session.get"].status_classes == {"error": 1}
+    with pytest.raises(ImportError, match="opentelemetry-api"):
+        metrics.bind_opentelemetry()
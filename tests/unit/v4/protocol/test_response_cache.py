@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from ig_trading_lib import IG, AsyncIG, Environment, IGConfig, ResponseCache, SessionCredentials
+from ig_trading_lib.operations.watchlists import AddWatchlistMarketRequest
+
+
+def _config(identifier: str = "identifier", account_id: str | None = None) -> IGConfig:
+    return IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("api-key", identifier, "password"),
+        account_id=account_id,
+    )
+
+
+def _handler(requests: list[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        requests.append(f"{request.method} {request.url.path}")
+        if request.method == "PUT":
+            return httpx.Response(200, json={"status": "SUCCESS"})
+        if "/watchlists/" in request.url.path:
+            return httpx.Response(200, json={"markets": []})
+        return httpx.Response(200, json={"instrument": {"epic": request.url.path[-4:]}})
+
+    return handler
+
+
+def test_reference_reads_are_cached_and_dependent_mutations_invalidate_them() -> None:
+    requests: list[str] = []
+    cache = ResponseCache()
+    client = httpx.Client(transport=httpx.MockTransport(_handler(requests)))
+
+    with IG(_config(), http_client=client, response_cache=cache) as ig:
+        first = ig.operations.markets.get("AAAA")
+        assert ig.operations.markets.get("AAAA") is first
+        ig.operations.markets.get("BBBB")
+        ig.operations.watchlists.get("W1")
+        ig.operations.watchlists.add_market("W1", AddWatchlistMarketRequest(epic="AAAA"))
+        ig.operations.watchlists.get("W1")
+        ig.operations.markets.get("AAAA")
+
+    assert requests == [
+        "GET /gateway/deal/markets/AAAA",
+        "GET /gateway/deal/markets/BBBB",
+        "GET /gateway/deal/watchlists/W1",
+        "PUT /gateway/deal/watchlists/W1",
+        "GET /gateway/deal/watchlists/W1",
+    ]
+    stats = cache.stats()
+    assert (stats["markets.get"].hits, stats["markets.get"].misses) == (2, 2)
+    assert (stats["watchlists.get"].hits, stats["watchlists.get"].misses) == (0, 2)
+
+
+@pytest.mark.asyncio
+async def test_async_reads_share_the_cache_until_entries_expire(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requests: list[str] = []
+    now = [1_000.0]
+    monkeypatch.setattr("ig_trading_lib.cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler(requests)))
+
+    async with AsyncIG(_config(), http_client=client, response_cache=cache) as ig:
+        await ig.operations.markets.get("AAAA")
+        await ig.operations.markets.get("AAAA")
+        now[0] += 11
+        await ig.operations.markets.get("AAAA")
+
+    assert requests == ["GET /gateway/deal/markets/AAAA"] * 2
+    assert cache.stats()["markets.get"].hits == 1
+
+
+def test_a_shared_cache_never_serves_one_account_another_accounts_responses() -> None:
+    requests: list[str] = []
+    cache = ResponseCache()
+    configs = (_config(), _config(account_id="ACC2"), _config("other"), _config())
+
+    for config in configs:
+        client = httpx.Client(transport=httpx.MockTransport(_handler(requests)))
+        with IG(config, http_client=client, response_cache=cache) as ig:
+            ig.operations.watchlists.get("W1")
+
+    assert requests == ["GET /gateway/deal/watchlists/W1"] * 3
+    assert cache.stats()["watchlists.get"].hits == 1
+
+
+def test_least_recently_used_entries_are_evicted_and_stale_fetches_are_not_stored() -> None:
+    cache = ResponseCache()
+
+    for index in range(4):
+        cache.put("categories.list", index, f"page-{index}", 0)
+    assert cache.get("categories.list", 0)[0] == "page-0"
+    cache.put("categories.list", 4, "page-4", 0)
+
+    assert cache.get("categories.list", 1)[0] is None
+    assert cache.get("categories.list", 0)[0] == "page-0"
+
+    _, generation = cache.get("accounts.get_preferences", "preferences")
+    cache.invalidate("session.switch_account")
+    cache.put("accounts.get_preferences", "preferences", "stale", generation)
+    assert cache.get("accounts.get_preferences", "preferences")[0] is None
+
+    cache.invalidate("session.delete")
+    assert cache.stats()["categories.list"].entries == 0
+    cache.put("markets.get", "AAAA", "market", cache.get("markets.get", "AAAA")[1])
+    cache.clear()
+    assert cache.stats()["markets.get"].entries == 0
@@ -0,0 +1,70 @@
+import sys
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from ig_trading_lib import IG, Environment, IGConfig, SessionCredentials
+from ig_trading_lib._protocol.decoding import ResponseDecoder
+from ig_trading_lib.core import JsonDecoder
+from ig_trading_lib.operations.markets import PricesResponse
+
+_PRICES = (
+    b'{"prices": [{"snapshotTimeUTC": "2026-08-08T11:34:00", '
+    b'"openPrice": {"bid": 1.0812, "ask": 1.0814}, "lastTradedVolume": 12}], '
+    b'"metadata": {"allowance": {"allowanceExpiry": 1, "remainingAllowance": 2, '
+    b'"totalAllowance": 3}}}'
+)
+
+
+@pytest.mark.parametrize("backend", ["pydantic", "stdlib", "orjson"])
+def test_every_decoder_validates_the_same_normalised_response(backend: JsonDecoder) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    decoder = ResponseDecoder(backend)
+
+    response = decoder.validate(PricesResponse, _PRICES)
+
+    assert response.prices[0].snapshot_time_utc == "2026-08-08T11:34:00"
+    assert response.prices[0].open_price is not None
+    assert response.prices[0].open_price.bid == Decimal("1.0812")
+    assert response.metadata is not None
+    assert response.metadata.allowance is not None
+    assert response.metadata.allowance.remaining_allowance == 2
+    assert decoder.validate(PricesResponse, b"") == PricesResponse()
+    assert decoder.validate(PricesResponse, b"not json") == PricesResponse()
+
+
+def test_missing_optional_decoder_fails_when_the_client_is_configured(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    config = IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("key", "identifier", "password"),
+        json_decoder="msgspec",
+    )
+
+    with pytest.raises(ImportError, match="optional 'msgspec' package"):
+        IG(config)
+
+
+def test_header_backed_responses_still_merge_headers_with_a_bytes_decoder() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"CST": "cst", "X-SECURITY-TOKEN": "security"},
+            json={"accountId": "ABC123", "lightstreamerEndpoint": "https://stream.example"},
+        )
+
+    config = IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("key", "identifier", "password"),
+        json_decoder="stdlib",
+    )
+    with IG(config, http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        session = ig.operations.session.get(fetch_session_tokens=True)
+
+    assert session.account_id == "ABC123"
+    assert session.cst == "cst"
+    assert session.security_token == "security"
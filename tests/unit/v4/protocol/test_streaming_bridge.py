@@ -1,9 +1,13 @@
+import logging
 import threading
 from collections.abc import AsyncIterator, Callable
+from dataclasses import replace
+from decimal import Decimal
 from typing import Any
 
 import pytest
 
+from ig_trading_lib import StreamingDataLossError
 from ig_trading_lib.core import StreamingSession
 from ig_trading_lib.streaming import StreamingClient, StreamSubscription
 
@@ -194,3 +198,266 @@ def test_terminal_stream_error_refreshes_credentials_without_duplicate_subscript
     assert client.connectionDetails.password == "CST-new-cst|XST-new-security"
     assert len(client.subscriptions) == 1
     updates.close()
+
+
+class PriceUpdate:
+    def __init__(self, item: str, position: int, fields: dict[str, str], changed: list[str]):
+        self._item = item
+        self._position = position
+        self._fields = dict(fields)
+        self._changed = changed
+
+    def getItemName(self) -> str:
+        return self._item
+
+    def getItemPos(self) -> int:
+        return self._position
+
+    def isSnapshot(self) -> bool:
+        return self._changed == list(self._fields)
+
+    def getFields(self) -> dict[str, str]:
+        return self._fields
+
+    def getChangedFields(self) -> dict[str, str]:
+        return {name: self._fields[name] for name in self._changed}
+
+    def getFieldsByPosition(self) -> dict[int, str]:
+        return {position: value for position, value in enumerate(self._fields.values(), 1)}
+
+    def getChangedFieldsByPosition(self) -> dict[int, str]:
+        names = list(self._fields)
+        return {names.index(name) + 1: self._fields[name] for name in self._changed}
+
+
+def _burst(listener: Any) -> None:
+    a = {"BID": "1.0", "OFFER": "1.1"}
+    listener.onItemUpdate(PriceUpdate("MARKET:A", 1, a, ["BID", "OFFER"]))
+    listener.onItemUpdate(PriceUpdate("MARKET:B", 2, {"BID": "2.0", "OFFER": "2.1"}, ["BID"]))
+    for tick in range(1_000):
+        a["BID"] = f"1.{tick}"
+        listener.onItemUpdate(PriceUpdate("MARKET:A", 1, a, ["BID"]))
+    a["OFFER"] = "1.9"
+    listener.onItemUpdate(PriceUpdate("MARKET:A", 1, a, ["OFFER"]))
+
+
+def _conflated_stream(emit: Callable[[Any], None]) -> tuple[StreamingClient, StreamSubscription]:
+    stream = StreamingClient(
+        session_provider=_session,
+        client_factory=lambda _, __: FakeLightstreamerClient(emit),
+        subscription_factory=FakeSubscription,
+        queue_size=1,
+    )
+    subscription = StreamSubscription(
+        key="prices",
+        mode="MERGE",
+        items=("MARKET:A", "MARKET:B"),
+        fields=("BID", "OFFER"),
+        conflate=True,
+    )
+    return stream, subscription
+
+
+def test_conflated_merge_stream_keeps_the_newest_merged_state_per_item() -> None:
+    stream, subscription = _conflated_stream(_burst)
+    updates = stream.iter_updates(subscription)
+
+    first, second = next(updates), next(updates)
+    updates.close()
+
+    assert (first.item_name, second.item_name) == ("MARKET:A", "MARKET:B")
+    assert first.fields == {"BID": "1.999", "OFFER": "1.9"}
+    assert first.changed_fields == {"BID": "1.999", "OFFER": "1.9"}
+    assert not first.is_snapshot
+    assert second.changed_fields == {"BID": "2.0"}
+
+
+@pytest.mark.asyncio
+async def test_async_conflated_stream_wakes_the_loop_for_updates_from_the_sdk_thread() -> None:
+    threads: list[threading.Thread] = []
+
+    def emit(listener: Any) -> None:
+        threads.append(threading.Thread(target=_burst, args=(listener,)))
+        threads[0].start()
+
+    stream, subscription = _conflated_stream(emit)
+    updates = stream.aiter_updates(subscription)
+    seen = [await anext(updates)]
+    threads[0].join()
+    while seen[-1].fields != {"BID": "1.999", "OFFER": "1.9"}:
+        seen.append(await anext(updates))
+    await updates.aclose()
+
+    assert len(seen) < 1_000
+
+
+def test_conflation_requires_a_merge_subscription() -> None:
+    stream, subscription = _conflated_stream(_burst)
+    distinct = StreamSubscription(
+        key="trades", mode="DISTINCT", items=("TRADE:ABC123",), fields=("OPU",), conflate=True
+    )
+
+    with pytest.raises(ValueError, match="MERGE"):
+        next(stream.iter_updates(distinct))
+    assert subscription.conflate
+
+
+def test_update_batches_deliver_every_update_in_order_and_reject_conflation() -> None:
+    stream = StreamingClient(
+        session_provider=_session,
+        client_factory=lambda _, __: FakeLightstreamerClient(_burst),
+        subscription_factory=FakeSubscription,
+        queue_size=2_000,
+    )
+    conflated = _conflated_stream(_burst)[1]
+    batches = stream.iter_update_batches(replace(conflated, conflate=False))
+
+    batch = next(batches)
+    batches.close()
+
+    assert len(batch) == 1_003
+    assert [update.item_name for update in batch[:3]] == ["MARKET:A", "MARKET:B", "MARKET:A"]
+    assert batch[-1].changed_fields == {"OFFER": "1.9"}
+    with pytest.raises(ValueError, match="iter_updates"):
+        next(stream.iter_update_batches(conflated))
+
+
+def test_identical_subscriptions_share_an_upstream_and_replay_merge_state() -> None:
+    sdk_clients: list[FakeLightstreamerClient] = []
+
+    def client_factory(_: str, __: str | None) -> FakeLightstreamerClient:
+        sdk_clients.append(FakeLightstreamerClient(lambda listener: None))
+        return sdk_clients[-1]
+
+    stream = StreamingClient(
+        session_provider=_session,
+        client_factory=client_factory,
+        subscription_factory=FakeSubscription,
+    )
+    prices = StreamSubscription(key="a", mode="MERGE", items=("MARKET:A",), fields=("BID", "OFFER"))
+    events: list[Any] = []
+    stop = stream.listen(prices, events.append)
+    upstream = sdk_clients[0].subscriptions[0].listener
+    state = {"BID": "1.0", "OFFER": "1.1"}
+    upstream.onItemUpdate(PriceUpdate("MARKET:A", 1, state, ["BID", "OFFER"]))
+    state["BID"] = "1.2"
+    upstream.onItemUpdate(PriceUpdate("MARKET:A", 1, state, ["BID"]))
+
+    late = stream.iter_updates(replace(prices, key="b", conflate=True))
+    replayed = next(late)
+    state["OFFER"] = "1.3"
+    upstream.onItemUpdate(PriceUpdate("MARKET:A", 1, state, ["OFFER"]))
+    live = next(late)
+
+    assert (replayed.subscription_key, replayed.is_snapshot) == ("b", True)
+    assert replayed.changed_fields == {"BID": "1.2", "OFFER": "1.1"}
+    assert (live.subscription_key, live.changed_fields) == ("b", {"OFFER": "1.3"})
+    assert [event.changed_fields for event in events] == [
+        {"BID": "1.0", "OFFER": "1.1"},
+        {"BID": "1.2"},
+        {"OFFER": "1.3"},
+    ]
+    assert len(sdk_clients[0].subscriptions) == 1
+
+    stop()
+    assert sdk_clients[0].unsubscribed == []
+    late.close()
+    assert sdk_clients[0].unsubscribed == sdk_clients[0].subscriptions
+    assert sdk_clients[0].disconnected
+
+    trades = StreamSubscription(key="t", mode="DISTINCT", items=("TRADE:ABC123",), fields=("OPU",))
+    stops = [stream.listen(trades, events.append) for _ in range(2)]
+    assert len(sdk_clients[1].subscriptions) == 2
+    for stop in stops:
+        stop()
+
+
+def test_a_failing_shared_consumer_does_not_stop_delivery_to_the_others(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    sdk_client = FakeLightstreamerClient(lambda listener: None)
+    stream = StreamingClient(
+        session_provider=_session,
+        client_factory=lambda _, __: sdk_client,
+        subscription_factory=FakeSubscription,
+    )
+    prices = StreamSubscription(key="a", mode="MERGE", items=("MARKET:A",), fields=("BID",))
+    events: list[Any] = []
+
+    def broken(event: Any) -> None:
+        raise RuntimeError("boom")
+
+    stops = [stream.listen(prices, broken), stream.listen(replace(prices, key="b"), events.append)]
+    upstream = sdk_client.subscriptions[0].listener
+    with caplog.at_level(logging.ERROR, logger="ig_trading_lib.streaming"):
+        upstream.onItemUpdate(PriceUpdate("MARKET:A", 1, {"BID": "1.0"}, ["BID"]))
+        upstream.onItemUpdate(PriceUpdate("MARKET:A", 1, {"BID": "1.1"}, ["BID"]))
+
+    assert [(event.subscription_key, event.fields) for event in events] == [
+        ("b", {"BID": "1.0"}),
+        ("b", {"BID": "1.1"}),
+    ]
+    assert len(caplog.records) == 2
+    for stop in stops:
+        stop()
+
+
+def test_price_ticks_parse_changed_fields_once_and_track_them_in_a_bitmask() -> None:
+    def emit(listener: Any) -> None:
+        state = {"BID": "1.0800", "OFFER": "1.0802", "UPDATE_TIME": "10:00:00", "CHANGE": ""}
+        listener.onItemUpdate(PriceUpdate("MARKET:A", 1, state, list(state)))
+        state.update(BID="1.0801", UPDATE_TIME="10:00:01")
+        listener.onItemUpdate(PriceUpdate("MARKET:A", 1, state, ["BID", "UPDATE_TIME"]))
+        state["OFFER"] = "n/a"
+        listener.onItemUpdate(PriceUpdate("MARKET:A", 1, state, ["OFFER"]))
+
+    sdk_clients: list[FakeLightstreamerClient] = []
+
+    def client_factory(_: str, __: str | None) -> FakeLightstreamerClient:
+        sdk_clients.append(FakeLightstreamerClient(emit))
+        return sdk_clients[-1]
+
+    stream = StreamingClient(
+        session_provider=_session,
+        client_factory=client_factory,
+        subscription_factory=FakeSubscription,
+    )
+    subscription = StreamSubscription(
+        key="prices",
+        mode="MERGE",
+        items=("MARKET:A",),
+        fields=("BID", "OFFER", "UPDATE_TIME", "CHANGE"),
+    )
+    ticks = stream.iter_ticks(subscription, numbers="decimal")
+    updates = stream.iter_updates(subscription)
+
+    snapshot, tick = next(ticks), next(ticks)
+    next(updates)
+
+    assert snapshot.values == (Decimal("1.0800"), Decimal("1.0802"), "10:00:00", None)
+    assert (snapshot.changed_mask, snapshot.is_snapshot) == (0b1111, True)
+    assert tick["BID"] == Decimal("1.0801")
+    assert tick.values[1] is snapshot.values[1]
+    assert (tick.changed_mask, tick.changed_fields) == (0b0101, ("BID", "UPDATE_TIME"))
+    assert tick.is_changed("UPDATE_TIME") and not tick.is_changed("OFFER")
+    assert "changed=('BID', 'UPDATE_TIME')" in repr(tick)
+    assert len(sdk_clients[0].subscriptions) == 2
+    with pytest.raises(StreamingDataLossError, match="MARKET:A"):
+        next(ticks)
+    updates.close()
+
+
+def test_conflated_price_ticks_accumulate_the_changed_mask() -> None:
+    stream, subscription = _conflated_stream(_burst)
+
+    ticks = stream.iter_ticks(subscription)
+    first, second = next(ticks), next(ticks)
+    ticks.close()
+
+    assert (first.item_name, first.values, first.changed_mask) == ("MARKET:A", (1.999, 1.9), 0b11)
+    assert not first.is_snapshot
+    assert (second.item_name, second.fields, second.values) == (
+        "MARKET:B",
+        ("BID", "OFFER"),
+        (2.0, 2.1),
+    )
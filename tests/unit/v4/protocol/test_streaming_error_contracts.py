@@ -9,8 +9,10 @@ from ig_trading_lib.errors import StreamingSubscriptionError
 from ig_trading_lib.streaming import (
     AsyncStreamingClient,
     StreamUpdate,
+    _AsyncRingSink,
     _AsyncSink,
     _SubscriptionListener,
+    _SyncRingSink,
     _SyncSink,
 )
 
@@ -62,6 +64,51 @@ async def test_async_streaming_sink_uses_the_event_loop_and_surfaces_backpressur
         await sink.get_async()
 
 
+def _tick(position: int) -> StreamUpdate:
+    return StreamUpdate("prices", "MARKET:EPIC", position, {}, {}, False)
+
+
+def test_ring_sink_drains_in_order_across_the_wrap_and_fails_when_full() -> None:
+    sink = _SyncRingSink(capacity=3)
+    for position in (1, 2):
+        sink.deliver(_tick(position))
+    assert [update.item_position for update in sink.get_batch()] == [1, 2]
+
+    for position in (3, 4, 5):
+        sink.deliver(_tick(position))
+    assert [update.item_position for update in sink.get_batch()] == [3, 4, 5]
+
+    for position in (6, 7, 8, 9):
+        sink.deliver(_tick(position))
+    assert [update.item_position for update in sink.get_batch()] == [6, 7, 8]
+    with pytest.raises(StreamingDataLossError, match="ring buffer"):
+        sink.get_batch()
+
+
+@pytest.mark.asyncio
+async def test_async_ring_sink_wakes_the_loop_once_and_raises_errors_after_the_batch() -> None:
+    loop = asyncio.get_running_loop()
+    sink = _AsyncRingSink(loop, capacity=8)
+    wakeups: list[None] = []
+    wake = sink._wake
+
+    def counted_wake() -> None:
+        wakeups.append(None)
+        wake()
+
+    sink._wake = counted_wake  # type: ignore[method-assign]
+    waiter = asyncio.create_task(sink.get_batch_async())
+    await asyncio.sleep(0)
+    for position in range(5):
+        sink.deliver(_tick(position))
+    _SubscriptionListener(_subscription(), sink).onSubscriptionError(17, "invalid fields")
+
+    assert len(await waiter) == 5
+    assert len(wakeups) == 1
+    with pytest.raises(StreamingSubscriptionError):
+        await sink.get_batch_async()
+
+
 class _Details:
     def setUser(self, _: str) -> None:
         pass
@@ -128,3 +175,65 @@ async def test_async_streaming_facade_owns_and_closes_its_delegate() -> None:
 
 async def _session_async() -> StreamingSession:
     return _session()
+
+
+@pytest.mark.asyncio
+async def test_async_streaming_facade_multiplexes_subscriptions_over_one_connection() -> None:
+    clients: list[_Client] = []
+    sessions: list[StreamingSession] = []
+    listeners: list[_SubscriptionListener] = []
+
+    class Client(_Client):
+        def subscribe(self, subscription: _Subscription) -> None:
+            listeners.append(subscription.listener)
+            super().subscribe(subscription)
+
+    def client_factory(_: str, __: str | None) -> _Client:
+        clients.append(Client())
+        return clients[-1]
+
+    async def session() -> StreamingSession:
+        sessions.append(_session())
+        return sessions[-1]
+
+    stream = AsyncStreamingClient(
+        session_provider=session,
+        refresh_session_provider=session,
+        client_factory=client_factory,
+        subscription_factory=_Subscription,
+    )
+
+    prices = stream.aiter_updates(_subscription())
+    trades = stream.aiter_updates(
+        StreamSubscription("offers", "MERGE", ("MARKET:EPIC",), ("OFFER",))
+    )
+    assert await anext(prices) == _update()
+    assert (await anext(trades)).subscription_key == "offers"
+    listeners[1].onSubscriptionError(17, "invalid fields")
+    listeners[0].onItemUpdate(_SdkUpdate())
+    with pytest.raises(StreamingSubscriptionError):
+        await anext(trades)
+    assert (await anext(prices)).changed_fields == {"BID": "1.1"}
+    await prices.aclose()
+
+    assert (len(clients), len(sessions), clients[0].disconnect_calls) == (1, 1, 1)
+    updates = stream.aiter_update_batches(_subscription())
+    assert await anext(updates) == [_update()]
+    await updates.aclose()
+    assert (len(clients), len(sessions)) == (2, 2)
+
+
+class _SdkUpdate:
+    def getItemName(self) -> str:
+        return "MARKET:EPIC"
+
+    def getItemPos(self) -> int:
+        return 1
+
+    def isSnapshot(self) -> bool:
+        return False
+
+    def getFields(self) -> dict[str, str]:
+        return {"BID": "1.1"}
+
+    getChangedFields = getFields
@@ -5,8 +5,10 @@ import pytest
 
 from ig_trading_lib import (
     IG,
+    AsyncIG,
     AuthenticationError,
     AuthorizationError,
+    ConnectionPoolConfig,
     Environment,
     IGConfig,
     OAuthCredentials,
@@ -146,3 +148,53 @@ def test_authentication_network_failure_is_a_typed_transport_error() -> None:
 
     with pytest.raises(TransportError):
         _sync_client(httpx.MockTransport(handler)).operations.markets.search("EURUSD")
+
+
+def test_connection_pool_config_shapes_the_owned_http_client() -> None:
+    config = IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("api-key", "identifier", "password"),
+        timeout_seconds=9.0,
+        connection_pool=ConnectionPoolConfig(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry_seconds=30.0,
+            connect_timeout_seconds=2.0,
+            pool_timeout_seconds=1.0,
+        ),
+    )
+    ig = IG(config)
+    try:
+        http = ig._transport._http
+        pool = http._transport._pool
+        assert http.timeout == httpx.Timeout(9.0, connect=2.0, read=9.0, pool=1.0)
+        assert pool._max_connections == 64
+        assert pool._max_keepalive_connections == 32
+        assert pool._keepalive_expiry == 30.0
+    finally:
+        ig.close()
+
+
+@pytest.mark.asyncio
+async def test_entering_a_client_prewarms_the_configured_connections() -> None:
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        if request.method == "HEAD":
+            raise httpx.ConnectError("unreachable", request=request)
+        return httpx.Response(200)
+
+    config = IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("api-key", "identifier", "password"),
+        connection_pool=ConnectionPoolConfig(prewarm_connections=3),
+    )
+    with IG(config, http_client=httpx.Client(transport=httpx.MockTransport(handler))):
+        pass
+    async with AsyncIG(
+        config, http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ):
+        pass
+
+    assert methods == ["HEAD"] * 6
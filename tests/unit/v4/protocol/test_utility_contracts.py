@@ -3,6 +3,7 @@ import time
 import pytest
 
 from ig_trading_lib import IG, Environment, IGConfig, IGError, SessionCredentials
+from ig_trading_lib.models import _SNAKE_CASE_KEYS, _KeyTable, to_camel_case, to_snake_case
 from ig_trading_lib.transport import AsyncTransport, SessionTokens, SyncTransport
 
 
@@ -26,6 +27,18 @@ def test_configuration_token_and_error_helpers_preserve_safe_values() -> None:
     }
 
 
+def test_wire_key_translations_are_seeded_interned_and_bounded() -> None:
+    assert _SNAKE_CASE_KEYS._values["dealReference"] == "deal_reference"
+    assert _SNAKE_CASE_KEYS._values["snapshot_time_utc"] == "snapshot_time_utc"
+    assert to_snake_case("".join(["updateTime", "UTC"])) is to_snake_case("updateTimeUTC")
+    assert to_camel_case("currency_code") == "currencyCode"
+
+    table = _KeyTable(str.upper, 2)
+
+    assert [table(key) for key in ("a", "b", "c", "c")] == ["A", "B", "C", "C"]
+    assert len(table) == 2
+
+
 def test_owned_transports_close_without_opening_network_connections() -> None:
     sync_transport = SyncTransport(_config())
     sync_transport.close()
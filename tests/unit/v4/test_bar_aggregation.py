@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
+
+import httpx
+import pytest
+
+from ig_trading_lib import IG, BarAggregator, Environment, IGConfig, SessionCredentials
+from ig_trading_lib.bars import Bar
+from ig_trading_lib.operations.markets import PricesResponse
+from ig_trading_lib.streaming import StreamUpdate, _TickLayout
+
+EPIC = "CS.D.EURUSD.CFD.IP"
+_BASE = datetime(2026, 8, 3, 10, 0, tzinfo=UTC).timestamp()
+
+
+def _update(seconds: float, bid: float, offer: float) -> StreamUpdate:
+    fields = {"BID": str(bid), "OFR": str(offer), "UTM": str(int((_BASE + seconds) * 1000))}
+    return StreamUpdate(
+        subscription_key="chart",
+        item_name=f"CHART:{EPIC}:TICK",
+        item_position=1,
+        fields=fields,
+        changed_fields=fields,
+        is_snapshot=False,
+    )
+
+
+def _points(*points: tuple[str, float, float, float, float]) -> dict[str, object]:
+    """A v2 ``prices.list_points`` body, whose points carry only ``snapshotTime``."""
+
+    def side(value: float) -> dict[str, float]:
+        return {"bid": value - 0.5, "ask": value + 0.5}
+
+    return {
+        "prices": [
+            {
+                "snapshotTime": snapshot,
+                "openPrice": side(open_),
+                "highPrice": side(high),
+                "lowPrice": side(low),
+                "closePrice": side(close),
+                "lastTradedVolume": 7,
+            }
+            for snapshot, open_, high, low, close in points
+        ]
+    }
+
+
+def _list_points(body: dict[str, object]) -> PricesResponse:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        return httpx.Response(200, json=body)
+
+    config = IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("key", "identifier", "password"),
+    )
+    with IG(config, http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        return ig.operations.prices.list_points(EPIC, "DAY", 2)
+
+
+def _closed(aggregator: BarAggregator, resolution: str, seconds: float) -> list[Bar]:
+    return [bar for bar in aggregator.add(_update(seconds, 1, 2)) if bar.resolution == resolution]
+
+
+def test_updates_close_bars_for_every_resolution_in_order() -> None:
+    aggregator = BarAggregator(("MINUTE", "MINUTE_5"), price="bid")
+    ticks = [
+        _update(1, 10, 11),
+        _update(20, 12, 13),
+        _update(40, 9, 10),
+        _update(59, 11, 12),
+        _update(61, 20, 21),
+        _update(301, 5, 6),
+    ]
+
+    bars = list(aggregator.bars(ticks))
+
+    assert [(bar.resolution, bar.start.minute) for bar in bars] == [
+        ("MINUTE", 0),
+        ("MINUTE", 1),
+        ("MINUTE_5", 0),
+    ]
+    first, second, five = bars
+    assert (first.epic, first.open, first.high, first.low, first.close) == (EPIC, 10, 12, 9, 11)
+    assert first.volume == 4
+    assert (second.open, second.close, second.volume) == (20, 20, 1)
+    assert (five.open, five.high, five.low, five.close, five.volume) == (10, 20, 9, 20, 5)
+    history = aggregator.history(EPIC, "MINUTE")
+    assert list(history["open"]) == [10, 20]
+    assert history["start"][1] == _BASE + 60
+    current = aggregator.current(EPIC, "MINUTE")
+    assert current is not None
+    assert (current.start.minute, current.open) == (5, 5)
+
+
+def test_seeded_history_is_continued_by_live_updates_without_a_gap() -> None:
+    aggregator = BarAggregator(("DAY", "MINUTE"))
+    # IG's daily bars for this market open at 21:00 UTC, 22:00 in the London account's
+    # local time that v2 snapshotTime uses.
+    prices = _list_points(
+        _points(
+            ("2026/08/01 22:00:00", 8, 12, 7, 9),
+            ("2026/08/02 22:00:00", 9, 10, 8, 10),
+        )
+    )
+    aggregator.seed(EPIC, "DAY", prices, tz=ZoneInfo("Europe/London"))
+
+    assert list(aggregator.history(EPIC, "DAY")["close"]) == [9]
+    assert list(aggregator.bars([_update(0, 13.5, 14.5)])) == []
+    seeded = aggregator.current(EPIC, "DAY")
+    assert seeded is not None
+    assert (seeded.open, seeded.high, seeded.low, seeded.close, seeded.volume) == (9, 14, 8, 14, 1)
+
+    eleven_hours_later = 11 * 3600 + 1
+    (closed,) = _closed(aggregator, "DAY", eleven_hours_later)
+
+    assert closed == seeded
+    live = aggregator.current(EPIC, "DAY")
+    assert live is not None
+    assert live.start == datetime(2026, 8, 3, 21, 0, tzinfo=UTC)
+    assert list(aggregator.history(EPIC, "DAY")["start"]) == [
+        datetime(2026, 8, 1, 21, 0, tzinfo=UTC).timestamp(),
+        datetime(2026, 8, 2, 21, 0, tzinfo=UTC).timestamp(),
+    ]
+
+
+def test_typed_ticks_without_a_price_change_or_timestamp_use_the_arrival_time() -> None:
+    class Tick:
+        def __init__(self, values: dict[int, str]) -> None:
+            self.values = values
+
+        def getItemName(self) -> str:
+            return f"MARKET:{EPIC}"
+
+        def getItemPos(self) -> int:
+            return 1
+
+        def isSnapshot(self) -> bool:
+            return False
+
+        def getFieldsByPosition(self) -> dict[int, str]:
+            return self.values
+
+        def getChangedFieldsByPosition(self) -> dict[int, str]:
+            return self.values
+
+    layout = _TickLayout(("BID", "OFFER", "MARKET_STATE"), "decimal")
+    aggregator = BarAggregator(("SECOND",), price="offer")
+    at = datetime(2026, 8, 3, 10, 0, 0, 250_000, tzinfo=UTC)
+
+    assert aggregator.add(layout.decode(Tick({1: "1.5", 2: "1.7"}), "prices"), at=at) == []
+    assert aggregator.add(layout.decode(Tick({3: "EDIT"}), "prices"), at=at) == []
+    closed = aggregator.add(
+        layout.decode(Tick({2: "1.9"}), "prices"), at=at.replace(microsecond=0, second=1)
+    )
+
+    assert [(bar.epic, bar.start, bar.open, bar.volume) for bar in closed] == [
+        (EPIC, at.replace(microsecond=0), 1.7, 1)
+    ]
+
+
+def test_history_is_capped_and_month_and_week_bars_follow_the_calendar() -> None:
+    aggregator = BarAggregator(("MONTH", "WEEK", "SECOND"), history=2)
+    for second in range(6):
+        aggregator.add(_update(second, 1, 2))
+
+    assert list(aggregator.history(EPIC, "SECOND")["start"]) == [_BASE + 3, _BASE + 4]
+    month = aggregator.current(EPIC, "MONTH")
+    week = aggregator.current(EPIC, "WEEK")
+    assert month is not None and month.start == datetime(2026, 8, 1, tzinfo=UTC)
+    assert week is not None and week.start == datetime(2026, 8, 3, tzinfo=UTC)
+    assert aggregator.current("UNKNOWN", "MONTH") is None
+    assert list(aggregator.history("UNKNOWN", "MONTH")["open"]) == []
+
+    december = datetime(2026, 12, 31, 23, tzinfo=UTC).timestamp() - _BASE
+    (closed,) = _closed(aggregator, "MONTH", december)
+    assert closed.start == datetime(2026, 8, 1, tzinfo=UTC)
+    (closed,) = _closed(aggregator, "MONTH", december + 3600)
+    assert closed.start == datetime(2026, 12, 1, tzinfo=UTC)
+
+
+def test_async_streams_yield_closed_bars() -> None:
+    async def updates():
+        for seconds in (0, 30, 60):
+            yield _update(seconds, 1, 3)
+
+    async def collect() -> list[float]:
+        aggregator = BarAggregator(("MINUTE",))
+        return [bar.close async for bar in aggregator.abars(updates())]
+
+    assert asyncio.run(collect()) == [2]
+
+
+def test_invalid_configuration_is_rejected() -> None:
+    with pytest.raises(ValueError, match="at least one resolution"):
+        BarAggregator(())
+    with pytest.raises(ValueError, match="Unsupported bar price"):
+        BarAggregator(("MINUTE",), price="last")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="history"):
+        BarAggregator(("MINUTE",), history=0)
+    with pytest.raises(ValueError, match="not aggregated"):
+        BarAggregator(("MINUTE",)).seed(EPIC, "DAY", PricesResponse())
+    with pytest.raises(ValueError, match="could seed"):
+        BarAggregator(("DAY",)).seed(EPIC, "DAY", _list_points({"prices": [{"snapshotTime": ""}]}))
+    with pytest.raises(ValueError, match="time zone"):
+        BarAggregator(("DAY",)).seed(EPIC, "DAY", _list_points(_points(("2026/08/01", 1, 1, 1, 1))))
@@ -1,18 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
+from dataclasses import replace
+from decimal import Decimal
+
 import httpx
 import pytest
 
 from ig_trading_lib import (
     IG,
+    AmendPositionRequest,
     AsyncIG,
+    ClosePositionRequest,
     CreatePositionRequest,
     DealConfirmationError,
     Environment,
     IGConfig,
+    ProviderRejectionError,
     SessionCredentials,
     TransportError,
 )
+from ig_trading_lib.streaming import StreamUpdate
+from ig_trading_lib.workflows.dealing import (
+    PositionAmendment,
+    PositionWorkflow,
+    TradeConfirmations,
+    WorkingOrderCancellation,
+)
 
 
 def _config() -> IGConfig:
@@ -67,3 +83,157 @@ async def test_async_workflow_preserves_deal_reference_when_confirmation_fails()
 
     assert raised.value.deal_reference == "deal-reference"
     assert isinstance(raised.value.__cause__, TransportError)
+
+
+def _confirms(deal_reference: str) -> StreamUpdate:
+    confirms = json.dumps({"dealReference": deal_reference, "dealStatus": "ACCEPTED"})
+    return StreamUpdate(
+        subscription_key="confirms-ABC123",
+        item_name="TRADE:ABC123",
+        item_position=1,
+        fields={"CONFIRMS": confirms},
+        changed_fields={"CONFIRMS": confirms},
+        is_snapshot=False,
+    )
+
+
+def test_stream_confirmation_arriving_before_the_deal_response_skips_the_rest_read() -> None:
+    confirms = TradeConfirmations("ABC123", timeout=0.01)
+    confirms._on_event(_confirms("other-reference"))
+    confirms._on_event(_confirms("deal-reference"))
+
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(_handler))) as ig:
+        confirmation = ig.workflows.positions.open_and_confirm(_request(), stream=confirms)
+        assert (confirmation.deal_reference, confirmation.deal_status) == (
+            "deal-reference",
+            "ACCEPTED",
+        )
+        with pytest.raises(DealConfirmationError):
+            ig.workflows.positions.open_and_confirm(_request(), stream=confirms)
+
+    assert confirms.wait("other-reference") is not None
+
+
+def test_undecodable_stream_confirmations_are_dropped_for_the_rest_read() -> None:
+    confirms = TradeConfirmations("ABC123", timeout=0.01)
+    malformed = json.dumps({"dealReference": "deal-reference", "level": "not-a-number"})
+    for value in ("{not json", malformed, "[]"):
+        confirms._on_event(replace(_confirms("x"), changed_fields={"CONFIRMS": value}))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/confirms/deal-reference":
+            return httpx.Response(
+                200, json={"dealReference": "deal-reference", "dealStatus": "REJECTED"}
+            )
+        return _handler(request)
+
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        confirmation = ig.workflows.positions.open_and_confirm(_request(), stream=confirms)
+
+    assert confirmation.deal_status == "REJECTED"
+
+
+@pytest.mark.asyncio
+async def test_async_confirm_waits_on_the_stream_and_falls_back_to_rest_after_close() -> None:
+    confirms = TradeConfirmations("ABC123")
+    threading.Timer(0.05, confirms._on_event, (_confirms("deal-reference"),)).start()
+
+    async with AsyncIG(
+        _config(),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    ) as ig:
+        confirmation = await ig.workflows.positions.open_and_confirm(_request(), stream=confirms)
+        assert confirmation.deal_status == "ACCEPTED"
+
+        confirms.close()
+        with pytest.raises(DealConfirmationError):
+            await ig.workflows.positions.open_and_confirm(_request(), stream=confirms)
+
+
+def test_stream_confirmations_listens_to_the_account_trade_item_until_closed() -> None:
+    stopped: list[bool] = []
+
+    class Streaming:
+        def listen(self, subscription, on_event):
+            assert (subscription.items, subscription.fields) == (("TRADE:ABC123",), ("CONFIRMS",))
+            on_event(_confirms("deal-reference"))
+            return lambda: stopped.append(True)
+
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(_handler))) as ig:
+        workflow = PositionWorkflow(
+            ig.operations.positions, ig.operations.confirmations, Streaming()
+        )
+        confirms = workflow.stream_confirmations("ABC123")
+
+    confirms.close()
+    assert stopped == [True]
+    assert confirms.wait("deal-reference") is not None
+
+
+def _batch_handler(arrived: threading.Barrier, released: threading.Event):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        if request.url.path.startswith("/gateway/deal/confirms/"):
+            reference = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"dealReference": reference, "dealStatus": "ACCEPTED"})
+        arrived.wait()
+        body = json.loads(request.content)
+        if body.get("size") == 0.5:
+            return httpx.Response(400, json={"errorCode": "error.invalid.size"})
+        if request.url.path.endswith("/D2"):
+            raise RuntimeError("amendment handler failed")
+        released.wait(2.0)
+        return httpx.Response(200, json={"dealReference": f"ref-{body.get('dealId', 'new')}"})
+
+    return handler
+
+
+def test_batch_runs_deals_concurrently_and_reports_each_outcome_without_raising() -> None:
+    deals = [
+        ClosePositionRequest(direction="SELL", size=1, deal_id="D1"),
+        PositionAmendment("D2", AmendPositionRequest(limit_level=1.09)),
+        _request().model_copy(update={"size": Decimal("0.5")}),
+        _request(),
+    ]
+    released = threading.Event()
+    handler = _batch_handler(threading.Barrier(4, timeout=2.0), released)
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with IG(_config(), http_client=client) as ig:
+        outcomes = ig.workflows.positions.batch_and_confirm(deals)
+        failed = {outcome.index: outcome.error for outcome in (next(outcomes), next(outcomes))}
+        released.set()
+        confirmed = {outcome.index: outcome for outcome in outcomes}
+
+    assert isinstance(failed[2], ProviderRejectionError)
+    assert isinstance(failed[1], RuntimeError)
+    assert confirmed[0].confirmation.deal_reference == "ref-D1"
+    assert confirmed[3].deal is deals[3]
+    assert [outcome.error for outcome in confirmed.values()] == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_streams_outcomes_and_never_sends_deals_left_queued() -> None:
+    sent: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        if request.url.path.startswith("/gateway/deal/confirms/"):
+            return httpx.Response(200, json={"dealReference": "ref", "dealStatus": "ACCEPTED"})
+        sent.append(request.url.path)
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"dealReference": "ref"})
+
+    async with AsyncIG(
+        _config(), http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ) as ig:
+        workflow = replace(ig.workflows.working_orders, max_concurrency=1)
+        deals = [WorkingOrderCancellation(f"W{index}") for index in range(5)]
+        outcomes = workflow.batch_and_confirm(deals)
+        first = await anext(outcomes)
+        await outcomes.aclose()
+
+    assert (first.index, first.confirmation.deal_status) == (0, "ACCEPTED")
+    assert sent == ["/gateway/deal/working-orders/otc/W0", "/gateway/deal/working-orders/otc/W1"]
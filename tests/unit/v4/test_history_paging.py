@@ -1,16 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import math
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
 import httpx
+import pytest
 
-from ig_trading_lib import IG, Environment, IGConfig, SessionCredentials
+from ig_trading_lib import (
+    IG,
+    AsyncIG,
+    Environment,
+    IGConfig,
+    ResourceNotFoundError,
+    SessionCredentials,
+)
+from ig_trading_lib.candles import CandleStore
 from ig_trading_lib.operations.accounts import ActivityQuery, TransactionsQuery
-from ig_trading_lib.operations.markets import PricesQuery
+from ig_trading_lib.operations.markets import PriceColumnsResponse, PricePoint, PricesQuery
 
 
-def _config() -> IGConfig:
+def _config(candle_store_path: Path | None = None) -> IGConfig:
     return IGConfig(
         environment=Environment.DEMO,
         credentials=SessionCredentials("key", "identifier", "password"),
+        candle_store_path=candle_store_path,
     )
 
 
@@ -122,3 +139,407 @@ def test_price_page_controls_map_to_the_complete_v3_query() -> None:
         "pageSize": "25",
         "pageNumber": "2",
     }
+
+
+def test_price_columns_pack_history_into_typed_arrays() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(
+                200,
+                headers={"CST": "cst", "X-SECURITY-TOKEN": "security"},
+            )
+        return httpx.Response(
+            200,
+            json={
+                "instrumentType": "CURRENCIES",
+                "prices": [
+                    {
+                        "snapshotTimeUTC": "2026-08-01T00:00:00",
+                        "openPrice": {"bid": 1.1, "ask": 1.2},
+                        "closePrice": {"bid": 1.3, "ask": None},
+                        "lastTradedVolume": 7,
+                    },
+                    {"snapshotTimeUTC": "2026-08-01T01:00:00", "highPrice": {"bid": 1.4}},
+                ],
+            },
+        )
+
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        response = PriceColumnsResponse.from_prices(ig.operations.prices.list("CS.D.EURUSD.CFD.IP"))
+
+    assert len(response) == 2
+    assert response.instrument_type == "CURRENCIES"
+    assert response.timestamp.tolist() == [1785542400.0, 1785546000.0]
+    assert response.open_bid[0] == 1.1
+    assert math.isnan(response.close_ask[0])
+    assert math.isnan(response.open_bid[1])
+    assert response.high_bid[1] == 1.4
+    assert response.last_traded_volume[0] == 7.0
+    columns = response.columns()
+    assert columns["close_bid"].format == "d"
+    assert columns["close_bid"].tolist()[0] == 1.3
+
+
+def test_v2_price_columns_are_timed_only_in_an_explicit_time_zone() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(
+                200,
+                headers={"CST": "cst", "X-SECURITY-TOKEN": "security"},
+            )
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "prices": [
+                    {
+                        "snapshotTime": "2026/08/01 00:00:00",
+                        "closePrice": {"bid": 1.3, "ask": 1.4},
+                    },
+                    {"snapshotTime": "2026/08/01 01:00:00", "closePrice": {"bid": 1.5}},
+                ],
+            },
+        )
+
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        prices = ig.operations.prices.list_points("CS.D.EURUSD.CFD.IP", "HOUR", 2)
+
+    assert requests[0].url.path.endswith("/prices/CS.D.EURUSD.CFD.IP/HOUR/2")
+    untimed = PriceColumnsResponse.from_prices(prices)
+    assert all(math.isnan(timestamp) for timestamp in untimed.timestamp)
+    assert untimed.close_bid.tolist() == [1.3, 1.5]
+    # The v2 snapshotTime is the account's local time, one hour ahead of UTC in London here.
+    london = PriceColumnsResponse.from_prices(prices, tz=ZoneInfo("Europe/London"))
+    assert london.timestamp.tolist() == [1785538800.0, 1785542400.0]
+
+
+def _price_page(request: httpx.Request, *, remaining_allowance: int) -> httpx.Response:
+    page_number = int(request.url.params.get("pageNumber", "1"))
+    return httpx.Response(
+        200,
+        json={
+            "prices": [{"snapshotTimeUTC": f"2026-08-01T0{page_number}:00:00"}],
+            "metadata": {
+                "pageData": {"pageNumber": page_number, "pageSize": 10, "totalPages": 4},
+                "allowance": {
+                    "allowanceExpiry": 60,
+                    "remainingAllowance": remaining_allowance,
+                    "totalAllowance": 10_000,
+                },
+            },
+        },
+    )
+
+
+def test_price_pages_stream_in_order_and_merge() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(
+                200,
+                headers={"CST": "cst", "X-SECURITY-TOKEN": "security"},
+            )
+        requests.append(request)
+        return _price_page(request, remaining_allowance=1_000)
+
+    query = PricesQuery(resolution="MINUTE", page_size=10)
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        pages = list(ig.workflows.prices.iter_pages("CS.D.EURUSD.CFD.IP", query))
+        merged = ig.workflows.prices.fetch_all("CS.D.EURUSD.CFD.IP", query)
+
+    assert [page.metadata.page_data.page_number for page in pages] == [1, 2, 3, 4]
+    assert sorted(request.url.params.get("pageNumber") for request in requests[1:4]) == [
+        "2",
+        "3",
+        "4",
+    ]
+    assert [point.snapshot_time_utc for point in merged.prices] == [
+        "2026-08-01T01:00:00",
+        "2026-08-01T02:00:00",
+        "2026-08-01T03:00:00",
+        "2026-08-01T04:00:00",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_price_pages_in_flight_are_bounded_by_remaining_allowance() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(
+                200,
+                headers={"CST": "cst", "X-SECURITY-TOKEN": "security"},
+            )
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _price_page(request, remaining_allowance=25)
+
+    async with AsyncIG(
+        _config(),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    ) as ig:
+        merged = await ig.workflows.prices.fetch_all(
+            "CS.D.EURUSD.CFD.IP", PricesQuery(page_size=10)
+        )
+
+    assert len(merged.prices) == 4
+    assert peak == 2
+
+
+def test_date_range_is_sharded_by_resolution_and_merged_without_duplicates() -> None:
+    shards: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(
+                200,
+                headers={"CST": "cst", "X-SECURITY-TOKEN": "security"},
+            )
+        start, end = request.url.path.split("/")[-2:]
+        shards.append((start, end))
+        return httpx.Response(
+            200,
+            json={"prices": [{"snapshotTimeUTC": start}, {"snapshotTimeUTC": end}]},
+        )
+
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        merged = ig.workflows.prices.fetch_date_range(
+            "CS.D.EURUSD.CFD.IP", "MINUTE", "2026-08-01T00:00:00", "2026-08-03T12:00:00"
+        )
+
+    assert sorted(shards) == [
+        ("2026-08-01T00:00:00", "2026-08-02T00:00:00"),
+        ("2026-08-02T00:00:00", "2026-08-03T00:00:00"),
+        ("2026-08-03T00:00:00", "2026-08-03T12:00:00"),
+    ]
+    assert [point.snapshot_time_utc for point in merged.prices] == [
+        "2026-08-01T00:00:00",
+        "2026-08-02T00:00:00",
+        "2026-08-03T00:00:00",
+        "2026-08-03T12:00:00",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_date_range_rejects_an_inverted_window() -> None:
+    async with AsyncIG(
+        _config(),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda _: httpx.Response(500))),
+    ) as ig:
+        with pytest.raises(ValueError, match="end_date"):
+            await ig.workflows.prices.fetch_date_range(
+                "CS.D.EURUSD.CFD.IP", "HOUR", "2026-08-02T00:00:00", "2026-08-01T00:00:00"
+            )
+
+
+@pytest.mark.asyncio
+async def test_async_date_range_bounds_shards_in_flight_and_merges_without_duplicates() -> None:
+    shards: list[tuple[str, str]] = []
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(
+                200,
+                headers={"CST": "cst", "X-SECURITY-TOKEN": "security"},
+            )
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        start, end = request.url.path.split("/")[-2:]
+        shards.append((start, end))
+        return httpx.Response(
+            200,
+            json={"prices": [{"snapshotTimeUTC": start}, {"snapshotTimeUTC": end}]},
+        )
+
+    async with AsyncIG(
+        _config(), http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ) as ig:
+        workflow = replace(ig.workflows.prices, max_concurrency=2)
+        merged = await workflow.fetch_date_range(
+            "CS.D.EURUSD.CFD.IP", "MINUTE", "2026-08-01T00:00:00", "2026-08-04T12:00:00"
+        )
+
+    assert peak == 2
+    assert sorted(shards) == [
+        ("2026-08-01T00:00:00", "2026-08-02T00:00:00"),
+        ("2026-08-02T00:00:00", "2026-08-03T00:00:00"),
+        ("2026-08-03T00:00:00", "2026-08-04T00:00:00"),
+        ("2026-08-04T00:00:00", "2026-08-04T12:00:00"),
+    ]
+    assert [point.snapshot_time_utc for point in merged.prices] == [
+        "2026-08-01T00:00:00",
+        "2026-08-02T00:00:00",
+        "2026-08-03T00:00:00",
+        "2026-08-04T00:00:00",
+        "2026-08-04T12:00:00",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_date_range_cancels_the_other_shards_on_the_first_failure() -> None:
+    finished: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(
+                200,
+                headers={"CST": "cst", "X-SECURITY-TOKEN": "security"},
+            )
+        start = request.url.path.split("/")[-2]
+        if start == "2026-08-01T00:00:00":
+            return httpx.Response(404, json={"errorCode": "error.not-found"})
+        await asyncio.sleep(0.05)
+        finished.append(start)
+        return httpx.Response(200, json={"prices": []})
+
+    async with AsyncIG(
+        _config(), http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ) as ig:
+        workflow = replace(ig.workflows.prices, max_concurrency=2)
+        with pytest.raises(ResourceNotFoundError):
+            await workflow.fetch_date_range(
+                "CS.D.EURUSD.CFD.IP", "MINUTE", "2026-08-01T00:00:00", "2026-08-04T12:00:00"
+            )
+        await asyncio.sleep(0.1)
+
+    assert finished == []
+
+
+@pytest.mark.asyncio
+async def test_async_candle_store_fetches_only_ranges_missing_from_disk(tmp_path: Path) -> None:
+    shards: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(
+                200,
+                headers={"CST": "cst", "X-SECURITY-TOKEN": "security"},
+            )
+        start, end = request.url.path.split("/")[-2:]
+        shards.append((start, end))
+        return httpx.Response(
+            200,
+            json={
+                "prices": [
+                    {"snapshotTime": start.replace("-", "/").replace("T", " ")},
+                    {"snapshotTime": end.replace("-", "/").replace("T", " ")},
+                ]
+            },
+        )
+
+    path = tmp_path / "candles.sqlite3"
+    transport = httpx.MockTransport(handler)
+    async with AsyncIG(_config(path), http_client=httpx.AsyncClient(transport=transport)) as ig:
+        await ig.workflows.prices.fetch_date_range(
+            "CS.D.EURUSD.CFD.IP", "HOUR", "2026-01-01T00:00:00", "2026-01-02T00:00:00"
+        )
+    async with AsyncIG(_config(path), http_client=httpx.AsyncClient(transport=transport)) as ig:
+        merged = await ig.workflows.prices.fetch_date_range(
+            "CS.D.EURUSD.CFD.IP", "HOUR", "2026-01-01T12:00:00", "2026-01-03T00:00:00"
+        )
+
+    assert shards == [
+        ("2026-01-01T00:00:00", "2026-01-02T00:00:00"),
+        ("2026-01-02T00:00:00", "2026-01-03T00:00:00"),
+    ]
+    assert [point.snapshot_time for point in merged.prices] == [
+        "2026/01/02 00:00:00",
+        "2026/01/03 00:00:00",
+    ]
+
+
+def test_candle_store_fetches_only_ranges_missing_from_disk(tmp_path: Path) -> None:
+    shards: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(
+                200,
+                headers={"CST": "cst", "X-SECURITY-TOKEN": "security"},
+            )
+        start, end = request.url.path.split("/")[-2:]
+        shards.append((start, end))
+        return httpx.Response(
+            200,
+            json={
+                "prices": [
+                    {"snapshotTime": start.replace("-", "/").replace("T", " ")},
+                    {"snapshotTime": end.replace("-", "/").replace("T", " ")},
+                ]
+            },
+        )
+
+    path = tmp_path / "candles.sqlite3"
+    transport = httpx.MockTransport(handler)
+    with IG(_config(path), http_client=httpx.Client(transport=transport)) as ig:
+        ig.workflows.prices.fetch_date_range(
+            "CS.D.EURUSD.CFD.IP", "HOUR", "2026-01-01T00:00:00", "2026-01-02T00:00:00"
+        )
+    with IG(_config(path), http_client=httpx.Client(transport=transport)) as ig:
+        merged = ig.workflows.prices.fetch_date_range(
+            "CS.D.EURUSD.CFD.IP", "HOUR", "2026-01-01T12:00:00", "2026-01-03T00:00:00"
+        )
+
+    assert shards == [
+        ("2026-01-01T00:00:00", "2026-01-02T00:00:00"),
+        ("2026-01-02T00:00:00", "2026-01-03T00:00:00"),
+    ]
+    assert [point.snapshot_time for point in merged.prices] == [
+        "2026/01/02 00:00:00",
+        "2026/01/03 00:00:00",
+    ]
+
+
+def test_candle_store_merges_coverage_and_never_covers_the_future(tmp_path: Path) -> None:
+    store = CandleStore(tmp_path / "candles.sqlite3")
+    try:
+        store.write("EPIC", "DAY", datetime(2026, 1, 1), datetime(2026, 1, 5), ())
+        store.write("EPIC", "DAY", datetime(2026, 1, 5), datetime(2026, 1, 9), ())
+        store.write("EPIC", "DAY", datetime(2026, 2, 1), datetime(9999, 1, 1), ())
+
+        assert store.missing("EPIC", "DAY", datetime(2025, 12, 30), datetime(2026, 1, 20)) == [
+            (datetime(2025, 12, 30), datetime(2026, 1, 1)),
+            (datetime(2026, 1, 9), datetime(2026, 1, 20)),
+        ]
+        assert store.missing("EPIC", "DAY", datetime(9998, 1, 1), datetime(9998, 1, 2)) == [
+            (datetime(9998, 1, 1), datetime(9998, 1, 2))
+        ]
+        assert store.missing("OTHER", "DAY", datetime(2026, 1, 2), datetime(2026, 1, 3)) == [
+            (datetime(2026, 1, 2), datetime(2026, 1, 3))
+        ]
+    finally:
+        store.close()
+
+
+def test_candle_store_keeps_the_bar_still_forming_missing(tmp_path: Path) -> None:
+    now = datetime.now(UTC).replace(tzinfo=None)
+    forming = now.replace(minute=0, second=0, microsecond=0)
+    closed = forming - timedelta(hours=1)
+    points = [
+        PricePoint(snapshot_time_utc=bar.isoformat(), last_traded_volume=3)
+        for bar in (closed, forming)
+    ]
+    store = CandleStore(tmp_path / "candles.sqlite3")
+    try:
+        store.write("EPIC", "HOUR", closed, now + timedelta(hours=1), points)
+
+        assert [point.snapshot_time_utc for point in store.read("EPIC", "HOUR", closed, now)] == [
+            closed.isoformat()
+        ]
+        ((gap_start, gap_end),) = store.missing("EPIC", "HOUR", closed, now)
+        assert gap_start <= forming and gap_end == now
+    finally:
+        store.close()
@@ -1,4 +1,5 @@
 import inspect
+from decimal import Decimal
 
 import httpx
 import pytest
@@ -6,6 +7,8 @@ import pytest
 from ig_trading_lib import (
     IG,
     AsyncIG,
+    CreatePositionRequest,
+    CreateWorkingOrderRequest,
     Environment,
     IGConfig,
     MarketGetResponse,
@@ -91,7 +94,15 @@ def test_sync_and_async_roots_share_the_same_safety_bearing_constructor_shape()
     sync_parameters = inspect.signature(IG).parameters
     async_parameters = inspect.signature(AsyncIG).parameters
 
-    assert tuple(sync_parameters) == ("config", "trading_permit", "http_client")
+    assert tuple(sync_parameters) == (
+        "config",
+        "trading_permit",
+        "http_client",
+        "rate_limiter",
+        "response_cache",
+        "metrics",
+        "hooks",
+    )
     assert tuple(async_parameters) == tuple(sync_parameters)
     assert sync_parameters["trading_permit"].default is None
     assert async_parameters["trading_permit"].default is None
@@ -196,6 +207,183 @@ async def test_async_market_interface_matches_sync_with_awaiting_as_the_only_dif
     ]
 
 
+def test_list_many_chunks_concurrently_keeps_input_order_and_reports_missing_epics() -> None:
+    filters: set[str] = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return _session_response()
+        filters.add(request.url.params["filter"])
+        epics = request.url.params["epics"].split(",")
+        returned = [_market_details(epic) for epic in reversed(epics) if not epic.endswith("7")]
+        return httpx.Response(200, json={"marketDetails": returned})
+
+    epics = tuple(f"EPIC.{number}" for number in range(130))
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        batch = ig.workflows.discovery.list_many(epics)
+
+    assert filters == {"SNAPSHOT_ONLY"}
+    assert [market.instrument.epic for market in batch.market_details] == [
+        epic for epic in epics if not epic.endswith("7")
+    ]
+    assert batch.missing_epics == tuple(epic for epic in epics if epic.endswith("7"))
+
+
+@pytest.mark.asyncio
+async def test_async_list_many_matches_sync_and_rejects_an_empty_universe() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return _session_response()
+        epics = request.url.params["epics"].split(",")
+        return httpx.Response(200, json={"marketDetails": [_market_details(e) for e in epics]})
+
+    async with AsyncIG(
+        _config(), http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ) as ig:
+        batch = await ig.workflows.discovery.list_many(("B", "A", "B"), filter="ALL")
+        with pytest.raises(ValueError, match="at least one"):
+            await ig.workflows.discovery.list_many(())
+
+    assert [market.instrument.epic for market in batch.market_details] == ["B", "A"]
+    assert batch.missing_epics == ()
+
+
+def test_instrument_index_loads_in_chunks_of_fifty_and_validates_orders_locally() -> None:
+    requested_epics: list[list[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return _session_response()
+        epics = request.url.params["epics"].split(",")
+        requested_epics.append(epics)
+        return httpx.Response(
+            200, json={"marketDetails": [_market_details(epic) for epic in epics[:-1]]}
+        )
+
+    epics = tuple(f"CS.D.M{number:03}.CFD.IP" for number in range(120))
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        index = ig.workflows.instruments.load_index(epics + epics[:5])
+
+    assert sorted(len(chunk) for chunk in requested_epics) == [20, 50, 50]
+    assert len(index) == 117
+    assert epics[49] not in index
+    assert index.min_deal_size(epics[0]) == Decimal("0.5")
+    assert index.lot_size(epics[0]) == Decimal("1")
+    assert index.min_stop_distance(epics[0]).value == Decimal("4")
+    assert index.min_stop_distance(epics[0], guaranteed=True).value == Decimal("10")
+
+    index.check_order(
+        CreatePositionRequest(
+            epic=epics[0],
+            direction="BUY",
+            size="1",
+            order_type="MARKET",
+            currency_code="GBP",
+            stop_distance="5",
+        )
+    )
+    with pytest.raises(ValueError, match="size 0.1 is below the minimum 0.5; stop_distance 2"):
+        index.check_order(
+            CreatePositionRequest(
+                epic=epics[0],
+                direction="BUY",
+                size="0.1",
+                order_type="MARKET",
+                currency_code="GBP",
+                stop_distance="2",
+            )
+        )
+    with pytest.raises(ValueError, match="limit_distance 9000 is above the maximum 7500"):
+        index.check_order(
+            CreateWorkingOrderRequest(
+                epic=epics[0],
+                direction="BUY",
+                size="1",
+                level="1.0000",
+                order_type="LIMIT",
+                currency_code="GBP",
+                limit_distance="9000",
+            )
+        )
+    with pytest.raises(KeyError, match="not in the instrument index"):
+        index.min_deal_size(epics[49])
+
+
+def test_percentage_distance_rules_are_checked_in_points_of_the_quoted_level() -> None:
+    def market(epic: str, bid: float, offer: float, scaling_factor: int) -> dict[str, object]:
+        return {
+            "instrument": {"epic": epic},
+            "snapshot": {"bid": bid, "offer": offer, "scalingFactor": scaling_factor},
+            "dealingRules": {"minNormalStopOrLimitDistance": {"unit": "PERCENTAGE", "value": 0.5}},
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return _session_response()
+        return httpx.Response(
+            200,
+            json={
+                "marketDetails": [
+                    # FX quotes in price: 0.5% of 1.0811 is 0.0054055, or 54.055 points.
+                    market("CS.D.EURUSD.CFD.IP", 1.0810, 1.0812, 10000),
+                    # Indices quote in points: 0.5% of 8000 is 40 points.
+                    market("IX.D.FTSE.DAILY.IP", 7999, 8001, 1),
+                ]
+            },
+        )
+
+    def order(epic: str, stop_distance: str) -> CreatePositionRequest:
+        return CreatePositionRequest(
+            epic=epic,
+            direction="BUY",
+            size="1",
+            order_type="MARKET",
+            currency_code="GBP",
+            stop_distance=stop_distance,
+        )
+
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        index = ig.workflows.instruments.load_index(("CS.D.EURUSD.CFD.IP", "IX.D.FTSE.DAILY.IP"))
+
+    index.check_order(order("CS.D.EURUSD.CFD.IP", "55"))
+    index.check_order(order("IX.D.FTSE.DAILY.IP", "40"))
+    with pytest.raises(ValueError, match="stop_distance 54 is below the minimum 54.055"):
+        index.check_order(order("CS.D.EURUSD.CFD.IP", "54"))
+    with pytest.raises(ValueError, match="stop_distance 39 is below the minimum 40"):
+        index.check_order(order("IX.D.FTSE.DAILY.IP", "39"))
+
+
+@pytest.mark.asyncio
+async def test_async_instrument_index_refreshes_from_its_own_epics() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return _session_response()
+        epics = request.url.params["epics"].split(",")
+        return httpx.Response(200, json={"marketDetails": [_market_details(e) for e in epics]})
+
+    async with AsyncIG(
+        _config(), http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ) as ig:
+        index = await ig.workflows.instruments.load_index(("A.EPIC", "B.EPIC"))
+        refreshed = await ig.workflows.instruments.load_index(index.epics)
+
+    assert refreshed.epics == ("A.EPIC", "B.EPIC")
+    assert refreshed.rules("B.EPIC").reference_level == Decimal("1.0001")
+
+
+def _market_details(epic: str) -> dict[str, object]:
+    return {
+        "instrument": {"epic": epic, "lotSize": 1},
+        "snapshot": {"bid": 1.0000, "offer": 1.0002, "scalingFactor": 10000},
+        "dealingRules": {
+            "minDealSize": {"unit": "POINTS", "value": 0.5},
+            "minNormalStopOrLimitDistance": {"unit": "POINTS", "value": 4},
+            "minControlledRiskStopDistance": {"unit": "POINTS", "value": 10},
+            "maxStopOrLimitDistance": {"unit": "PERCENTAGE", "value": 75},
+        },
+    }
+
+
 def _session_response() -> httpx.Response:
     return httpx.Response(
         200,
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from decimal import Decimal
+from typing import Any
+
+import httpx
+import pytest
+
+from ig_trading_lib import (
+    IG,
+    AsyncIG,
+    Environment,
+    IGConfig,
+    ResourceNotFoundError,
+    SessionCredentials,
+    StreamingDataLossError,
+)
+from ig_trading_lib.core import StreamingSession
+from ig_trading_lib.operations.streaming import AsyncStreamingOperations, StreamingOperations
+from ig_trading_lib.streaming import AsyncStreamingClient, StreamingClient
+from ig_trading_lib.workflows.portfolio import AsyncPortfolioWorkflow, PortfolioWorkflow
+
+_BODIES = {
+    "/gateway/deal/accounts": {"accounts": []},
+    "/gateway/deal/positions": {"positions": []},
+    "/gateway/deal/working-orders": {"workingOrders": []},
+}
+
+
+def _config() -> IGConfig:
+    return IGConfig(
+        environment=Environment.DEMO,
+        credentials=SessionCredentials("api-key", "identifier", "password"),
+    )
+
+
+def test_sync_snapshot_issues_the_three_reads_concurrently_on_reused_threads() -> None:
+    arrived = threading.Barrier(3, timeout=2.0)
+    readers: set[threading.Thread] = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        arrived.wait()
+        readers.add(threading.current_thread())
+        return httpx.Response(200, json=_BODIES[request.url.path])
+
+    with IG(_config(), http_client=httpx.Client(transport=httpx.MockTransport(handler))) as ig:
+        snapshot = ig.workflows.portfolio.snapshot()
+        ig.workflows.portfolio.snapshot()
+
+    assert snapshot.positions.positions == ()
+    assert snapshot.working_orders.working_orders == ()
+    assert len(readers) == 3
+    assert not any(reader.is_alive() for reader in readers)
+
+
+@pytest.mark.asyncio
+async def test_async_snapshot_waits_for_every_read_and_raises_the_earliest_failure() -> None:
+    finished: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        if request.url.path == "/gateway/deal/accounts":
+            await asyncio.sleep(0.02)
+        finished.append(request.url.path)
+        if request.url.path == "/gateway/deal/accounts":
+            return httpx.Response(200, json=_BODIES[request.url.path])
+        return httpx.Response(404, json={"errorCode": request.url.path.rsplit("/", 1)[-1]})
+
+    async with AsyncIG(
+        _config(), http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ) as ig:
+        with pytest.raises(ResourceNotFoundError) as raised:
+            await ig.workflows.portfolio.snapshot()
+
+    assert finished[-1] == "/gateway/deal/accounts"
+    assert raised.value.error_code == "positions"
+
+
+class _Update:
+    def __init__(self, item: str, fields: dict[str, str | None]) -> None:
+        self._item = item
+        self._fields = fields
+
+    def getItemName(self) -> str:
+        return self._item
+
+    def getItemPos(self) -> int:
+        return 1
+
+    def isSnapshot(self) -> bool:
+        return False
+
+    def getFields(self) -> dict[str, str | None]:
+        return self._fields
+
+    def getChangedFields(self) -> dict[str, str | None]:
+        return self._fields
+
+
+class _Subscription:
+    def __init__(self, mode: str, items: list[str], fields: list[str]) -> None:
+        self.items = items
+        self.listener: Any = None
+
+    def addListener(self, listener: Any) -> None:
+        self.listener = listener
+
+    def setRequestedSnapshot(self, value: bool) -> None:
+        pass
+
+
+class _Details:
+    def setUser(self, value: str) -> None:
+        pass
+
+    def setPassword(self, value: str) -> None:
+        pass
+
+
+class _Lightstreamer:
+    def __init__(self) -> None:
+        self.connectionDetails = _Details()
+        self.listeners: dict[str, Any] = {}
+        self.unsubscribed: list[str] = []
+
+    def connect(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+    def subscribe(self, subscription: _Subscription) -> None:
+        item = subscription.items[0]
+        self.listeners[item] = subscription.listener
+        if item.startswith("TRADE:"):
+            self.emit(item, OPU=json.dumps({"dealId": "D2", "status": "OPEN", "size": 2}))
+
+    def unsubscribe(self, subscription: _Subscription) -> None:
+        self.unsubscribed.append(subscription.items[0])
+
+    def emit(self, item: str, **fields: str | None) -> None:
+        self.listeners[item].onItemUpdate(_Update(item, fields))
+
+
+def _session() -> StreamingSession:
+    return StreamingSession(
+        endpoint="https://stream.example.test", account_id="ABC123", cst="c", security_token="x"
+    )
+
+
+def _rest_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/gateway/deal/session":
+        return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+    if request.url.path == "/gateway/deal/accounts":
+        return httpx.Response(
+            200, json={"accounts": [{"accountId": "ABC123", "balance": {"balance": 1000}}]}
+        )
+    if request.url.path == "/gateway/deal/positions":
+        position = {"dealId": "D1", "direction": "BUY", "size": 1, "level": 1.08}
+        market = {"epic": "CS.D.EURUSD.CFD.IP"}
+        return httpx.Response(200, json={"positions": [{"position": position, "market": market}]})
+    return httpx.Response(200, json=_BODIES[request.url.path])
+
+
+def test_live_portfolio_replays_early_updates_and_applies_stream_changes_copy_on_write() -> None:
+    lightstreamer = _Lightstreamer()
+    streaming = StreamingOperations(
+        StreamingClient(
+            session_provider=_session,
+            client_factory=lambda _, __: lightstreamer,
+            subscription_factory=_Subscription,
+        )
+    )
+
+    with IG(
+        _config(), http_client=httpx.Client(transport=httpx.MockTransport(_rest_handler))
+    ) as ig:
+        workflow = PortfolioWorkflow(
+            ig.operations.accounts, ig.operations.positions, ig.operations.working_orders, streaming
+        )
+        portfolio = workflow.live("ABC123")
+
+    seeded = portfolio.state
+    assert seeded.version == 2
+    assert seeded.positions["D1"].epic == "CS.D.EURUSD.CFD.IP"
+    assert seeded.positions["D2"].size == Decimal("2")
+
+    lightstreamer.emit(
+        "TRADE:ABC123",
+        OPU=json.dumps({"dealId": "D1", "status": "UPDATED", "stopLevel": 1.07}),
+    )
+    lightstreamer.emit(
+        "TRADE:ABC123",
+        WOU=json.dumps({"dealId": "W1", "epic": "IX.D.FTSE", "status": "OPEN", "size": 3}),
+    )
+    lightstreamer.emit("TRADE:ABC123", CONFIRMS=json.dumps({"dealReference": "R"}))
+    lightstreamer.emit("ACCOUNT:ABC123", PNL="12.5", FUNDS="1012.5", EQUITY=None)
+    lightstreamer.emit(
+        "TRADE:ABC123", OPU=json.dumps({"dealId": "D2", "status": "DELETED", "size": 0})
+    )
+
+    state = portfolio.state
+    assert state.version == 6
+    assert set(state.positions) == {"D1"}
+    assert (state.positions["D1"].level, state.positions["D1"].stop_level) == (
+        Decimal("1.08"),
+        Decimal("1.07"),
+    )
+    assert state.working_orders["W1"].order_size == Decimal("3")
+    assert (state.balance.profit_loss, state.balance.balance) == (
+        Decimal("12.5"),
+        Decimal("1012.5"),
+    )
+    assert set(seeded.positions) == {"D1", "D2"}
+
+    lightstreamer.listeners["TRADE:ABC123"].onItemLostUpdates("TRADE:ABC123", 1, 3)
+    with pytest.raises(StreamingDataLossError):
+        _ = portfolio.version
+    portfolio.close()
+    assert sorted(lightstreamer.unsubscribed) == ["ACCOUNT:ABC123", "TRADE:ABC123"]
+
+
+def test_live_portfolio_fails_instead_of_drifting_on_a_malformed_trade_update() -> None:
+    lightstreamer = _Lightstreamer()
+    streaming = StreamingOperations(
+        StreamingClient(
+            session_provider=_session,
+            client_factory=lambda _, __: lightstreamer,
+            subscription_factory=_Subscription,
+        )
+    )
+
+    with IG(
+        _config(), http_client=httpx.Client(transport=httpx.MockTransport(_rest_handler))
+    ) as ig:
+        workflow = PortfolioWorkflow(
+            ig.operations.accounts, ig.operations.positions, ig.operations.working_orders, streaming
+        )
+        portfolio = workflow.live("ABC123")
+
+    lightstreamer.emit("TRADE:ABC123", OPU="{not json")
+
+    with pytest.raises(StreamingDataLossError, match="TRADE:ABC123") as raised:
+        _ = portfolio.state
+    assert isinstance(raised.value.__cause__, json.JSONDecodeError)
+    portfolio.close()
+
+
+@pytest.mark.asyncio
+async def test_async_live_portfolio_listens_through_the_async_streaming_client() -> None:
+    lightstreamer = _Lightstreamer()
+
+    async def session() -> StreamingSession:
+        return _session()
+
+    streaming = AsyncStreamingOperations(
+        AsyncStreamingClient(
+            session_provider=session,
+            refresh_session_provider=session,
+            client_factory=lambda _, __: lightstreamer,
+            subscription_factory=_Subscription,
+        )
+    )
+    async with AsyncIG(
+        _config(), http_client=httpx.AsyncClient(transport=httpx.MockTransport(_rest_handler))
+    ) as ig:
+        workflow = AsyncPortfolioWorkflow(
+            ig.operations.accounts, ig.operations.positions, ig.operations.working_orders, streaming
+        )
+        portfolio = await workflow.live("ABC123")
+
+    assert set(portfolio.state.positions) == {"D1", "D2"}
+    portfolio.close()
+    assert sorted(lightstreamer.unsubscribed) == ["ACCOUNT:ABC123", "TRADE:ABC123"]
@@ -1,8 +1,9 @@
 from decimal import Decimal
 
 import httpx
+import pytest
 
-from ig_trading_lib import IG, Environment, IGConfig, SessionCredentials
+from ig_trading_lib import IG, Environment, IGConfig, SessionCredentials, models
 from ig_trading_lib.operations.accounts import (
     Activity,
     ActivityAction,
@@ -475,3 +476,44 @@ def test_market_details_type_every_documented_v4_response_field() -> None:
     assert response.snapshot.update_timestamp_utc == 1786276800000
     assert response.snapshot.price_ladder[0].bid == Decimal("1.08")
     assert response.snapshot.currency_ladders[0].ask_sizes == (Decimal("3"), Decimal("4"))
+
+
+def test_executor_normalizes_each_wire_key_exactly_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    converted: list[str] = []
+    original = models.to_snake_case
+
+    def counting_to_snake_case(value: str) -> str:
+        converted.append(value)
+        return original(value)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/gateway/deal/session":
+            return httpx.Response(200, headers={"CST": "cst", "X-SECURITY-TOKEN": "security"})
+        return httpx.Response(
+            200,
+            json={
+                "positions": [
+                    {
+                        "position": {"dealId": "position-id", "size": 1},
+                        "market": {"epic": "CS.D.EURUSD.CFD.IP", "lotSize": 1},
+                    }
+                ]
+            },
+        )
+
+    monkeypatch.setattr(models, "to_snake_case", counting_to_snake_case)
+    with IG(
+        IGConfig(
+            environment=Environment.DEMO,
+            credentials=SessionCredentials("key", "identifier", "password"),
+        ),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    ) as ig:
+        response = ig.operations.positions.list()
+
+    assert response.positions[0].market.lot_size == Decimal("1")
+    assert sorted(converted) == sorted(
+        ["positions", "position", "dealId", "size", "market", "epic", "lotSize"]
+    )
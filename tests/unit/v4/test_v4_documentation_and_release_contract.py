@@ -125,8 +125,10 @@ def test_library_reference_hierarchy_matches_the_public_mental_model() -> None:
     assert {path.stem for path in (reference / "workflows").glob("*.md")} == {
         "discovery",
         "index",
+        "instruments",
         "portfolio",
         "positions",
+        "prices",
         "working_orders",
     }
 
@@ -176,7 +178,7 @@ def test_every_operation_and_workflow_has_complete_generated_documentation() ->
     )
     expected_methods = _public_methods(public_contract)
 
-    assert len(expected_methods) == 59
+    assert len(expected_methods) == 73
     assert set(method_contract["methods"]) == set(expected_methods)
     for method_id, method in expected_methods.items():
         documented = method_contract["methods"][method_id]
@@ -223,8 +225,8 @@ def test_every_generated_method_example_is_valid_python_and_json() -> None:
     python_examples = re.findall(r"```python\n(.*?)\n```", "\n".join(pages), re.DOTALL)
     response_examples = re.findall(r"```json\n(.*?)\n```", "\n".join(pages), re.DOTALL)
 
-    assert len(python_examples) == 59 * 2
-    assert len(response_examples) == 59
+    assert len(python_examples) == 73 * 2
+    assert len(response_examples) == 73
     for example in python_examples:
         ast.parse(example)
     for example in response_examples: